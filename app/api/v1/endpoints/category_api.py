@@ -1,7 +1,10 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
+from app.core.json_response import model_response
+from app.infrastructure.cache import response_cache
 from app.infrastructure.database import get_db
+from app.infrastructure.hooks import ContentChangeHandler
 from app.domain.schemas.category_schema import CategoryCreate, CategoryUpdate, CategoryResponse
 from app.application.services.category_service import CategoryService
 from app.infrastructure.repositories.category_repository import CategoryRepository
@@ -15,7 +18,7 @@ def get_category_service(db: Session = Depends(get_db)) -> CategoryService:
     Tuân thủ Dependency Inversion Principle
     """
     category_repo = CategoryRepository(db)
-    return CategoryService(category_repo)
+    return CategoryService(category_repo, ContentChangeHandler(db))
 
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 def create_category(
@@ -29,7 +32,9 @@ def create_category(
     - **slug**: Slug chuẩn hóa (VD: khai-niem, tinh-chat, bai-tap...)
     """
     try:
-        return service.create_category(category_in)
+        return model_response(
+            CategoryResponse, service.create_category(category_in), status_code=status.HTTP_201_CREATED
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -42,17 +47,25 @@ def create_category(
 @router.get("/{category_id}/", response_model=CategoryResponse, include_in_schema=False)
 def get_category(
     category_id: int, 
+    request: Request,
     service: CategoryService = Depends(get_category_service)
 ):
     """Lấy thông tin chi tiết một category"""
     try:
+        cache_key = f"category_detail:{category_id}"
+        cached = response_cache.get(cache_key, request)
+        if cached is not None:
+            return cached
+
         category = service.get_category_by_id(category_id)
         if not category:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, 
                 detail=f"Category với ID {category_id} không tồn tại"
             )
-        return category
+        return response_cache.store(
+            cache_key, CategoryResponse, category, [f"category:{category_id}"], request
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -63,13 +76,34 @@ def get_category(
 
 @router.get("/", response_model=List[CategoryResponse])
 def get_categories(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None),
     service: CategoryService = Depends(get_category_service)
 ):
-    """Lấy danh sách categories với phân trang"""
+    """
+    Lấy danh sách categories với phân trang
+    
+    - **cursor**: Cursor từ header X-Next-Cursor của trang trước (để trống cho trang đầu); khi có cursor thì bỏ qua skip
+    """
     try:
-        return service.get_all_categories(skip=skip, limit=limit)
+        if cursor is not None:
+            categories, next_cursor = service.get_categories_page(cursor, limit)
+            headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+            return model_response(List[CategoryResponse], categories, headers=headers)
+
+        cache_key = f"category_list:{skip}:{limit}"
+        cached = response_cache.get(cache_key, request)
+        if cached is not None:
+            return cached
+
+        categories = service.get_all_categories(skip=skip, limit=limit)
+        return response_cache.store(
+            cache_key, List[CategoryResponse], categories, ["categories"], request
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -91,7 +125,7 @@ def update_category(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Category với ID {category_id} không tồn tại"
             )
-        return category
+        return model_response(CategoryResponse, category)
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+
+from app.application.services.search_result_cache import search_result_cache
+from app.infrastructure.jobs import related_topics_executor
+
+router = APIRouter()
+
+
+@router.get("/")
+@router.get("", include_in_schema=False)
+def get_metrics():
+    """
+    Các chỉ số runtime của process hiện tại.
+
+    - **related_topics_executor**: concurrency limit, queue depth hiện tại/cao nhất,
+      số request đang chạy, hoàn thành, lỗi, bị từ chối (503) và process pool TF-IDF
+    - **search_cache**: kích thước, số hit/miss và hit ratio của cache kết quả search
+    """
+    return {
+        "related_topics_executor": related_topics_executor.metrics(),
+        "search_cache": search_result_cache.metrics(),
+    }
@@ -1,25 +1,45 @@
+import json
+from typing import AsyncIterator, List, Literal, Optional
+
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.application.services.search_service import SearchService
-from app.domain.schemas.search_schema import SearchResponse
+from app.application.services.search_service import AsyncSearchService, SearchService
+from app.core.json_response import model_response
+from app.domain.schemas.search_schema import SearchResponse, SuggestResponse
 from app.infrastructure.database import get_db
+from app.infrastructure.repositories.category_repository import CategoryRepository
+from app.infrastructure.repositories.section_repository import SectionRepository
+from app.infrastructure.repositories.topic_repository import TopicRepository
+from app.infrastructure.search import build_search_index
 
 router = APIRouter()
 
 
-def get_search_service(db: Session = Depends(get_db)) -> SearchService:
-    """Dependency injection cho SearchService"""
-    return SearchService(db)
+def build_search_service(db: Session) -> SearchService:
+    """Tạo SearchService với các repositories và search index (SEARCH_BACKEND) trên sync Session"""
+    return SearchService(
+        db,
+        TopicRepository(db),
+        SectionRepository(db),
+        CategoryRepository(db),
+        build_search_index(db),
+    )
+
+
+def get_search_service(db: Session = Depends(get_db)) -> AsyncSearchService:
+    """Dependency injection cho SearchService (chạy trong threadpool trên sync Session)"""
+    return AsyncSearchService(build_search_service(db))
 
 
 @router.get("/", response_model=SearchResponse)
 @router.get("", response_model=SearchResponse, include_in_schema=False)
-def search(
+async def search(
     q: str = Query(..., min_length=1, description="Từ khóa tìm kiếm"),
     limit: int = Query(20, ge=1, le=50, description="Số lượng kết quả tối đa cho mỗi loại"),
     tags: str = Query(None, description="Danh sách tag IDs ngăn cách bởi dấu phẩy (VD: '1,2,3')"),
-    service: SearchService = Depends(get_search_service),
+    service: AsyncSearchService = Depends(get_search_service),
 ):
     """
     Tìm kiếm topics, sections, categories với fuzzy matching.
@@ -46,15 +66,89 @@ def search(
     Returns:
         SearchResponse chứa topics, sections, categories phù hợp
     """
-    # Parse tag IDs
-    tag_ids = None
-    if tags:
-        try:
-            tag_ids = [int(tid.strip()) for tid in tags.split(',') if tid.strip()]
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="Tag IDs phải là số nguyên, ngăn cách bởi dấu phẩy"
-            )
-    
-    return service.search(query=q, limit=limit, tag_ids=tag_ids)
+    tag_ids = parse_tag_ids(tags)
+    return model_response(SearchResponse, await service.search(query=q, limit=limit, tag_ids=tag_ids))
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest(
+    q: str = Query(..., min_length=1, description="Prefix người dùng đang gõ"),
+    limit: int = Query(10, ge=1, le=20, description="Số gợi ý tối đa"),
+    service: AsyncSearchService = Depends(get_search_service),
+):
+    """
+    Gợi ý search-as-you-type theo prefix (bỏ qua dấu tiếng Việt) trên topic titles,
+    category names và tag names.
+
+    Bản ghi có tên bắt đầu bằng prefix đứng trước, sau đó là bản ghi có một từ
+    bắt đầu bằng prefix (VD: "thua" → "Kế thừa"). Phục vụ từ index in-memory;
+    database chỉ được query (trong worker thread) khi index chưa build, tức lần
+    gọi đầu tiên hoặc sau khi index bị invalidate (VD: bulk import topics).
+    """
+    return model_response(SuggestResponse, await service.suggest(query=q, limit=limit))
+
+
+@router.get("/stream")
+async def search_stream(
+    q: str = Query(..., min_length=1, description="Từ khóa tìm kiếm"),
+    limit: int = Query(20, ge=1, le=50, description="Số lượng kết quả tối đa cho mỗi loại"),
+    tags: str = Query(None, description="Danh sách tag IDs ngăn cách bởi dấu phẩy (VD: '1,2,3')"),
+    format: Literal["ndjson", "sse"] = Query("ndjson", description="ndjson hoặc sse (Server-Sent Events)"),
+    service: AsyncSearchService = Depends(get_search_service),
+):
+    """
+    Tìm kiếm như GET /search/ nhưng trả kết quả dần dần (streaming).
+
+    Thứ tự gửi: topics (hit exact/prefix của title đứng đầu) → categories → sections
+    (chấm điểm content chậm nhất nên gửi sau cùng). Mỗi loại đã được xếp hạng và cắt
+    theo limit giống hệt GET /search/.
+
+    **NDJSON** (`application/x-ndjson`), mỗi dòng một object:
+    - `{"type": "topic" | "category" | "section", "item": {...}}`
+    - Dòng cuối: `{"type": "done", "query": "...", "total_results": N}`
+
+    **SSE** (`text/event-stream`): `event: topic|category|section|done`, `data:` là JSON như trên
+    (item hoặc object done).
+    """
+    tag_ids = parse_tag_ids(tags)
+
+    async def ndjson() -> AsyncIterator[bytes]:
+        total = 0
+        async for kind, item in service.search_stream(query=q, limit=limit, tag_ids=tag_ids):
+            total += 1
+            yield b'{"type":"' + kind.encode() + b'","item":' + item.model_dump_json().encode() + b"}\n"
+        yield json.dumps({"type": "done", "query": q, "total_results": total}, ensure_ascii=False).encode() + b"\n"
+
+    async def sse() -> AsyncIterator[bytes]:
+        total = 0
+        async for kind, item in service.search_stream(query=q, limit=limit, tag_ids=tag_ids):
+            total += 1
+            yield b"event: " + kind.encode() + b"\ndata: " + item.model_dump_json().encode() + b"\n\n"
+        done = json.dumps({"query": q, "total_results": total}, ensure_ascii=False)
+        yield b"event: done\ndata: " + done.encode() + b"\n\n"
+
+    if format == "sse":
+        return StreamingResponse(
+            sse(),
+            media_type="text/event-stream",
+            # Tắt buffering của reverse proxy (nginx) để event đi ra ngay
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    return StreamingResponse(
+        ndjson(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def parse_tag_ids(tags: Optional[str]) -> Optional[List[int]]:
+    """Parse tham số tags ("1,2,3") thành danh sách tag IDs"""
+    if not tags:
+        return None
+    try:
+        return [int(tid.strip()) for tid in tags.split(',') if tid.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Tag IDs phải là số nguyên, ngăn cách bởi dấu phẩy"
+        )
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.infrastructure.database import get_db
+from app.core.json_response import model_response
+from app.infrastructure.cache import response_cache
+from app.infrastructure.database import get_async_db, get_db
+from app.infrastructure.hooks import ContentChangeHandler
 from app.domain.schemas.section_schema import SectionCreate, SectionUpdate, SectionResponse
-from app.application.services.section_service import SectionService
+from app.application.services.section_service import AsyncSectionService, SectionService
+from app.infrastructure.repositories.async_section_repository import AsyncSectionRepository
 from app.infrastructure.repositories.section_repository import SectionRepository
 from app.infrastructure.repositories.topic_repository import TopicRepository
 
@@ -17,7 +22,13 @@ def get_section_service(db: Session = Depends(get_db)) -> SectionService:
     """
     section_repository = SectionRepository(db)
     topic_repository = TopicRepository(db)
-    return SectionService(section_repository, topic_repository)
+    return SectionService(section_repository, topic_repository, ContentChangeHandler(db))
+
+def get_async_section_service(db: AsyncSession = Depends(get_async_db)) -> AsyncSectionService:
+    """
+    Dependency injection cho AsyncSectionService (các endpoint đọc chạy trên event loop).
+    """
+    return AsyncSectionService(AsyncSectionRepository(db))
 
 @router.post("/", response_model=SectionResponse, status_code=status.HTTP_201_CREATED)
 @router.post("", response_model=SectionResponse, status_code=status.HTTP_201_CREATED, include_in_schema=False)
@@ -37,7 +48,9 @@ def create_section(
     - **language**: Ngôn ngữ lập trình của code (optional)
     """
     try:
-        return service.create_section(section_data)
+        return model_response(
+            SectionResponse, service.create_section(section_data), status_code=status.HTTP_201_CREATED
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -47,19 +60,38 @@ def create_section(
         )
 
 @router.get("/", response_model=List[SectionResponse])
-def get_all_sections(
+async def get_all_sections(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    service: SectionService = Depends(get_section_service)
+    cursor: Optional[str] = Query(None),
+    service: AsyncSectionService = Depends(get_async_section_service)
 ):
     """
-    Lấy danh sách tất cả Sections với phân trang.
+    Lấy danh sách tất cả Sections với phân trang, sắp xếp theo (topic_id, order_index).
     
     - **skip**: Số lượng bản ghi bỏ qua (default: 0)
     - **limit**: Số lượng bản ghi tối đa trả về (default: 100)
+    - **cursor**: Cursor từ header X-Next-Cursor của trang trước (để trống cho trang đầu); khi có cursor thì bỏ qua skip
     """
     try:
-        return service.get_all_sections(skip=skip, limit=limit)
+        if cursor is not None:
+            sections, next_cursor = await service.get_sections_page(cursor, limit)
+            headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+            return model_response(List[SectionResponse], sections, headers=headers)
+
+        cache_key = f"section_list:{skip}:{limit}"
+        cached = response_cache.get(cache_key, request)
+        if cached is not None:
+            return cached
+
+        sections = await service.get_all_sections(skip=skip, limit=limit)
+        dependencies = ["sections"] + [f"topic:{section.topic_id}" for section in sections]
+        return response_cache.store(
+            cache_key, List[SectionResponse], sections, dependencies, request
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -67,9 +99,10 @@ def get_all_sections(
         )
 
 @router.get("/topic/{topic_id}", response_model=List[SectionResponse])
-def get_sections_by_topic(
+async def get_sections_by_topic(
     topic_id: int,
-    service: SectionService = Depends(get_section_service)
+    request: Request,
+    service: AsyncSectionService = Depends(get_async_section_service)
 ):
     """
     Lấy tất cả Sections thuộc về một Topic, sắp xếp theo order_index.
@@ -77,7 +110,15 @@ def get_sections_by_topic(
     - **topic_id**: ID của Topic cần lấy sections
     """
     try:
-        return service.get_sections_by_topic(topic_id)
+        cache_key = f"sections_by_topic:{topic_id}"
+        cached = response_cache.get(cache_key, request)
+        if cached is not None:
+            return cached
+
+        sections = await service.get_sections_by_topic(topic_id)
+        return response_cache.store(
+            cache_key, List[SectionResponse], sections, [f"topic:{topic_id}"], request
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -86,9 +127,10 @@ def get_sections_by_topic(
 
 @router.get("/{section_id}", response_model=SectionResponse)
 @router.get("/{section_id}/", response_model=SectionResponse, include_in_schema=False)
-def get_section_by_id(
+async def get_section_by_id(
     section_id: int,
-    service: SectionService = Depends(get_section_service)
+    request: Request,
+    service: AsyncSectionService = Depends(get_async_section_service)
 ):
     """
     Lấy thông tin chi tiết một Section theo ID.
@@ -96,7 +138,15 @@ def get_section_by_id(
     - **section_id**: ID của Section cần lấy
     """
     try:
-        return service.get_section_by_id(section_id)
+        cache_key = f"section_detail:{section_id}"
+        cached = response_cache.get(cache_key, request)
+        if cached is not None:
+            return cached
+
+        section = await service.get_section_by_id(section_id)
+        return response_cache.store(
+            cache_key, SectionResponse, section, [f"topic:{section.topic_id}"], request
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -126,7 +176,7 @@ def update_section(
     - **language**: Ngôn ngữ code mới (optional)
     """
     try:
-        return service.update_section(section_id, section_data)
+        return model_response(SectionResponse, service.update_section(section_id, section_data))
     except HTTPException:
         raise
     except Exception as e:
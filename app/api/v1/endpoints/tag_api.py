@@ -1,10 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
 from app.application.services.tag_service import TagService
+from app.core.json_response import model_response
 from app.domain.schemas.tag_schema import TagCreate, TagUpdate, TagResponse, TagWithTopics
+from app.infrastructure.cache import response_cache
 from app.infrastructure.database import get_db
+from app.infrastructure.hooks import ContentChangeHandler
 from app.infrastructure.repositories.tag_repository import TagRepository
 
 router = APIRouter()
@@ -13,14 +16,16 @@ router = APIRouter()
 def get_tag_service(db: Session = Depends(get_db)) -> TagService:
     """Dependency injection cho TagService"""
     tag_repo = TagRepository(db)
-    return TagService(tag_repo)
+    return TagService(tag_repo, ContentChangeHandler(db))
 
 
 @router.get("/", response_model=List[TagResponse])
 @router.get("", response_model=List[TagResponse], include_in_schema=False)
 def get_all_tags(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
     service: TagService = Depends(get_tag_service)
 ):
     """
@@ -28,13 +33,26 @@ def get_all_tags(
     
     - **skip**: Số lượng tags bỏ qua
     - **limit**: Số lượng tags tối đa trả về
+    - **cursor**: Cursor từ header X-Next-Cursor của trang trước (để trống cho trang đầu); khi có cursor thì bỏ qua skip
     """
-    return service.get_all_tags(skip, limit)
+    if cursor is not None:
+        tags, next_cursor = service.get_tags_page(cursor, limit)
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+        return model_response(List[TagResponse], tags, headers=headers)
+
+    cache_key = f"tag_list:{skip}:{limit}"
+    cached = response_cache.get(cache_key, request)
+    if cached is not None:
+        return cached
+
+    tags = service.get_all_tags(skip, limit)
+    return response_cache.store(cache_key, List[TagResponse], tags, ["tags"], request)
 
 
 @router.get("/popular", response_model=List[TagResponse])
 @router.get("/popular/", response_model=List[TagResponse], include_in_schema=False)
 def get_popular_tags(
+    request: Request,
     limit: int = Query(10, ge=1, le=50, description="Số lượng tags phổ biến"),
     service: TagService = Depends(get_tag_service)
 ):
@@ -46,19 +64,32 @@ def get_popular_tags(
     - Gợi ý tags khi tạo topic mới
     - Trending topics
     """
-    return service.get_popular_tags(limit)
+    cache_key = f"tag_popular:{limit}"
+    cached = response_cache.get(cache_key, request)
+    if cached is not None:
+        return cached
+
+    tags = service.get_popular_tags(limit)
+    return response_cache.store(cache_key, List[TagResponse], tags, ["tags"], request)
 
 
 @router.get("/{tag_id}/", response_model=TagWithTopics, include_in_schema=False)
 @router.get("/{tag_id}", response_model=TagWithTopics)
 def get_tag_by_id(
     tag_id: int,
+    request: Request,
     service: TagService = Depends(get_tag_service)
 ):
     """
     Lấy thông tin chi tiết một tag kèm danh sách topic IDs.
     """
-    return service.get_tag_by_id(tag_id)
+    cache_key = f"tag_detail:{tag_id}"
+    cached = response_cache.get(cache_key, request)
+    if cached is not None:
+        return cached
+
+    tag = service.get_tag_by_id(tag_id)
+    return response_cache.store(cache_key, TagWithTopics, tag, [f"tag:{tag_id}"], request)
 
 
 @router.post("/", response_model=TagResponse, status_code=status.HTTP_201_CREATED)
@@ -74,7 +105,7 @@ def create_tag(
     - **slug**: URL-friendly identifier (VD: "design-patterns")
     - **description**: Mô tả ngắn về tag (optional)
     """
-    return service.create_tag(tag_data)
+    return model_response(TagResponse, service.create_tag(tag_data), status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/{tag_id}", response_model=TagResponse)
@@ -85,7 +116,7 @@ def update_tag(
     service: TagService = Depends(get_tag_service)
 ):
     """Cập nhật thông tin tag"""
-    return service.update_tag(tag_id, tag_data)
+    return model_response(TagResponse, service.update_tag(tag_id, tag_data))
 
 
 @router.delete("/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
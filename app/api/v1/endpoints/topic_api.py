@@ -1,13 +1,28 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.application.services.topic_service import TopicService
-from app.domain.schemas.topic_schema import TopicCreate, TopicResponse, TopicListItem
-from app.infrastructure.database import get_db
+from app.application.services.topic_service import AsyncTopicService, TopicService
+from app.core.json_response import model_response
+from app.domain.schemas.topic_schema import (
+    TopicBulkCreate,
+    TopicBulkResponse,
+    TopicCreate,
+    TopicListItem,
+    TopicResponse,
+)
+from app.infrastructure.cache import response_cache, topic_cache_tags
+from app.infrastructure.database import get_async_db, get_db
+from app.infrastructure.hooks import ContentChangeHandler
+from app.infrastructure.jobs import ExecutorSaturatedError, related_topics_executor
+from app.infrastructure.repositories.async_topic_repository import AsyncTopicRepository
 from app.infrastructure.repositories.topic_repository import TopicRepository
+from app.infrastructure.repositories.topic_similarity_repository import (
+    TopicSimilarityRepository,
+)
 
 router = APIRouter()
 
@@ -24,21 +39,37 @@ def get_topic_service(db: Session = Depends(get_db)) -> TopicService:
     Tuân thủ Dependency Inversion Principle
     """
     topic_repo = TopicRepository(db)
-    return TopicService(topic_repo)
+    similarity_repo = TopicSimilarityRepository(db)
+    return TopicService(topic_repo, similarity_repo, ContentChangeHandler(db))
+
+
+def get_async_topic_service(db: AsyncSession = Depends(get_async_db)) -> AsyncTopicService:
+    """Dependency injection: AsyncTopicService cho các endpoint đọc (chạy trên event loop)"""
+    return AsyncTopicService(AsyncTopicRepository(db))
 
 
 @router.get("/{topic_id}/", response_model=TopicResponse, include_in_schema=False)
 @router.get("/{topic_id}", response_model=TopicResponse)
-def get_topic(topic_id: int, service: TopicService = Depends(get_topic_service)):
+async def get_topic(
+    topic_id: int,
+    request: Request,
+    service: AsyncTopicService = Depends(get_async_topic_service),
+):
     """Lấy thông tin chi tiết một topic"""
     try:
-        topic = service.get_topic_by_id(topic_id)
-        if not topic:
+        cache_key = f"topic_detail:{topic_id}"
+        cached = response_cache.get(cache_key, request)
+        if cached is not None:
+            return cached
+
+        body = await service.get_topic_json(topic_id)
+        if body is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Topic với ID {topic_id} không tồn tại",
             )
-        return topic
+        # Snapshot được build lại khi ghi topic/section/tag, các lần ghi đó đều invalidate "topic:{id}"
+        return response_cache.store_body(cache_key, body, [f"topic:{topic_id}"], request)
     except HTTPException:
         raise
     except Exception as e:
@@ -50,19 +81,37 @@ def get_topic(topic_id: int, service: TopicService = Depends(get_topic_service))
 
 @router.get("/", response_model=List[TopicListItem])
 @router.get("", response_model=List[TopicListItem], include_in_schema=False)
-def get_topics(
+async def get_topics(
+    request: Request,
     category_id: int = Query(None, description="Filter topics by category ID"),
     skip: int = 0, 
     limit: int = 100, 
-    service: TopicService = Depends(get_topic_service)
+    cursor: Optional[str] = Query(None, description="Keyset cursor (header X-Next-Cursor của trang trước, rỗng cho trang đầu)"),
+    service: AsyncTopicService = Depends(get_async_topic_service)
 ):
     """Lấy danh sách topics (lightweight - không bao gồm sections/tags) với filter theo category"""
     try:
+        if cursor is not None:
+            topics, next_cursor = await service.get_topics_page(cursor, limit, category_id)
+            headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+            return model_response(List[TopicListItem], topics, headers=headers)
+
+        cache_key = f"topic_list:{category_id}:{skip}:{limit}"
+        cached = response_cache.get(cache_key, request)
+        if cached is not None:
+            return cached
+
         if category_id:
-            topics = service.get_topics_by_category(category_id, skip=skip, limit=limit)
+            topics = await service.get_topics_by_category(category_id, skip=skip, limit=limit)
+            dependencies = [f"category:{category_id}:topics"]
         else:
-            topics = service.get_all_topics(skip=skip, limit=limit)
-        return topics
+            topics = await service.get_topic_list(skip=skip, limit=limit)
+            dependencies = ["topics"]
+        for topic in topics:
+            dependencies += topic_cache_tags(topic)
+        return response_cache.store(cache_key, List[TopicListItem], topics, dependencies, request)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -84,11 +133,39 @@ def create_topic(
     - **sections**: Danh sách các phần chi tiết
     """
     try:
-        return service.create_new_topic(topic_in)
+        return model_response(
+            TopicResponse, service.create_new_topic(topic_in), status_code=status.HTTP_201_CREATED
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/bulk", response_model=TopicBulkResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/bulk/", response_model=TopicBulkResponse, status_code=status.HTTP_201_CREATED, include_in_schema=False)
+def bulk_create_topics(
+    data: TopicBulkCreate, service: TopicService = Depends(get_topic_service)
+):
+    """
+    Import nhiều bài học trong một transaction (tối đa BULK_IMPORT_MAX_TOPICS)
+
+    - **topics**: Danh sách bài học, mỗi bài gồm title, short_definition,
+      **category_slug**, **tag_slugs** và các sections
+    - Trả về ID của các bài học đã tạo theo đúng thứ tự gửi lên
+    - Batch lỗi (title trùng, slug không tồn tại) không tạo bài học nào
+    """
+    try:
+        return model_response(
+            TopicBulkResponse, service.bulk_create_topics(data), status_code=status.HTTP_201_CREATED
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Lỗi khi import topics: {str(e)}",
+        )
+
+
 @router.put("/{topic_id}/", response_model=TopicResponse, include_in_schema=False)
 @router.put("/{topic_id}", response_model=TopicResponse)
 def update_topic(
@@ -104,7 +181,7 @@ def update_topic(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Topic với ID {topic_id} không tồn tại",
             )
-        return topic
+        return model_response(TopicResponse, topic)
     except HTTPException:
         raise
     except Exception as e:
@@ -164,12 +241,14 @@ async def get_related_topics(
         Danh sách topics liên quan kèm điểm số, sắp xếp theo độ liên quan giảm dần
     """
     try:
-        # Tìm related topics
-        related_topics = service.find_related_topics(topic_id, top_n)
+        # Tìm related topics trên executor riêng (DB I/O + TF-IDF không block event loop)
+        related_topics = await related_topics_executor.run(
+            service.find_related_topics, topic_id, top_n
+        )
 
         if not related_topics:
             # Kiểm tra xem topic có tồn tại không
-            topic = service.get_topic_by_id(topic_id)
+            topic = await related_topics_executor.run(service.get_topic_by_id, topic_id)
             if not topic:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -178,10 +257,16 @@ async def get_related_topics(
             # Topic tồn tại nhưng không có related topics
             return []
 
-        return related_topics
+        return model_response(List[RelatedTopicResponse], related_topics)
 
     except HTTPException:
         raise
+    except ExecutorSaturatedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Too many related topics requests, please retry: {str(e)}",
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -3,16 +3,30 @@ Repository Interfaces
 Định nghĩa các contracts cho repositories theo Dependency Inversion Principle.
 """
 
+from .cache_backend_interface import ICacheBackend
 from .category_repository_interface import ICategoryRepository
+from .content_change_handler_interface import IContentChangeHandler
+from .content_revision_repository_interface import IContentRevisionRepository
 from .related_topic_association_repository_interface import IRelatedTopicAssociationRepository
-from .section_repository_interface import ISectionRepository
-from .topic_repository_interface import ITopicRepository
+from .search_index_interface import ISearchIndex
+from .section_repository_interface import IAsyncSectionRepository, ISectionRepository
+from .topic_repository_interface import IAsyncTopicRepository, ITopicRepository
 from .tag_repository_interface import ITagRepository
+from .topic_similarity_repository_interface import ITopicSimilarityRepository
+from .topic_snapshot_repository_interface import ITopicSnapshotRepository
 
 __all__ = [
+    "ICacheBackend",
     "ICategoryRepository",
+    "IContentChangeHandler",
+    "IContentRevisionRepository",
     "IRelatedTopicAssociationRepository",
+    "ISearchIndex",
     "ISectionRepository",
+    "IAsyncSectionRepository",
     "ITopicRepository",
+    "IAsyncTopicRepository",
     "ITagRepository",
+    "ITopicSimilarityRepository",
+    "ITopicSnapshotRepository",
 ]
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+
+class ICacheBackend(ABC):
+    """
+    Interface cho backend của response cache (in-memory, Redis...).
+    Mỗi entry gắn với các dependency keys (VD: "topic:1", "tag:3") để có thể
+    invalidate đúng các entry bị ảnh hưởng khi dữ liệu thay đổi.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Lấy giá trị đã cache
+
+        Returns:
+            bytes đã lưu, None nếu không có hoặc đã hết hạn
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, tags: Iterable[str], ttl: int) -> None:
+        """
+        Lưu giá trị vào cache
+
+        Args:
+            key: Cache key
+            value: Nội dung cần lưu
+            tags: Các dependency keys của entry
+            ttl: Thời gian sống (giây)
+        """
+        pass
+
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Xóa mọi entry gắn với ít nhất một trong các dependency keys
+
+        Returns:
+            Số entry đã xóa
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Xóa toàn bộ cache"""
+        pass
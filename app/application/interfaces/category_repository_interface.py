@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from app.domain.models import Category
+from app.domain.projections import CategorySearchRecord
 from app.domain.schemas.category_schema import CategoryCreate, CategoryUpdate
 
 class ICategoryRepository(ABC):
@@ -48,6 +49,19 @@ class ICategoryRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_search_records(self, category_ids: Optional[Iterable[int]] = None) -> List[CategorySearchRecord]:
+        """
+        Lấy projection của categories cho search, sắp xếp theo id
+        
+        Args:
+            category_ids: Chỉ lấy các IDs này (None = tất cả)
+            
+        Returns:
+            List[CategorySearchRecord]
+        """
+        pass
+    
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Category]:
         """
@@ -62,6 +76,20 @@ class ICategoryRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_page_after(self, after_id: Optional[int], limit: int) -> List[Category]:
+        """
+        Lấy trang categories theo keyset pagination (thứ tự id)
+        
+        Args:
+            after_id: ID của category cuối trang trước (None cho trang đầu)
+            limit: Số bản ghi tối đa trả về
+            
+        Returns:
+            List[Category]: Các categories có id > after_id
+        """
+        pass
+    
     @abstractmethod
     def update(self, category_id: int, category_data: CategoryUpdate) -> Optional[Category]:
         """
@@ -0,0 +1,87 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+
+
+class IContentChangeHandler(ABC):
+    """
+    Interface cho các tác dụng phụ sau khi một lần ghi nội dung đã commit
+    (content version, topic snapshots, suggestion index, response cache,
+    job tính lại topic_similarity).
+
+    Services gọi handler sau khi repository ghi xong; repositories chỉ làm việc
+    với database.
+    """
+
+    @abstractmethod
+    def topic_saved(
+        self,
+        topic_id: int,
+        title: str,
+        category_ids: Iterable[int],
+        changed_tag_ids: Iterable[int],
+        similarity_changed: bool,
+    ) -> None:
+        """
+        Topic vừa được tạo hoặc cập nhật
+
+        Args:
+            topic_id: ID của topic
+            title: Title hiện tại
+            category_ids: Category cũ và mới (danh sách topics của các category này đổi)
+            changed_tag_ids: Các tag được gắn thêm hoặc gỡ ra
+            similarity_changed: Title, short_definition hoặc category đã đổi
+        """
+        pass
+
+    @abstractmethod
+    def topic_deleted(
+        self,
+        topic_id: int,
+        category_id: int,
+        tag_ids: Iterable[int],
+        referencing_topic_ids: Iterable[int],
+    ) -> None:
+        """
+        Topic vừa bị xóa
+
+        Args:
+            referencing_topic_ids: Các topic từng có topic này trong top-K related
+        """
+        pass
+
+    @abstractmethod
+    def topics_imported(
+        self, topic_ids: List[int], category_ids: Iterable[int], tag_ids: Iterable[int]
+    ) -> None:
+        """Nhiều topics vừa được tạo bằng bulk import"""
+        pass
+
+    @abstractmethod
+    def sections_changed(self, topic_ids: Iterable[int]) -> None:
+        """Sections của các topics vừa được tạo, cập nhật hoặc xóa"""
+        pass
+
+    @abstractmethod
+    def category_saved(self, category_id: int, name: str) -> None:
+        """Category vừa được tạo hoặc cập nhật"""
+        pass
+
+    @abstractmethod
+    def category_deleted(self, category_id: int) -> None:
+        """Category vừa bị xóa"""
+        pass
+
+    @abstractmethod
+    def tag_saved(self, tag_id: int, name: str, topic_ids: Iterable[int]) -> None:
+        """
+        Tag vừa được tạo hoặc cập nhật
+
+        Args:
+            topic_ids: Các topics gắn tag (snapshot của chúng nhúng tag)
+        """
+        pass
+
+    @abstractmethod
+    def tag_deleted(self, tag_id: int, topic_ids: Iterable[int]) -> None:
+        """Tag vừa bị xóa (topic_ids: các topics từng gắn tag)"""
+        pass
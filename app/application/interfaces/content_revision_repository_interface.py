@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+
+class IContentRevisionRepository(ABC):
+    """
+    Interface cho repository của bảng content_revision (bộ đếm lần ghi nội dung
+    dùng chung giữa các instance).
+    Áp dụng Dependency Inversion Principle.
+    """
+
+    @abstractmethod
+    def bump(self) -> int:
+        """Tăng revision trong transaction riêng, trả về giá trị mới"""
+        pass
+
+    @abstractmethod
+    def get_stamp(self) -> Tuple[int, ...]:
+        """
+        Trạng thái nội dung đọc trong một query: revision (phần tử đầu) kèm số dòng và ID lớn nhất
+        của topics, sections, categories, tags (bắt được cả insert/delete
+        không đi qua API, VD: script import)
+        """
+        pass
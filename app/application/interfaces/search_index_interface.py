@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+
+class ISearchIndex(ABC):
+    """
+    Interface cho engine chọn candidate của SearchService (in-memory, PostgreSQL FTS...).
+    SearchService chỉ chấm điểm các bản ghi engine trả về thay vì quét toàn bảng.
+    """
+
+    @abstractmethod
+    def ensure_fresh(self, db: Session) -> None:
+        """Đảm bảo index phản ánh dữ liệu hiện tại trước khi lấy candidates"""
+        pass
+
+    @abstractmethod
+    def candidates(
+        self,
+        entity_type: str,
+        query_normalized: str,
+        keywords: List[str],
+        query_words: List[str],
+    ) -> Optional[Set[int]]:
+        """
+        Lấy tập candidate IDs có thể đạt score > 0
+
+        Args:
+            entity_type: "topic", "section" hoặc "category"
+            query_normalized: Query đã bỏ dấu, chữ thường
+            keywords: Từ khóa sau khi lọc stop words
+            query_words: Các từ của query_normalized
+
+        Returns:
+            Tập IDs, None nếu nên quét toàn bảng
+        """
+        pass
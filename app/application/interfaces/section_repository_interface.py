@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from app.domain.models import Section
+from app.domain.projections import SectionSearchRecord
 
 class ISectionRepository(ABC):
     """
@@ -34,6 +35,19 @@ class ISectionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_search_records(self, section_ids: Optional[Iterable[int]] = None) -> List[SectionSearchRecord]:
+        """
+        Lấy projection của Sections cho search (kèm title của topic), sắp xếp theo id.
+        
+        Args:
+            section_ids: Chỉ lấy các IDs này (None = tất cả)
+            
+        Returns:
+            Danh sách SectionSearchRecord
+        """
+        pass
+    
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Section]:
         """
@@ -87,3 +101,31 @@ class ISectionRepository(ABC):
             True nếu xóa thành công, False nếu không tìm thấy
         """
         pass
+
+
+class IAsyncSectionRepository(ABC):
+    """
+    Interface async cho các thao tác đọc Section (dùng với AsyncSession).
+    """
+
+    @abstractmethod
+    async def get_by_id(self, section_id: int) -> Optional[Section]:
+        """Lấy Section theo ID"""
+        pass
+
+    @abstractmethod
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Section]:
+        """Lấy danh sách tất cả Sections với phân trang"""
+        pass
+
+    @abstractmethod
+    async def get_page_after(
+        self, after: Optional[Tuple[int, int, int]], limit: int
+    ) -> List[Section]:
+        """Lấy tối đa limit Sections đứng sau key (topic_id, order_index, id) = after"""
+        pass
+
+    @abstractmethod
+    async def get_by_topic_id(self, topic_id: int) -> List[Section]:
+        """Lấy tất cả Sections thuộc về một Topic, sắp xếp theo order_index"""
+        pass
@@ -76,6 +76,60 @@ class ITagRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_all_with_counts(self, skip: int = 0, limit: int = 100) -> List[tuple]:
+        """
+        Lấy danh sách tags kèm số lượng topics (một query aggregate)
+        
+        Args:
+            skip: Số lượng records bỏ qua
+            limit: Số lượng records tối đa trả về
+            
+        Returns:
+            Danh sách tuple (Tag, topic_count) theo thứ tự id
+        """
+        pass
+
+    @abstractmethod
+    def get_page_after(self, after_id: Optional[int], limit: int) -> List[tuple]:
+        """
+        Lấy trang tags theo keyset pagination (thứ tự id)
+        
+        Args:
+            after_id: ID của tag cuối trang trước (None cho trang đầu)
+            limit: Số lượng records tối đa trả về
+            
+        Returns:
+            Danh sách tuple (Tag, topic_count) có id > after_id
+        """
+        pass
+
+    @abstractmethod
+    def count_topics(self, tag_id: int) -> int:
+        """
+        Đếm số topics gắn với tag
+        
+        Args:
+            tag_id: ID của tag
+            
+        Returns:
+            Số lượng topics
+        """
+        pass
+
+    @abstractmethod
+    def get_topic_ids(self, tag_id: int) -> List[int]:
+        """
+        Lấy IDs của các topics gắn với tag
+        
+        Args:
+            tag_id: ID của tag
+            
+        Returns:
+            Danh sách topic IDs
+        """
+        pass
+
     @abstractmethod
     def update(self, tag_id: int, tag_data) -> Optional[Tag]:
         """
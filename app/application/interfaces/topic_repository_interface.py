@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from app.domain.models import Topic
-from app.domain.schemas.topic_schema import TopicCreate
+from app.domain.projections import TopicRecord, TopicSearchRecord
+from app.domain.schemas.topic_schema import TopicBulkItem, TopicCreate
 
 class ITopicRepository(ABC):
     """
@@ -48,6 +49,17 @@ class ITopicRepository(ABC):
             List[Topic]: Danh sách topics
         """
         pass
+
+    @abstractmethod
+    def get_list(self, skip: int = 0, limit: int = 100) -> List[Topic]:
+        """
+        Lấy trang topics cho endpoint danh sách: chỉ cột của topic kèm tags, không load sections
+        
+        Args:
+            skip: Số bản ghi bỏ qua
+            limit: Số bản ghi tối đa trả về
+        """
+        pass
     
     @abstractmethod
     def update(self, topic_id: int, topic_data: TopicCreate) -> Optional[Topic]:
@@ -77,12 +89,141 @@ class ITopicRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all_with_minimal_data(self) -> List[Topic]:
+    def get_all_with_minimal_data(self) -> List[TopicRecord]:
         """
-        Lấy tất cả topics với dữ liệu tối thiểu (không load sections).
+        Lấy tất cả topics với dữ liệu tối thiểu (projection, không phải ORM entity).
         Dùng cho việc tính toán related topics.
         
         Returns:
-            List[Topic]: Danh sách tất cả topics
+            List[TopicRecord]: Danh sách tất cả topics
+        """
+        pass
+
+    @abstractmethod
+    def get_by_ids(self, topic_ids: List[int]) -> List[Topic]:
+        """
+        Lấy các topics theo danh sách IDs, kèm sections và tags
+        
+        Args:
+            topic_ids: Danh sách ID theo thứ tự mong muốn
+            
+        Returns:
+            List[Topic]: Các topics tồn tại, giữ thứ tự của topic_ids
+        """
+        pass
+
+    @abstractmethod
+    def get_search_records(
+        self, topic_ids: Optional[Iterable[int]] = None, tag_ids: Optional[List[int]] = None
+    ) -> List[TopicSearchRecord]:
+        """
+        Lấy projection của topics cho search, sắp xếp theo id
+        
+        Args:
+            topic_ids: Chỉ lấy các IDs này (None = tất cả)
+            tag_ids: Chỉ lấy topics có ít nhất một tag trong danh sách (optional)
+            
+        Returns:
+            List[TopicSearchRecord]: Các topics kèm tên category
+        """
+        pass
+
+    @abstractmethod
+    def count_by_category(self, category_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Đếm số topics của từng category
+        
+        Args:
+            category_ids: Các category cần đếm
+            
+        Returns:
+            Dict category_id -> số topics (category không có topic thì không có key)
         """
         pass
+
+    @abstractmethod
+    def get_category_ids_by_slug(self, slugs: Iterable[str]) -> Dict[str, int]:
+        """
+        Tra cứu ID của nhiều categories theo slug trong một query
+        
+        Returns:
+            Dict slug -> category_id (slug không tồn tại thì không có key)
+        """
+        pass
+
+    @abstractmethod
+    def get_tag_ids_by_slug(self, slugs: Iterable[str]) -> Dict[str, int]:
+        """
+        Tra cứu ID của nhiều tags theo slug trong một query
+        
+        Returns:
+            Dict slug -> tag_id (slug không tồn tại thì không có key)
+        """
+        pass
+
+    @abstractmethod
+    def get_existing_titles(self, titles: Iterable[str]) -> Set[str]:
+        """Các title trong danh sách đã có topic sử dụng"""
+        pass
+
+    @abstractmethod
+    def bulk_create(
+        self, items: List[TopicBulkItem], category_ids: Dict[str, int], tag_ids: Dict[str, int]
+    ) -> List[int]:
+        """
+        Tạo nhiều topics (kèm sections và tags) trong một transaction
+        
+        Args:
+            items: Các topics cần tạo
+            category_ids: slug -> category_id của mọi category_slug trong items
+            tag_ids: slug -> tag_id của mọi tag_slugs trong items
+            
+        Returns:
+            List[int]: ID của các topics đã tạo, cùng thứ tự với items
+        """
+        pass
+
+
+class IAsyncTopicRepository(ABC):
+    """
+    Interface async cho các thao tác đọc Topic (dùng với AsyncSession).
+    Các endpoint đọc chạy trực tiếp trên event loop thay vì threadpool.
+    Objects trả về đã eager load đủ quan hệ cần cho response schema.
+    """
+
+    @abstractmethod
+    async def get_by_id(self, topic_id: int) -> Optional[Topic]:
+        """Lấy topic theo ID (kèm sections và tags)"""
+        pass
+
+    @abstractmethod
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Topic]:
+        """Lấy danh sách topics với phân trang (kèm sections và tags)"""
+        pass
+
+    @abstractmethod
+    async def get_list(self, skip: int = 0, limit: int = 100) -> List[Topic]:
+        """Lấy trang topics cho endpoint danh sách (kèm tags, không load sections)"""
+        pass
+
+    @abstractmethod
+    async def get_page_after(
+        self, after_id: Optional[int], limit: int, category_id: Optional[int] = None
+    ) -> List[Topic]:
+        """Lấy tối đa limit topics có id > after_id theo thứ tự id (kèm tags, không load sections)"""
+        pass
+
+    @abstractmethod
+    async def get_by_category(self, category_id: int, skip: int = 0, limit: int = 100) -> List[Topic]:
+        """Lấy danh sách topics theo category (kèm tags, không load sections)"""
+        pass
+
+    @abstractmethod
+    async def get_snapshot(self, topic_id: int) -> Optional[bytes]:
+        """Lấy JSON TopicResponse đã serialize sẵn của topic (None nếu chưa có snapshot theo schema hiện tại)"""
+        pass
+
+    @abstractmethod
+    async def save_snapshot(self, topic_id: int, body: bytes) -> None:
+        """Lưu snapshot của topic, thay snapshot theo schema cũ (bỏ qua nếu đã có snapshot được ghi trước)"""
+        pass
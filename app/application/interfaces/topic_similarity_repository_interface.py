@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.models import Topic
+
+
+class ITopicSimilarityRepository(ABC):
+    """
+    Interface cho repository của bảng materialized topic_similarity.
+    Áp dụng Dependency Inversion Principle.
+    """
+
+    @abstractmethod
+    def get_related(self, topic_id: int, limit: int) -> Optional[List[Tuple[Topic, float]]]:
+        """
+        Lấy các related topics đã tính sẵn của một topic
+
+        Args:
+            topic_id: ID của topic nguồn
+            limit: Số lượng related topics tối đa
+
+        Returns:
+            Danh sách tuple (Topic, score) sắp xếp theo score giảm dần
+            (rỗng nếu đã tính nhưng không có related topic), None nếu chưa tính
+        """
+        pass
+
+    @abstractmethod
+    def get_cutoff_scores(self) -> Dict[int, Tuple[int, float]]:
+        """
+        Lấy số dòng và score thấp nhất đang lưu của mỗi topic (một query GROUP BY)
+
+        Returns:
+            Dict mapping topic_id -> (row_count, min_score)
+        """
+        pass
+
+    @abstractmethod
+    def get_referencing_topic_ids(self, related_topic_id: int) -> List[int]:
+        """
+        Lấy IDs của các topics đang có related_topic_id trong top-K của mình
+
+        Args:
+            related_topic_id: ID của topic được tham chiếu
+        """
+        pass
+
+    @abstractmethod
+    def replace_rows(self, topic_id: int, rows: List[Tuple[int, float]]) -> None:
+        """
+        Thay toàn bộ top-K của một topic và đánh dấu topic đã được tính
+        (kể cả khi rows rỗng)
+
+        Args:
+            topic_id: ID của topic nguồn
+            rows: Danh sách (related_topic_id, score) theo thứ tự rank
+        """
+        pass
+
+    @abstractmethod
+    def add_rows_if_missing(self, topic_id: int, rows: List[Tuple[int, float]]) -> bool:
+        """
+        Lưu top-K của một topic khi chưa có dòng nào và chưa được đánh dấu đã tính,
+        không đánh dấu (dấu đã tính do background job ghi qua replace_rows)
+
+        Returns:
+            True nếu đã lưu, False nếu đã có dữ liệu (VD: job vừa ghi xong)
+        """
+        pass
+
+    @abstractmethod
+    def delete_for_topic(self, topic_id: int) -> None:
+        """
+        Xóa mọi dòng có topic_id hoặc related_topic_id là topic này, bỏ đánh dấu
+        đã tính của topic và của các topics từng tham chiếu tới nó (không commit)
+        """
+        pass
+
+    @abstractmethod
+    def is_empty(self) -> bool:
+        """Kiểm tra đã có topic nào được tính top-K chưa"""
+        pass
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class ITopicSnapshotRepository(ABC):
+    """
+    Interface cho repository của bảng topic_snapshots (JSON TopicResponse đã serialize sẵn).
+    Áp dụng Dependency Inversion Principle.
+    """
+
+    @abstractmethod
+    def refresh(self, topic_ids: Iterable[int]) -> None:
+        """
+        Build lại snapshot của các topics từ dữ liệu hiện tại và commit
+
+        Args:
+            topic_ids: IDs các topics vừa thay đổi (topic không còn tồn tại thì bị xóa snapshot)
+        """
+        pass
+
+    @abstractmethod
+    def delete_for_topic(self, topic_id: int) -> None:
+        """Xóa snapshot của topic (caller chịu trách nhiệm commit)"""
+        pass
@@ -1,6 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
 from app.application.interfaces.category_repository_interface import ICategoryRepository
+from app.application.interfaces.content_change_handler_interface import IContentChangeHandler
+from app.core.pagination import build_page, clamp_page_size, decode_cursor
 from app.domain.schemas.category_schema import CategoryCreate, CategoryUpdate, CategoryResponse
 
 class CategoryService:
@@ -9,14 +11,20 @@ class CategoryService:
     Áp dụng Dependency Inversion: phụ thuộc vào ICategoryRepository interface.
     """
     
-    def __init__(self, category_repo: ICategoryRepository):
+    def __init__(
+        self,
+        category_repo: ICategoryRepository,
+        changes: Optional[IContentChangeHandler] = None,
+    ):
         """
         Constructor nhận interface thay vì Session để tuân thủ DIP
         
         Args:
             category_repo: Implementation của ICategoryRepository
+            changes: Optional - tác dụng phụ sau mỗi lần ghi (cache, index)
         """
         self.category_repo = category_repo
+        self.changes = changes
 
     def create_category(self, data: CategoryCreate) -> CategoryResponse:
         """
@@ -34,6 +42,8 @@ class CategoryService:
             )
         
         category = self.category_repo.create(data)
+        if self.changes:
+            self.changes.category_saved(category.id, category.name)
         return CategoryResponse.model_validate(category)
     
     def get_category_by_id(self, category_id: int) -> Optional[CategoryResponse]:
@@ -48,6 +58,16 @@ class CategoryService:
         categories = self.category_repo.get_all(skip, limit)
         return [CategoryResponse.model_validate(cat) for cat in categories]
     
+    def get_categories_page(
+        self, cursor: Optional[str], limit: int
+    ) -> Tuple[List[CategoryResponse], Optional[str]]:
+        """Lấy một trang categories theo cursor, trả về (categories, next_cursor)"""
+        limit = clamp_page_size(limit)
+        after = decode_cursor(cursor, 1)
+        categories = self.category_repo.get_page_after(after[0] if after else None, limit + 1)
+        page, next_cursor = build_page(categories, limit, key=lambda cat: (cat.id,))
+        return [CategoryResponse.model_validate(cat) for cat in page], next_cursor
+    
     def update_category(self, category_id: int, data: CategoryUpdate) -> Optional[CategoryResponse]:
         """
         Cập nhật category
@@ -66,9 +86,14 @@ class CategoryService:
         
         category = self.category_repo.update(category_id, data)
         if category:
+            if self.changes:
+                self.changes.category_saved(category.id, category.name)
             return CategoryResponse.model_validate(category)
         return None
     
     def delete_category(self, category_id: int) -> bool:
         """Xóa category"""
-        return self.category_repo.delete(category_id)
+        deleted = self.category_repo.delete(category_id)
+        if deleted and self.changes:
+            self.changes.category_deleted(category_id)
+        return deleted
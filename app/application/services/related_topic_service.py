@@ -2,13 +2,181 @@
 Service cho việc tìm kiếm các topics liên quan sử dụng TF-IDF và Heuristic Scoring
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
+from app.application.services.tfidf_model import TfidfModel, tfidf_model_store
 from app.domain.models import Topic
+from app.domain.projections import TopicRecord
+
+# Topic entity hoặc projection (chỉ cần id, title, short_definition, category_id)
+ScoringTopic = Union[Topic, TopicRecord]
+
+# Stop words phổ biến loại bỏ khỏi từ khóa title (heuristic rule 2)
+TITLE_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "của",
+        "và",
+        "là",
+        "có",
+        "trong",
+        "với",
+        "các",
+        "được",
+        "từ",
+    }
+)
+
+
+def _title_keywords(topic: ScoringTopic) -> set:
+    """Tập từ khóa title (lowercase, đã bỏ stop words)"""
+    return set(str(topic.title).lower().split()) - TITLE_STOP_WORDS
+
+
+class HeuristicFeatures:
+    """
+    Đặc trưng heuristic của một danh sách topics dưới dạng NumPy arrays:
+    - category_codes: mã category của mỗi topic
+    - title_tokens: ma trận sparse nhị phân (topic x từ khóa title)
+    - definition_lengths / has_definition: độ dài short_definition
+
+    Cho phép tính heuristic score của một topic với tất cả topics còn lại trong
+    một lượt vectorized, kết quả giống hệt _calculate_heuristic_score.
+    """
+
+    def __init__(self, topics: List[ScoringTopic]) -> None:
+        self.index_of: Dict[int, int] = {
+            topic.id: i for i, topic in enumerate(topics)  # type: ignore
+        }
+
+        category_codes: Dict[Optional[int], int] = {}
+        self.category_codes = np.array(
+            [
+                category_codes.setdefault(topic.category_id, len(category_codes))  # type: ignore
+                for topic in topics
+            ],
+            dtype=np.int64,
+        )
+
+        vocabulary: Dict[str, int] = {}
+        indices: List[int] = []
+        indptr = [0]
+        for topic in topics:
+            for token in _title_keywords(topic):
+                indices.append(vocabulary.setdefault(token, len(vocabulary)))
+            indptr.append(len(indices))
+        self.title_tokens = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int64), indices, indptr),
+            shape=(len(topics), max(len(vocabulary), 1)),
+        )
+        self.title_token_counts = np.diff(np.asarray(indptr, dtype=np.int64))
+
+        self.has_definition = np.array(
+            [topic.short_definition is not None for topic in topics], dtype=bool
+        )
+        self.definition_lengths = np.array(
+            [
+                len(str(topic.short_definition))
+                if topic.short_definition is not None
+                else 0
+                for topic in topics
+            ],
+            dtype=np.int64,
+        )
+
+        self._model: Optional[TfidfModel] = None
+        self._model_rows: Optional[np.ndarray] = None
+
+    def _title_overlap_counts(self, index: int) -> np.ndarray:
+        """Số từ khóa title chung giữa topic index và từng topic"""
+        return (self.title_tokens @ self.title_tokens[index].T).toarray().ravel()
+
+    def scores_for_source(self, source_index: int) -> np.ndarray:
+        """Heuristic score của mọi topic khi làm candidate cho topic source_index"""
+        scores = np.where(
+            self.category_codes == self.category_codes[source_index], 0.3, 0.0
+        )
+
+        overlap_counts = self._title_overlap_counts(source_index)
+        source_count = self.title_token_counts[source_index]
+        if source_count > 0:
+            overlap_ratio = overlap_counts / source_count
+            scores = scores + np.where(
+                overlap_counts > 0, np.minimum(0.2, overlap_ratio * 0.3), 0.0
+            )
+
+        source_len = self.definition_lengths[source_index]
+        if self.has_definition[source_index] and source_len > 0:
+            lengths = self.definition_lengths
+            ratio = np.minimum(source_len, lengths) / np.maximum(source_len, lengths)
+            scores = scores + np.where(self.has_definition & (ratio >= 0.8), 0.1, 0.0)
+
+        return scores
+
+    def scores_as_candidate(self, candidate_index: int) -> np.ndarray:
+        """Heuristic score của topic candidate_index khi làm candidate cho từng topic"""
+        scores = np.where(
+            self.category_codes == self.category_codes[candidate_index], 0.3, 0.0
+        )
+
+        overlap_counts = self._title_overlap_counts(candidate_index)
+        has_overlap = overlap_counts > 0
+        overlap_ratio = np.divide(
+            overlap_counts,
+            self.title_token_counts,
+            out=np.zeros(len(overlap_counts)),
+            where=has_overlap,
+        )
+        scores = scores + np.where(
+            has_overlap, np.minimum(0.2, overlap_ratio * 0.3), 0.0
+        )
+
+        candidate_len = self.definition_lengths[candidate_index]
+        if self.has_definition[candidate_index]:
+            lengths = self.definition_lengths
+            valid = self.has_definition & (lengths > 0)
+            ratio = np.divide(
+                np.minimum(lengths, candidate_len),
+                np.maximum(lengths, candidate_len),
+                out=np.zeros(len(lengths)),
+                where=valid,
+            )
+            scores = scores + np.where(valid & (ratio >= 0.8), 0.1, 0.0)
+
+        return scores
+
+    def tfidf_scores(self, model: TfidfModel, topic_id: int) -> Optional[np.ndarray]:
+        """
+        Cosine similarity TF-IDF của topic_id với từng topic, theo thứ tự của features
+        (None nếu model không có topic_id)
+        """
+        if self._model is not model:
+            self._model_rows = np.array(
+                [model.row_of.get(other_id, -1) for other_id in self.index_of],
+                dtype=np.int64,
+            )
+            self._model = model
+
+        similarities = model.similarity_vector(topic_id)
+        if similarities is None:
+            return None
+        rows = self._model_rows
+        return np.where(rows >= 0, similarities[np.maximum(rows, 0)], 0.0)
 
 
 class RelatedTopicService:
@@ -33,8 +201,11 @@ class RelatedTopicService:
             stop_words="english",  # Có thể thêm stop words tiếng Việt sau
             lowercase=True,
         )
+        # Cache HeuristicFeatures theo danh sách topics đang dùng (VD: khi refresh
+        # toàn bộ bảng topic_similarity với cùng một all_topics)
+        self._features_cache: Optional[Tuple[List[ScoringTopic], HeuristicFeatures]] = None
 
-    def _prepare_text(self, topic: Topic) -> str:
+    def _prepare_text(self, topic: ScoringTopic) -> str:
         """
         Chuẩn bị text từ topic để xử lý TF-IDF.
         Kết hợp title và short_definition với trọng số khác nhau.
@@ -50,8 +221,20 @@ class RelatedTopicService:
         combined_text = f"{title_repeated} {definition_text}"
         return combined_text.strip()
 
+    def _get_tfidf_model(self, all_topics: List[ScoringTopic]) -> TfidfModel:
+        """Model TF-IDF đã fit sẵn, chỉ fit lại khi corpus thay đổi"""
+        return tfidf_model_store.get(
+            all_topics, self._prepare_text, self.vectorizer.fit_transform
+        )
+
+    def _get_heuristic_features(self, all_topics: List[ScoringTopic]) -> HeuristicFeatures:
+        """HeuristicFeatures của all_topics (tái sử dụng nếu vẫn là cùng danh sách)"""
+        if self._features_cache is None or self._features_cache[0] is not all_topics:
+            self._features_cache = (all_topics, HeuristicFeatures(all_topics))
+        return self._features_cache[1]
+
     def _calculate_tfidf_similarity(
-        self, source_topic: Topic, all_topics: List[Topic]
+        self, source_topic: ScoringTopic, all_topics: List[ScoringTopic]
     ) -> Dict[int, float]:
         """
         Tính độ tương đồng TF-IDF giữa source_topic và tất cả topics khác.
@@ -59,44 +242,30 @@ class RelatedTopicService:
         Returns:
             Dict mapping topic_id -> similarity_score (0-1)
         """
-        # Chuẩn bị corpus
-        corpus = [self._prepare_text(topic) for topic in all_topics]
-
-        # Tính TF-IDF matrix
-        tfidf_matrix = self.vectorizer.fit_transform(corpus)
+        model = self._get_tfidf_model(all_topics)
 
-        # Tìm index của source topic
+        # Tính cosine similarity (một phép nhân sparse row · matrix)
         source_topic_id: int = source_topic.id  # type: ignore
-        source_idx: Optional[int] = next(
-            (
-                i
-                for i, topic in enumerate(all_topics)
-                if topic.id == source_topic_id  # type: ignore
-            ),
-            None,
-        )
-
-        if source_idx is None:
-            return {}
-
-        # Tính cosine similarity
-        # type: ignore cho spmatrix indexing
-        similarities = cosine_similarity(
-            tfidf_matrix[source_idx : source_idx + 1],  # type: ignore
-            tfidf_matrix,
-        ).flatten()
+        return model.similarities(source_topic_id)
 
-        # Tạo dictionary mapping topic_id -> similarity_score
-        similarity_dict: Dict[int, float] = {}
-        for i, topic in enumerate(all_topics):
-            topic_id: int = topic.id  # type: ignore
-            if topic_id != source_topic_id:  # Loại trừ chính nó
-                similarity_dict[topic_id] = float(similarities[i])
+    def build_tfidf_model(self, topics: List[ScoringTopic]) -> TfidfModel:
+        """
+        Fit TF-IDF model cho toàn bộ topics và lưu ra disk (bước build offline).
 
-        return similarity_dict
+        Returns:
+            TfidfModel đã fit
+        """
+        ordered = sorted(topics, key=lambda topic: topic.id)
+        model = tfidf_model_store.build(
+            [topic.id for topic in ordered],
+            [self._prepare_text(topic) for topic in ordered],
+            self.vectorizer.fit_transform,
+        )
+        tfidf_model_store.save(model)
+        return model
 
     def _calculate_heuristic_score(
-        self, source_topic: Topic, candidate_topic: Topic
+        self, source_topic: ScoringTopic, candidate_topic: ScoringTopic
     ) -> float:
         """
         Tính điểm heuristic dựa trên các quy tắc (rules-based).
@@ -124,30 +293,8 @@ class RelatedTopicService:
         candidate_keywords = set(candidate_title.lower().split())
 
         # Loại bỏ stop words phổ biến
-        common_stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "của",
-            "và",
-            "là",
-            "có",
-            "trong",
-            "với",
-            "các",
-            "được",
-            "từ",
-        }
-        source_keywords -= common_stop_words
-        candidate_keywords -= common_stop_words
+        source_keywords -= TITLE_STOP_WORDS
+        candidate_keywords -= TITLE_STOP_WORDS
 
         if source_keywords & candidate_keywords:  # Có từ chung
             overlap_ratio = len(source_keywords & candidate_keywords) / len(
@@ -172,9 +319,47 @@ class RelatedTopicService:
 
         return score
 
+    def _combine_scores(self, tfidf_score: float, heuristic_score: float) -> float:
+        """Combined score: TF-IDF (70%) + Heuristic (30%), normalize về scale 0-1"""
+        return (tfidf_score * 0.7) + (heuristic_score * 0.5)
+
+    def score_as_candidate(
+        self, candidate_topic: ScoringTopic, all_topics: List[ScoringTopic]
+    ) -> Dict[int, float]:
+        """
+        Tính combined score của candidate_topic khi nó là candidate của từng topic khác.
+        Dùng để xác định những topic nào cần cập nhật danh sách related khi
+        candidate_topic thay đổi (cosine similarity là đối xứng).
+
+        Returns:
+            Dict mapping source topic_id -> combined score của candidate_topic
+        """
+        if len(all_topics) <= 1:
+            return {}
+
+        features = self._get_heuristic_features(all_topics)
+        candidate_topic_id: int = candidate_topic.id  # type: ignore
+        candidate_index = features.index_of.get(candidate_topic_id)
+        if candidate_index is None:
+            return {}
+
+        tfidf_scores = features.tfidf_scores(
+            self._get_tfidf_model(all_topics), candidate_topic_id
+        )
+        if tfidf_scores is None:
+            tfidf_scores = np.zeros(len(all_topics))
+        heuristic_scores = features.scores_as_candidate(candidate_index)
+        combined_scores = self._combine_scores(tfidf_scores, heuristic_scores)
+
+        return {
+            topic.id: float(combined_scores[i])  # type: ignore
+            for i, topic in enumerate(all_topics)
+            if i != candidate_index
+        }
+
     def find_related_topics(
-        self, source_topic: Topic, all_topics: List[Topic], top_n: int = 5
-    ) -> List[Tuple[Topic, float]]:
+        self, source_topic: ScoringTopic, all_topics: List[ScoringTopic], top_n: int = 5
+    ) -> List[Tuple[ScoringTopic, float]]:
         """
         Tìm top N topics liên quan nhất đến source_topic.
 
@@ -186,14 +371,53 @@ class RelatedTopicService:
         Returns:
             List of tuples (topic, combined_score) được sắp xếp theo điểm giảm dần
         """
+        related = self.score_related_topics(source_topic, all_topics, top_n)
+        if related is None:
+            return self._find_related_topics_loop(source_topic, all_topics, top_n)
+        return related
+
+    def score_related_topics(
+        self, source_topic: ScoringTopic, all_topics: List[ScoringTopic], top_n: int = 5
+    ) -> Optional[List[Tuple[ScoringTopic, float]]]:
+        """
+        Như find_related_topics nhưng trả về None khi không chấm được đầy đủ
+        (source_topic không nằm trong all_topics hoặc TF-IDF model không có source_topic,
+        VD: corpus đổi trong lúc tính), để caller không lưu kết quả thiếu.
+        """
         if len(all_topics) <= 1:
             return []
 
+        source_topic_id: int = source_topic.id  # type: ignore
+        features = self._get_heuristic_features(all_topics)
+        source_index = features.index_of.get(source_topic_id)
+        if source_index is None:
+            return None
+
+        # Bước 1: Tính TF-IDF similarity với tất cả topics
+        tfidf_scores = features.tfidf_scores(
+            self._get_tfidf_model(all_topics), source_topic_id
+        )
+        if tfidf_scores is None:
+            return None
+
+        # Bước 2: Tính heuristic + combined score cho mọi candidate trong một lượt vectorized
+        heuristic_scores = features.scores_for_source(source_index)
+        combined_scores = self._combine_scores(tfidf_scores, heuristic_scores)
+
+        # Bước 3: Sắp xếp giảm dần (stable, giữ thứ tự all_topics khi bằng điểm) và lấy top N
+        order = np.argsort(-combined_scores, kind="stable")
+        order = order[order != source_index][:top_n]  # Skip chính nó
+        return [(all_topics[i], float(combined_scores[i])) for i in order]
+
+    def _find_related_topics_loop(
+        self, source_topic: ScoringTopic, all_topics: List[ScoringTopic], top_n: int
+    ) -> List[Tuple[ScoringTopic, float]]:
+        """Tính từng candidate bằng vòng lặp (khi source_topic không nằm trong all_topics)"""
         # Bước 1: Tính TF-IDF similarity
         tfidf_scores = self._calculate_tfidf_similarity(source_topic, all_topics)
 
         # Bước 2: Tính combined score cho mỗi candidate
-        combined_scores: List[Tuple[Topic, float]] = []
+        combined_scores: List[Tuple[ScoringTopic, float]] = []
         source_topic_id: int = source_topic.id  # type: ignore
 
         for topic in all_topics:
@@ -207,9 +431,7 @@ class RelatedTopicService:
             # Heuristic score (0-0.6)
             heuristic_score = self._calculate_heuristic_score(source_topic, topic)
 
-            # Combined score: TF-IDF (70%) + Heuristic (30%)
-            # Normalize về scale 0-1
-            combined_score = (tfidf_score * 0.7) + (heuristic_score * 0.5)
+            combined_score = self._combine_scores(tfidf_score, heuristic_score)
 
             combined_scores.append((topic, combined_score))
 
@@ -218,7 +440,7 @@ class RelatedTopicService:
 
         return combined_scores[:top_n]
 
-    def get_topic_similarity_matrix(self, topics: List[Topic]) -> np.ndarray:
+    def get_topic_similarity_matrix(self, topics: List[ScoringTopic]) -> np.ndarray:
         """
         Tính ma trận tương đồng cho tất cả các topics.
         Hữu ích cho việc phân tích và visualization.
@@ -0,0 +1,170 @@
+"""
+Inverted index in-memory cho SearchService.
+
+Index giữ postings theo token (đã bỏ dấu tiếng Việt) và theo ký tự cho từng loại
+entity (topic, section, category). SearchService dùng index để chọn ra tập
+candidate IDs rồi chỉ chấm điểm các bản ghi đó, thay vì quét toàn bộ bảng.
+
+Tập candidate luôn là tập cha của mọi bản ghi có score > 0 theo
+calculate_relevance_score, nên kết quả search giữ nguyên như khi quét toàn bảng.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.search_index_interface import ISearchIndex
+from app.core.content_version import get_content_version, refresh_content_version
+from app.core.text_utils import stored_or_normalized
+from app.domain.models.category import Category
+from app.domain.models.section import Section
+from app.domain.models.topic import Topic
+
+# Nếu số candidate vượt quá tỷ lệ này so với tổng số bản ghi thì quét toàn bảng
+# sẽ rẻ hơn một câu IN (...) rất dài
+FULL_SCAN_RATIO = 0.5
+
+
+class _EntityPostings:
+    """Postings của một loại entity: token -> IDs và ký tự -> IDs"""
+
+    def __init__(self) -> None:
+        self.token_postings: Dict[str, Set[int]] = {}
+        self.char_postings: Dict[str, Set[int]] = {}
+        self.doc_count = 0
+
+    def add(self, doc_id: int, normalized_texts: Iterable[str]) -> None:
+        self.doc_count += 1
+        for normalized in normalized_texts:
+            for token in normalized.split():
+                self.token_postings.setdefault(token, set()).add(doc_id)
+            for char in set(normalized):
+                if not char.isspace():
+                    self.char_postings.setdefault(char, set()).add(doc_id)
+
+    def candidates(
+        self, query_normalized: str, keywords: List[str], query_words: List[str]
+    ) -> Set[int]:
+        """
+        Tập IDs có thể đạt score > 0.
+
+        - Keyword nằm trong một token hoặc token nằm trong keyword (tier 0.95/0.85/0.65)
+        - Token trùng với một từ của query (tier 0.6/0.5)
+        - Chứa đủ các ký tự của query (điều kiện cần cho contains/fuzzy: 1.0-0.7, 0.3)
+        """
+        result: Set[int] = set()
+
+        for token, doc_ids in self.token_postings.items():
+            for keyword in keywords:
+                if keyword in token or token in keyword:
+                    result |= doc_ids
+                    break
+
+        for word in query_words:
+            result |= self.token_postings.get(word, set())
+
+        chars = {c for c in query_normalized if not c.isspace()}
+        postings = sorted(
+            (self.char_postings.get(c, set()) for c in chars), key=len
+        )
+        if postings:
+            subsequence_candidates = set(postings[0])
+            for doc_ids in postings[1:]:
+                subsequence_candidates &= doc_ids
+                if not subsequence_candidates:
+                    break
+            result |= subsequence_candidates
+
+        return result
+
+
+class SearchIndex(ISearchIndex):
+    """
+    Inverted index cho topics (title, short_definition), sections (heading, content)
+    và categories (name, slug).
+
+    Index được build lazily và build lại khi content version thay đổi, kể cả do
+    instance khác ghi (xem app.core.content_version).
+    """
+
+    ENTITY_TYPES = ("topic", "section", "category")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._postings: Dict[str, _EntityPostings] = {}
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Build lại index nếu nội dung đã thay đổi kể từ lần build trước"""
+        refresh_content_version()
+        if self._version == get_content_version():
+            return
+        with self._lock:
+            version = get_content_version()
+            if self._version == version:
+                return
+            self._postings = self._build(db)
+            self._version = version
+
+    def invalidate(self) -> None:
+        """Đánh dấu index cần build lại ở lần search tiếp theo"""
+        self._version = None
+
+    def candidates(
+        self,
+        entity_type: str,
+        query_normalized: str,
+        keywords: List[str],
+        query_words: List[str],
+    ) -> Optional[Set[int]]:
+        """
+        Trả về tập candidate IDs cho entity_type.
+
+        Returns:
+            None nếu nên quét toàn bảng (index chưa build hoặc quá nhiều candidate)
+        """
+        postings = self._postings.get(entity_type)
+        if postings is None or not query_normalized.strip():
+            return None
+
+        ids = postings.candidates(query_normalized, keywords, query_words)
+        if len(ids) > postings.doc_count * FULL_SCAN_RATIO:
+            return None
+        return ids
+
+    def _build(self, db: Session) -> Dict[str, _EntityPostings]:
+        topics = _EntityPostings()
+        for topic_id, title, title_norm, short_definition, short_definition_norm in db.query(
+            Topic.id, Topic.title, Topic.title_norm,
+            Topic.short_definition, Topic.short_definition_norm,
+        ):
+            topics.add(topic_id, (
+                stored_or_normalized(title_norm, title),
+                stored_or_normalized(short_definition_norm, short_definition),
+            ))
+
+        sections = _EntityPostings()
+        for section_id, heading, heading_norm, content, content_norm in db.query(
+            Section.id, Section.heading, Section.heading_norm,
+            Section.content, Section.content_norm,
+        ):
+            sections.add(section_id, (
+                stored_or_normalized(heading_norm, heading),
+                stored_or_normalized(content_norm, content),
+            ))
+
+        categories = _EntityPostings()
+        for category_id, name, name_norm, slug, slug_norm in db.query(
+            Category.id, Category.name, Category.name_norm,
+            Category.slug, Category.slug_norm,
+        ):
+            categories.add(category_id, (
+                stored_or_normalized(name_norm, name),
+                stored_or_normalized(slug_norm, slug),
+            ))
+
+        return {"topic": topics, "section": sections, "category": categories}
+
+
+# Instance dùng chung trong process
+search_index = SearchIndex()
@@ -0,0 +1,102 @@
+"""
+Query search đã "biên dịch" sẵn cho SearchService.
+
+CompiledQuery được tạo một lần cho mỗi lần search: query đã bỏ dấu, danh sách
+keywords và tập từ của query được tính trước, nên score(text_norm) chỉ còn các
+phép so khớp trên text (đã bỏ dấu sẵn, VD: các cột *_norm) mà không chuẩn hóa
+lại query hay dựng lại tập stop words cho từng field của từng bản ghi.
+
+Điểm trả về giống hệt các tier của SearchService.calculate_relevance_score trước đây.
+"""
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple
+
+from app.core.constants import SEARCH_QUERY_CACHE_SIZE
+from app.core.text_utils import normalize_query
+
+# Stop words tiếng Việt phổ biến
+STOP_WORDS: FrozenSet[str] = frozenset({
+    'là', 'của', 'và', 'có', 'được', 'trong', 'để', 'một', 'các',
+    'này', 'cho', 'từ', 'với', 'những', 'thì', 'về', 'làm', 'sao',
+    'như', 'nào', 'thế', 'gì', 'ai', 'đâu', 'khi', 'bao', 'giờ',
+    'hiểu', 'học', 'tìm', 'biết', 'muốn', 'cần', 'the', 'a', 'an',
+    'to', 'of', 'in', 'on', 'at', 'for', 'is', 'are', 'was', 'were'
+})
+
+
+def extract_keywords(query_normalized: str) -> List[str]:
+    """
+    Trích xuất từ khóa từ query đã bỏ dấu: bỏ stop words và từ ngắn hơn 2 ký tự,
+    giữ nguyên query nếu không còn keyword nào
+    """
+    keywords = [w for w in query_normalized.split() if w not in STOP_WORDS and len(w) >= 2]
+    return keywords or [query_normalized]
+
+
+class CompiledQuery:
+    """
+    Query đã chuẩn hóa cùng keywords và tập từ, chấm điểm text đã bỏ dấu:
+    - Exact match: 1.0
+    - Starts with query: 0.9
+    - Contains query: 0.7
+    - Keyword là một từ của text: 0.95, keyword nằm trong text: 0.85
+    - Một từ của text nằm trong keyword: 0.65
+    - Text chứa mọi từ của query: 0.6
+    - Chứa một phần các từ của query: 0.5 * tỷ lệ
+    - Các ký tự của query xuất hiện theo thứ tự (fuzzy subsequence): 0.3
+    """
+
+    __slots__ = ("normalized", "keywords", "words", "word_set")
+
+    def __init__(self, query_normalized: str):
+        self.normalized = query_normalized
+        self.keywords: Tuple[str, ...] = tuple(extract_keywords(query_normalized))
+        self.words: List[str] = query_normalized.split()
+        self.word_set: FrozenSet[str] = frozenset(self.words)
+
+    @classmethod
+    def compile(cls, query: str) -> "CompiledQuery":
+        """CompiledQuery của query gốc (có dấu), memoize bằng LRU có giới hạn"""
+        return _compile(query)
+
+    def score(self, text_norm: str) -> float:
+        """Điểm relevance của text đã bỏ dấu + chữ thường"""
+        if not text_norm:
+            return 0.0
+
+        query_normalized = self.normalized
+        if text_norm == query_normalized:
+            return 1.0
+        if text_norm.startswith(query_normalized):
+            return 0.9
+        if query_normalized in text_norm:
+            return 0.7
+
+        text_words = set(text_norm.split())
+        for keyword in self.keywords:
+            if keyword in text_norm:
+                return 0.95 if keyword in text_words else 0.85
+            # keyword không nằm trong text nên cũng không nằm trong từ nào của text,
+            # chỉ còn trường hợp một từ của text nằm trong keyword
+            for word in text_words:
+                if word in keyword:
+                    return 0.65
+
+        if self.word_set <= text_words:
+            return 0.6
+
+        matching_words = text_words & self.word_set
+        if matching_words:
+            return 0.5 * (len(matching_words) / len(self.word_set))
+
+        # Fuzzy: `char in iterator` tiêu thụ iterator, tương đương so khớp tham lam từng ký tự
+        remaining = iter(text_norm)
+        if all(char in remaining for char in query_normalized):
+            return 0.3
+
+        return 0.0
+
+
+@lru_cache(maxsize=SEARCH_QUERY_CACHE_SIZE)
+def _compile(query: str) -> CompiledQuery:
+    return CompiledQuery(normalize_query(query))
@@ -0,0 +1,128 @@
+"""
+Cache kết quả search trong process: LRU + TTL, invalidate theo content version.
+
+Key là (query đã bỏ dấu, tag_ids đã sắp xếp, limit). Không dùng riêng tập keywords
+vì các tier exact/prefix/contains phụ thuộc cả query đã chuẩn hóa (VD: "the class"
+và "class" có cùng keywords nhưng điểm khác nhau). Các query chỉ khác dấu
+("Kế thừa" / "ke thua") dùng chung một entry; field `query` của response được
+trả lại đúng chuỗi của request.
+
+Mọi lần ghi nội dung (của process này, hoặc của instance khác phát hiện qua content
+stamp trong database, xem app.core.content_version) đều làm content version đổi, khi
+đó toàn bộ cache bị xóa ở lần đọc tiếp theo.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.application.services.search_query import CompiledQuery
+from app.core.content_version import get_content_version
+from app.domain.schemas.search_schema import SearchResponse
+
+SearchCacheKey = Tuple[str, Tuple[int, ...], int]
+
+
+class SearchResultCache:
+    """LRU + TTL cho SearchResponse, kèm số hit/miss cho metrics"""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[int] = None) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (expires_at, response)
+        self._entries: "OrderedDict[SearchCacheKey, Tuple[float, SearchResponse]]" = OrderedDict()
+        self._version = get_content_version()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is None:
+            from app.core.settings import get_settings
+
+            self._max_entries = get_settings().SEARCH_CACHE_MAX_ENTRIES
+        return self._max_entries
+
+    @property
+    def ttl(self) -> int:
+        if self._ttl is None:
+            from app.core.settings import get_settings
+
+            self._ttl = get_settings().SEARCH_CACHE_TTL_SECONDS
+        return self._ttl
+
+    @staticmethod
+    def make_key(query: str, limit: int, tag_ids: Optional[Iterable[int]]) -> SearchCacheKey:
+        return (CompiledQuery.compile(query).normalized, tuple(sorted(set(tag_ids or ()))), limit)
+
+    def get(self, query: str, limit: int, tag_ids: Optional[Iterable[int]]) -> Optional[SearchResponse]:
+        """SearchResponse đã cache (field query là của request này), None nếu miss"""
+        if self.max_entries <= 0 or self.ttl <= 0:
+            return None
+        key = self.make_key(query, limit, tag_ids)
+        with self._lock:
+            self._drop_if_stale()
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            response = entry[1]
+        if response.query == query:
+            return response
+        return response.model_copy(update={"query": query})
+
+    def put(
+        self,
+        query: str,
+        limit: int,
+        tag_ids: Optional[Iterable[int]],
+        response: SearchResponse,
+        version: int,
+    ) -> None:
+        """
+        Lưu kết quả đã tính với content version đọc được trước khi tính;
+        bỏ qua nếu đã có lần ghi xảy ra trong lúc tính
+        """
+        if self.max_entries <= 0 or self.ttl <= 0:
+            return
+        key = self.make_key(query, limit, tag_ids)
+        with self._lock:
+            self._drop_if_stale()
+            if version != self._version:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Kích thước và hit ratio của cache"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _drop_if_stale(self) -> None:
+        version = get_content_version()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+
+# Instance dùng chung trong process
+search_result_cache = SearchResultCache()
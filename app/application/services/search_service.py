@@ -1,72 +1,77 @@
 """
 Service xử lý tìm kiếm với fuzzy matching
 """
-import re
-import unicodedata
-from typing import List
+import heapq
+from operator import itemgetter
+from typing import AsyncIterator, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
 
-from app.domain.models.topic import Topic
-from app.domain.models.section import Section
-from app.domain.models.category import Category
+from app.application.interfaces.category_repository_interface import ICategoryRepository
+from app.application.interfaces.search_index_interface import ISearchIndex
+from app.application.interfaces.section_repository_interface import ISectionRepository
+from app.application.interfaces.topic_repository_interface import ITopicRepository
+from app.application.services.search_index import search_index
+from app.application.services.search_query import CompiledQuery, extract_keywords
+from app.application.services.search_result_cache import search_result_cache
+from app.application.services.suggestion_index import suggestion_index
+from app.core.content_version import (
+    content_version_check_due,
+    get_content_version,
+    refresh_content_version,
+)
+from app.core.text_utils import normalize_query, remove_vietnamese_tones, stored_or_normalized
+from app.domain.projections import CategorySearchRecord, SectionSearchRecord, TopicSearchRecord
 from app.domain.schemas.search_schema import (
     SearchResponse,
     TopicSearchResult,
     SectionSearchResult,
     CategorySearchResult,
+    SuggestResponse,
+    SuggestionItem,
 )
 
 
+T = TypeVar("T")
+SearchResultItem = Union[TopicSearchResult, SectionSearchResult, CategorySearchResult]
+
+
 class SearchService:
-    """Service xử lý tìm kiếm với fuzzy matching và scoring"""
+    """
+    Service xử lý tìm kiếm với fuzzy matching và scoring.
+    Đọc dữ liệu qua projection records của repositories (không hydrate ORM entities).
+    """
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        topic_repo: ITopicRepository,
+        section_repo: ISectionRepository,
+        category_repo: ICategoryRepository,
+        index: Optional[ISearchIndex] = None,
+    ):
         self.db = db
+        self.topic_repo = topic_repo
+        self.section_repo = section_repo
+        self.category_repo = category_repo
+        # Engine chọn candidate, mặc định là inverted index in-memory
+        self.index = index or search_index
 
     def remove_vietnamese_tones(self, text: str) -> str:
         """Loại bỏ dấu tiếng Việt để search linh hoạt hơn"""
-        if not text:
-            return ""
-        # Normalize và loại bỏ dấu
-        text = unicodedata.normalize('NFD', text)
-        text = re.sub(r'[\u0300-\u036f]', '', text)
-        # Xử lý đ/Đ
-        text = text.replace('đ', 'd').replace('Đ', 'D')
-        return text.lower()
+        return remove_vietnamese_tones(text)
 
     def extract_keywords(self, query: str) -> list[str]:
         """
         Trích xuất từ khóa quan trọng từ câu tìm kiếm.
         Loại bỏ stop words tiếng Việt và giữ lại từ có nghĩa.
         """
-        # Stop words tiếng Việt phổ biến
-        stop_words = {
-            'là', 'của', 'và', 'có', 'được', 'trong', 'để', 'một', 'các',
-            'này', 'cho', 'từ', 'với', 'những', 'thì', 'về', 'làm', 'sao',
-            'như', 'nào', 'thế', 'gì', 'ai', 'đâu', 'khi', 'bao', 'giờ',
-            'hiểu', 'học', 'tìm', 'biết', 'muốn', 'cần', 'the', 'a', 'an',
-            'to', 'of', 'in', 'on', 'at', 'for', 'is', 'are', 'was', 'were'
-        }
-        
-        # Loại bỏ dấu và chuyển thành chữ thường
-        normalized = self.remove_vietnamese_tones(query)
-        
-        # Tách thành từng từ
-        words = normalized.split()
-        
-        # Lọc bỏ stop words và giữ từ có độ dài >= 2
-        keywords = [w for w in words if w not in stop_words and len(w) >= 2]
-        
-        # Nếu không có keyword nào sau khi lọc, giữ nguyên query gốc
-        if not keywords:
-            keywords = [normalized]
-        
-        return keywords
+        return extract_keywords(normalize_query(query))
 
     def calculate_relevance_score(self, text: str, query: str) -> float:
         """
-        Tính điểm relevance dựa trên nhiều tiêu chí:
+        Tính điểm relevance dựa trên nhiều tiêu chí (xem CompiledQuery.score):
         - Exact match: 1.0
         - Starts with query: 0.9
         - Contains query: 0.7
@@ -74,64 +79,18 @@ class SearchService:
         - Fuzzy match: 0.5
         - Partial word match: 0.3
         """
-        if not text or not query:
+        if not text:
             return 0.0
+        return self.score_normalized(self.remove_vietnamese_tones(text), query)
 
-        text_normalized = self.remove_vietnamese_tones(text)
-        query_normalized = self.remove_vietnamese_tones(query)
-
-        # Exact match
-        if text_normalized == query_normalized:
-            return 1.0
-
-        # Starts with
-        if text_normalized.startswith(query_normalized):
-            return 0.9
-
-        # Contains exact query
-        if query_normalized in text_normalized:
-            return 0.7
-
-        # Extract keywords from query
-        keywords = self.extract_keywords(query)
-        
-        # Check if any keyword appears in text (case insensitive)
-        text_words = set(text_normalized.split())
-        for keyword in keywords:
-            # Exact keyword match trong text
-            if keyword in text_normalized:
-                # Nếu keyword match toàn bộ một từ trong text -> điểm cao nhất
-                text_words_list = text_normalized.split()
-                if keyword in text_words_list:
-                    return 0.95  # Exact word match
-                return 0.85  # Keyword contained in text
-            
-            # Check if keyword matches any word in text
-            for word in text_words:
-                if keyword in word or word in keyword:
-                    return 0.65
-
-        # Word-level matching
-        query_words = set(query_normalized.split())
-        
-        if query_words.issubset(text_words):
-            return 0.6
-
-        # Partial word match
-        matching_words = text_words.intersection(query_words)
-        if matching_words:
-            return 0.5 * (len(matching_words) / len(query_words))
-
-        # Fuzzy sequential character matching
-        query_index = 0
-        for char in text_normalized:
-            if query_index < len(query_normalized) and char == query_normalized[query_index]:
-                query_index += 1
-
-        if query_index == len(query_normalized):
-            return 0.3
-
-        return 0.0
+    def score_normalized(self, text_normalized: str, query: str) -> float:
+        """
+        Như calculate_relevance_score nhưng nhận text đã bỏ dấu sẵn
+        (VD: các cột *_norm lưu trong database)
+        """
+        if not query:
+            return 0.0
+        return CompiledQuery.compile(query).score(text_normalized)
 
     def search(self, query: str, limit: int = 20, tag_ids: list[int] = None) -> SearchResponse:
         """
@@ -145,112 +104,245 @@ class SearchService:
         Returns:
             SearchResponse chứa kết quả tìm kiếm được sắp xếp theo độ liên quan
         """
+        refresh_content_version()
+        cached = search_result_cache.get(query, limit, tag_ids)
+        if cached is not None:
+            return cached
+        return self.search_uncached(query, limit, tag_ids)
+
+    def search_uncached(self, query: str, limit: int = 20, tag_ids: list[int] = None) -> SearchResponse:
+        """Chạy search (bỏ qua bước đọc cache) rồi lưu kết quả vào search_result_cache"""
         if not query or not query.strip():
             return SearchResponse(query=query, total_results=0)
 
-        query_normalized = self.remove_vietnamese_tones(query)
-        query_words = query_normalized.split()
+        # Đọc version trước khi query để kết quả tính trên dữ liệu cũ không được lưu
+        version = refresh_content_version()
+        topics_results: List[TopicSearchResult] = []
+        sections_results: List[SectionSearchResult] = []
+        categories_results: List[CategorySearchResult] = []
+        results_by_kind = {
+            "topic": topics_results,
+            "section": sections_results,
+            "category": categories_results,
+        }
+        for phase in self.search_phases(query, limit, tag_ids):
+            for kind, item in phase:
+                results_by_kind[kind].append(item)
+
+        total = len(topics_results) + len(sections_results) + len(categories_results)
+
+        response = SearchResponse(
+            query=query,
+            total_results=total,
+            topics=topics_results,
+            sections=sections_results,
+            categories=categories_results,
+        )
+        search_result_cache.put(query, limit, tag_ids, response, version)
+        return response
+
+    def search_phases(
+        self, query: str, limit: int = 20, tag_ids: list[int] = None
+    ) -> Iterator[List[Tuple[str, SearchResultItem]]]:
+        """
+        Chạy search theo từng giai đoạn, mỗi giai đoạn trả về các kết quả cuối cùng
+        (đã xếp hạng, đã cắt theo limit) của một loại entity dưới dạng (kind, item):
+        1. "topic": chỉ chấm title + short_definition nên nhanh, các hit exact/prefix đứng đầu
+        2. "category"
+        3. "section": chấm cả content, chậm nhất nên đi sau cùng
+
+        Query database của mỗi giai đoạn chỉ chạy khi giai đoạn đó được lấy ra,
+        nên caller (VD: endpoint streaming) gửi được kết quả sớm.
+        """
+        if not query or not query.strip():
+            return
+
+        # Chuẩn hóa query, tách keywords một lần cho cả lần search
+        compiled = CompiledQuery.compile(query)
+        score = compiled.score
+        keywords = list(compiled.keywords)
+
+        # Chỉ chấm điểm các candidate do search index trả về
+        self.index.ensure_fresh(self.db)
 
         # Search Topics
-        topics_results = []
-        topics_query = self.db.query(Topic)
-        
-        # Filter by tags if provided
-        if tag_ids:
-            from app.domain.models.tag import topic_tags
-            topics_query = topics_query.join(topic_tags).filter(topic_tags.c.tag_id.in_(tag_ids))
-        
-        topics = topics_query.all()
-        
+        topic_ids = self.index.candidates("topic", compiled.normalized, keywords, compiled.words)
+        # Filter by tags if provided (lọc ngay trong query của repository)
+        topics = self.topic_repo.get_search_records(topic_ids, tag_ids) if topic_ids != set() else []
+        # Heap giới hạn ở limit; chỉ tạo Pydantic objects cho các kết quả được giữ lại
+        yield [
+            ("topic", self._topic_result(topic, max_score))
+            for max_score, topic in self._top_k(self._score_topics(topics, score), limit)
+        ]
+
+        # Search Categories
+        category_ids = self.index.candidates("category", compiled.normalized, keywords, compiled.words)
+        categories = self.category_repo.get_search_records(category_ids) if category_ids != set() else []
+        matched_categories = self._top_k(self._score_categories(categories, score), limit)
+
+        # Đếm topics của các category được giữ lại bằng một query GROUP BY thay vì load category.topics
+        topic_counts = self.topic_repo.count_by_category(category.id for _, category in matched_categories)
+        yield [
+            ("category", self._category_result(category, max_score, topic_counts.get(category.id, 0)))
+            for max_score, category in matched_categories
+        ]
+
+        # Search Sections
+        section_ids = self.index.candidates("section", compiled.normalized, keywords, compiled.words)
+        # Title của topic đi kèm trong record (JOIN), không lazy load section.topic
+        sections = self.section_repo.get_search_records(section_ids) if section_ids != set() else []
+        yield [
+            ("section", self._section_result(section, max_score))
+            for max_score, section in self._top_k(self._score_sections(sections, score), limit)
+        ]
+
+    @staticmethod
+    def _top_k(scored: Iterable[Tuple[float, T]], limit: int) -> List[Tuple[float, T]]:
+        """
+        limit bản ghi điểm cao nhất; heapq.nlargest tương đương sort ổn định rồi cắt,
+        nên bản ghi cùng điểm giữ thứ tự đầu vào (theo id)
+        """
+        return heapq.nlargest(limit, scored, key=itemgetter(0))
+
+    @staticmethod
+    def _score_topics(
+        topics: Iterable[TopicSearchRecord], score: Callable[[str], float]
+    ) -> Iterator[Tuple[float, TopicSearchRecord]]:
         for topic in topics:
             # Calculate score based on title and definition
-            title_score = self.calculate_relevance_score(topic.title, query)
-            def_score = self.calculate_relevance_score(topic.short_definition or "", query)
-            
+            title_score = score(stored_or_normalized(topic.title_norm, topic.title))
+            def_score = score(stored_or_normalized(topic.short_definition_norm, topic.short_definition))
+
             # Combined score: title có trọng số cao hơn (60%), definition (50%)
             # Nhưng nếu definition có điểm cao thì vẫn được ưu tiên
-            combined_score = max(title_score, def_score * 0.95)
-            max_score = combined_score
-            
+            max_score = max(title_score, def_score * 0.95)
+
             if max_score > 0.15:  # Threshold - giảm xuống để dễ tìm hơn
-                category_name = topic.category.name if topic.category else ""
-                topics_results.append(
-                    TopicSearchResult(
-                        id=topic.id,
-                        title=topic.title,
-                        short_definition=topic.short_definition,
-                        category_id=topic.category_id,
-                        category_name=category_name,
-                        created_at=topic.created_at,
-                        score=max_score,
-                    )
-                )
-
-        # Sort by score and limit
-        topics_results.sort(key=lambda x: x.score, reverse=True)
-        topics_results = topics_results[:limit]
+                yield max_score, topic
 
-        # Search Sections
-        sections_results = []
-        sections = self.db.query(Section).all()
-        
+    @staticmethod
+    def _score_sections(
+        sections: Iterable[SectionSearchRecord], score: Callable[[str], float]
+    ) -> Iterator[Tuple[float, SectionSearchRecord]]:
         for section in sections:
-            heading_score = self.calculate_relevance_score(section.heading or "", query)
-            content_score = self.calculate_relevance_score(section.content or "", query) * 0.6
-            
+            heading_score = score(stored_or_normalized(section.heading_norm, section.heading))
+            content_score = score(stored_or_normalized(section.content_norm, section.content)) * 0.6
+
             max_score = max(heading_score, content_score)
-            
+
             if max_score > 0.15:
-                topic_title = section.topic.title if section.topic else ""
-                content_preview = (section.content[:200] + "...") if section.content and len(section.content) > 200 else section.content
-                
-                sections_results.append(
-                    SectionSearchResult(
-                        id=section.id,
-                        title=section.heading or "",
-                        heading=section.heading or "",
-                        topic_id=section.topic_id,
-                        topic_title=topic_title,
-                        content_preview=content_preview,
-                        score=max_score,
-                    )
-                )
-
-        sections_results.sort(key=lambda x: x.score, reverse=True)
-        sections_results = sections_results[:limit]
+                yield max_score, section
 
-        # Search Categories
-        categories_results = []
-        categories = self.db.query(Category).all()
-        
+    @staticmethod
+    def _score_categories(
+        categories: Iterable[CategorySearchRecord], score: Callable[[str], float]
+    ) -> Iterator[Tuple[float, CategorySearchRecord]]:
         for category in categories:
-            name_score = self.calculate_relevance_score(category.name, query)
-            slug_score = self.calculate_relevance_score(category.slug or "", query) * 0.5
-            
+            name_score = score(stored_or_normalized(category.name_norm, category.name))
+            slug_score = score(stored_or_normalized(category.slug_norm, category.slug)) * 0.5
+
             max_score = max(name_score, slug_score)
-            
+
             if max_score > 0.15:
-                topic_count = len(category.topics) if category.topics else 0
-                
-                categories_results.append(
-                    CategorySearchResult(
-                        id=category.id,
-                        title=category.name,
-                        description=None,  # Category không có description field
-                        topic_count=topic_count,
-                        score=max_score,
-                    )
-                )
-
-        categories_results.sort(key=lambda x: x.score, reverse=True)
-        categories_results = categories_results[:limit]
+                yield max_score, category
 
-        total = len(topics_results) + len(sections_results) + len(categories_results)
+    @staticmethod
+    def _topic_result(topic: TopicSearchRecord, max_score: float) -> TopicSearchResult:
+        return TopicSearchResult(
+            id=topic.id,
+            title=topic.title,
+            short_definition=topic.short_definition,
+            category_id=topic.category_id,
+            category_name=topic.category_name or "",
+            created_at=topic.created_at,
+            score=max_score,
+        )
+
+    @staticmethod
+    def _section_result(section: SectionSearchRecord, max_score: float) -> SectionSearchResult:
+        content_preview = (section.content[:200] + "...") if section.content and len(section.content) > 200 else section.content
+        return SectionSearchResult(
+            id=section.id,
+            title=section.heading or "",
+            heading=section.heading or "",
+            topic_id=section.topic_id,
+            topic_title=section.topic_title or "",
+            content_preview=content_preview,
+            score=max_score,
+        )
+
+    @staticmethod
+    def _category_result(
+        category: CategorySearchRecord, max_score: float, topic_count: int
+    ) -> CategorySearchResult:
+        return CategorySearchResult(
+            id=category.id,
+            title=category.name,
+            description=None,  # Category không có description field
+            topic_count=topic_count,
+            score=max_score,
+        )
 
-        return SearchResponse(
+class AsyncSearchService:
+    """
+    Adapter async cho SearchService dùng trong các endpoint async def.
+
+    Cache hit trả về ngay trên event loop. Phần còn lại (query database, build
+    index, chấm điểm CPU-bound) chạy trong threadpool trên sync Session, nên
+    không block event loop và lock của các index chỉ được giữ trong worker thread.
+    """
+
+    def __init__(self, service: SearchService):
+        """
+        Args:
+            service: SearchService trên sync Session của request
+        """
+        self.service = service
+
+    async def search(self, query: str, limit: int = 20, tag_ids: list[int] = None) -> SearchResponse:
+        """Tìm kiếm topics, sections, categories (xem SearchService.search)"""
+        # Cache hit trả về ngay, không cần chuyển sang worker thread
+        # (trừ khi đến lượt đọc lại content stamp từ database)
+        if content_version_check_due():
+            await run_in_threadpool(refresh_content_version)
+        cached = search_result_cache.get(query, limit, tag_ids)
+        if cached is not None:
+            return cached
+        return await run_in_threadpool(self.service.search_uncached, query, limit, tag_ids)
+
+    async def suggest(self, query: str, limit: int = 10) -> SuggestResponse:
+        """
+        Gợi ý autocomplete từ prefix index in-memory; database chỉ được đọc
+        (trong worker thread) khi index chưa build hoặc đến lượt đọc lại content stamp
+        """
+        if content_version_check_due() or not suggestion_index.is_loaded:
+            await run_in_threadpool(suggestion_index.ensure_loaded, self.service.db)
+        return SuggestResponse(
             query=query,
-            total_results=total,
-            topics=topics_results,
-            sections=sections_results,
-            categories=categories_results,
+            suggestions=[
+                SuggestionItem(type=suggestion.kind, id=suggestion.id, label=suggestion.label)
+                for suggestion in suggestion_index.suggest(query, limit)
+            ],
         )
+
+    async def search_stream(
+        self, query: str, limit: int = 20, tag_ids: list[int] = None
+    ) -> AsyncIterator[Tuple[str, SearchResultItem]]:
+        """
+        Trả về kết quả (kind, item) theo từng giai đoạn của SearchService.search_phases.
+        Mỗi giai đoạn (query + chấm điểm) chạy trong worker thread, nên event loop
+        không bị chiếm và kết quả của giai đoạn trước được trả ra trước khi giai
+        đoạn sau bắt đầu query.
+        """
+        phases = self.service.search_phases(query, limit, tag_ids)
+        try:
+            while True:
+                phase = await run_in_threadpool(next, phases, None)
+                if phase is None:
+                    return
+                for result in phase:
+                    yield result
+        finally:
+            # Client ngắt kết nối giữa chừng: generator đang dừng ở yield (run_in_threadpool
+            # chờ worker thread xong kể cả khi bị cancel), close() không chạy query nào
+            phases.close()
@@ -1,8 +1,13 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
+from app.core.pagination import build_page, clamp_page_size, decode_cursor
 from app.domain.models import Section, Topic
 from app.domain.schemas.section_schema import SectionCreate, SectionUpdate, SectionResponse
-from app.application.interfaces.section_repository_interface import ISectionRepository
+from app.application.interfaces.content_change_handler_interface import IContentChangeHandler
+from app.application.interfaces.section_repository_interface import (
+    IAsyncSectionRepository,
+    ISectionRepository,
+)
 
 class SectionService:
     """
@@ -10,16 +15,23 @@ class SectionService:
     Áp dụng Dependency Inversion: phụ thuộc vào ISectionRepository interface thay vì concrete class.
     """
     
-    def __init__(self, section_repository: ISectionRepository, topic_repository=None):
+    def __init__(
+        self,
+        section_repository: ISectionRepository,
+        topic_repository=None,
+        changes: Optional[IContentChangeHandler] = None,
+    ):
         """
         Khởi tạo service với repository dependency.
         
         Args:
             section_repository: Implementation của ISectionRepository
             topic_repository: Optional - để validate topic_id
+            changes: Optional - tác dụng phụ sau mỗi lần ghi (cache, snapshot, index)
         """
         self.section_repository = section_repository
         self.topic_repository = topic_repository
+        self.changes = changes
     
     def create_section(self, section_data: SectionCreate) -> SectionResponse:
         """
@@ -56,6 +68,8 @@ class SectionService:
         
         # Lưu vào database
         created_section = self.section_repository.create(section)
+        if self.changes:
+            self.changes.sections_changed([created_section.topic_id])
         
         # Convert sang response schema
         return SectionResponse.model_validate(created_section)
@@ -142,9 +156,12 @@ class SectionService:
         
         # Chỉ lấy các field không None để cập nhật
         update_data = section_data.model_dump(exclude_unset=True)
+        old_topic_id = existing_section.topic_id
         
         # Cập nhật trong database
         updated_section = self.section_repository.update(section_id, update_data)
+        if self.changes:
+            self.changes.sections_changed([old_topic_id, updated_section.topic_id])
         
         return SectionResponse.model_validate(updated_section)
     
@@ -161,11 +178,61 @@ class SectionService:
         Raises:
             HTTPException: Nếu Section không tồn tại
         """
-        success = self.section_repository.delete(section_id)
+        section = self.section_repository.get_by_id(section_id)
+        success = section is not None and self.section_repository.delete(section_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Section with id {section_id} not found"
             )
+        if self.changes:
+            self.changes.sections_changed([section.topic_id])
         
         return {"message": f"Section with id {section_id} deleted successfully"}
+
+
+class AsyncSectionService:
+    """
+    Service async cho các thao tác đọc Section, chạy trực tiếp trên event loop.
+    Phụ thuộc vào IAsyncSectionRepository interface.
+    """
+
+    def __init__(self, section_repository: IAsyncSectionRepository):
+        self.section_repository = section_repository
+
+    async def get_section_by_id(self, section_id: int) -> SectionResponse:
+        """
+        Lấy Section theo ID.
+
+        Raises:
+            HTTPException: Nếu Section không tồn tại
+        """
+        section = await self.section_repository.get_by_id(section_id)
+        if not section:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Section with id {section_id} not found"
+            )
+
+        return SectionResponse.model_validate(section)
+
+    async def get_all_sections(self, skip: int = 0, limit: int = 100) -> List[SectionResponse]:
+        """Lấy danh sách tất cả Sections với phân trang"""
+        sections = await self.section_repository.get_all(skip=skip, limit=limit)
+        return [SectionResponse.model_validate(section) for section in sections]
+
+    async def get_sections_page(
+        self, cursor: Optional[str], limit: int
+    ) -> Tuple[List[SectionResponse], Optional[str]]:
+        """Lấy một trang Sections theo cursor, trả về (sections, next_cursor)"""
+        limit = clamp_page_size(limit)
+        sections = await self.section_repository.get_page_after(decode_cursor(cursor, 3), limit + 1)
+        page, next_cursor = build_page(
+            sections, limit, key=lambda section: (section.topic_id, section.order_index, section.id)
+        )
+        return [SectionResponse.model_validate(section) for section in page], next_cursor
+
+    async def get_sections_by_topic(self, topic_id: int) -> List[SectionResponse]:
+        """Lấy tất cả Sections thuộc về một Topic, sắp xếp theo order_index"""
+        sections = await self.section_repository.get_by_topic_id(topic_id)
+        return [SectionResponse.model_validate(section) for section in sections]
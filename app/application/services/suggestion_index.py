@@ -0,0 +1,196 @@
+"""
+Prefix index in-memory cho autocomplete (GET /api/v1/search/suggest).
+
+Index gồm các mảng đã sắp xếp các khóa (text đã bỏ dấu, kind, id), tra cứu prefix
+bằng bisect. Mỗi topic title, tag name và category name có một khóa cho mỗi vị trí
+bắt đầu từ, nên "thua" gợi ý được cả "Kế thừa".
+
+Index được build lazily một lần; sau đó ContentChangeHandler cập nhật từng bản ghi
+(upsert/remove) sau mỗi lần ghi của process này thay vì build lại toàn bộ. Lần ghi
+của instance khác (phát hiện qua content stamp trong database, xem
+app.core.content_version) làm index được build lại ở lần dùng tiếp theo.
+"""
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.content_version import get_external_content_version, refresh_content_version
+from app.core.text_utils import normalize_query, remove_vietnamese_tones
+from app.domain.models.category import Category
+from app.domain.models.tag import Tag
+from app.domain.models.topic import Topic
+
+# Thứ tự ưu tiên khi các bản ghi khác loại có cùng khóa
+SUGGESTION_KINDS = ("topic", "category", "tag")
+
+
+class Suggestion(NamedTuple):
+    """Một gợi ý autocomplete"""
+
+    kind: str
+    id: int
+    label: str
+
+
+def _prefix_keys(normalized: str) -> List[str]:
+    """Các hậu tố bắt đầu tại đầu mỗi từ: "ke thua" -> ["ke thua", "thua"]"""
+    keys = []
+    previous = " "
+    for position, char in enumerate(normalized):
+        if previous.isspace() and not char.isspace():
+            keys.append(normalized[position:])
+        previous = char
+    return keys
+
+
+class SuggestionIndex:
+    """
+    Hai mảng sắp xếp (key, kind_rank, id): khóa của cả label và khóa bắt đầu từ các
+    từ phía sau. Tra cứu là hai lần bisect + tối đa limit bước, an toàn giữa các thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loaded = False
+        # get_external_content_version() lúc build
+        self._version: Optional[int] = None
+        # Tăng mỗi lần ghi, để biết bản build có bỏ sót lần ghi nào trong lúc query không
+        self._generation = 0
+        self._label_keys: List[Tuple[str, int, int]] = []
+        self._word_keys: List[Tuple[str, int, int]] = []
+        # (kind_rank, id) -> (label, các khóa đã thêm vào index)
+        self._entries: Dict[Tuple[int, int], Tuple[str, List[str]]] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        """Đã build và không có lần ghi nào từ instance khác kể từ lúc build"""
+        return self._loaded and self._version == get_external_content_version()
+
+    def ensure_loaded(self, db: Session) -> None:
+        """
+        Build index từ database ở lần dùng đầu tiên (hoặc sau invalidate, hoặc khi
+        instance khác đã ghi nội dung).
+        Query chạy ngoài lock, lock chỉ giữ lúc thay các mảng. Nếu có lần ghi
+        (upsert/remove/invalidate) trong lúc query thì bản build vẫn được dùng
+        nhưng chưa đánh dấu loaded, lần gọi sau build lại.
+        """
+        refresh_content_version()
+        if self.is_loaded:
+            return
+        with self._lock:
+            generation = self._generation
+            version = get_external_content_version()
+        label_keys: List[Tuple[str, int, int]] = []
+        word_keys: List[Tuple[str, int, int]] = []
+        entries: Dict[Tuple[int, int], Tuple[str, List[str]]] = {}
+        sources = (
+            ("topic", db.query(Topic.id, Topic.title)),
+            ("category", db.query(Category.id, Category.name)),
+            ("tag", db.query(Tag.id, Tag.name)),
+        )
+        for kind, rows in sources:
+            rank = SUGGESTION_KINDS.index(kind)
+            for item_id, label in rows:
+                keys = _label_keys(label)
+                entries[(rank, item_id)] = (label or "", keys)
+                label_keys.append((keys[0], rank, item_id))
+                word_keys.extend((key, rank, item_id) for key in keys[1:])
+        label_keys.sort()
+        word_keys.sort()
+        with self._lock:
+            if self.is_loaded:
+                return
+            self._label_keys = label_keys
+            self._word_keys = word_keys
+            self._entries = entries
+            self._version = version
+            self._loaded = generation == self._generation
+
+    def invalidate(self) -> None:
+        """Build lại toàn bộ ở lần dùng tiếp theo"""
+        with self._lock:
+            self._generation += 1
+            self._loaded = False
+
+    def upsert(self, kind: str, item_id: int, label: str) -> None:
+        """Thêm hoặc cập nhật label của một bản ghi (bỏ qua nếu index chưa build)"""
+        with self._lock:
+            self._generation += 1
+            if not self._loaded:
+                return
+            rank = SUGGESTION_KINDS.index(kind)
+            self._unregister(rank, item_id)
+            keys = self._register(rank, item_id, label)
+            insort(self._label_keys, (keys[0], rank, item_id))
+            for key in keys[1:]:
+                insort(self._word_keys, (key, rank, item_id))
+
+    def remove(self, kind: str, item_id: int) -> None:
+        """Xóa một bản ghi khỏi index"""
+        with self._lock:
+            self._generation += 1
+            if self._loaded:
+                self._unregister(SUGGESTION_KINDS.index(kind), item_id)
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Suggestion]:
+        """
+        Các bản ghi có label bắt đầu bằng prefix (đã bỏ dấu), sau đó các bản ghi có
+        một từ phía sau bắt đầu bằng prefix; mỗi nhóm theo thứ tự khóa
+
+        Args:
+            prefix: Chuỗi người dùng đang gõ
+            limit: Số gợi ý tối đa
+        """
+        normalized = " ".join(normalize_query(prefix).split())
+        if not normalized:
+            return []
+
+        suggestions: List[Suggestion] = []
+        seen = set()
+        with self._lock:
+            for keys in (self._label_keys, self._word_keys):
+                position = bisect_left(keys, (normalized,))
+                while position < len(keys) and len(suggestions) < limit:
+                    key, rank, item_id = keys[position]
+                    if not key.startswith(normalized):
+                        break
+                    position += 1
+                    if (rank, item_id) in seen:
+                        continue
+                    seen.add((rank, item_id))
+                    suggestions.append(
+                        Suggestion(SUGGESTION_KINDS[rank], item_id, self._entries[(rank, item_id)][0])
+                    )
+        return suggestions
+
+    def _register(self, rank: int, item_id: int, label: Optional[str]) -> List[str]:
+        keys = _label_keys(label)
+        self._entries[(rank, item_id)] = (label or "", keys)
+        return keys
+
+    def _unregister(self, rank: int, item_id: int) -> None:
+        entry = self._entries.pop((rank, item_id), None)
+        if entry is None:
+            return
+        keys = entry[1]
+        _discard(self._label_keys, (keys[0], rank, item_id))
+        for key in keys[1:]:
+            _discard(self._word_keys, (key, rank, item_id))
+
+
+def _label_keys(label: Optional[str]) -> List[str]:
+    """Các khóa của label: khóa đầu là cả label đã bỏ dấu, sau đó là khóa của các từ phía sau"""
+    normalized = " ".join(remove_vietnamese_tones(label or "").split())
+    return _prefix_keys(normalized) or [""]
+
+
+def _discard(keys: List[Tuple[str, int, int]], entry: Tuple[str, int, int]) -> None:
+    position = bisect_left(keys, entry)
+    if position < len(keys) and keys[position] == entry:
+        del keys[position]
+
+
+# Instance dùng chung trong process
+suggestion_index = SuggestionIndex()
@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
+from app.application.interfaces.content_change_handler_interface import IContentChangeHandler
 from app.application.interfaces.tag_repository_interface import ITagRepository
+from app.core.pagination import build_page, clamp_page_size, decode_cursor
 from app.domain.schemas.tag_schema import TagCreate, TagUpdate, TagResponse, TagWithTopics
 
 
@@ -10,23 +12,46 @@ class TagService:
     Áp dụng Dependency Inversion: phụ thuộc vào ITagRepository interface.
     """
 
-    def __init__(self, tag_repo: ITagRepository):
+    def __init__(self, tag_repo: ITagRepository, changes: Optional[IContentChangeHandler] = None):
+        """
+        Args:
+            tag_repo: Implementation của ITagRepository
+            changes: Optional - tác dụng phụ sau mỗi lần ghi (cache, snapshot, index)
+        """
         self.tag_repo = tag_repo
+        self.changes = changes
 
     def get_all_tags(self, skip: int = 0, limit: int = 100) -> List[TagResponse]:
         """Lấy tất cả tags"""
-        tags = self.tag_repo.get_all(skip, limit)
+        results = self.tag_repo.get_all_with_counts(skip, limit)
         return [
             TagResponse(
                 id=tag.id,
                 name=tag.name,
                 slug=tag.slug,
                 description=tag.description,
-                topic_count=len(tag.topics) if tag.topics else 0
+                topic_count=count
             )
-            for tag in tags
+            for tag, count in results
         ]
 
+    def get_tags_page(self, cursor: Optional[str], limit: int) -> Tuple[List[TagResponse], Optional[str]]:
+        """Lấy một trang tags theo cursor, trả về (tags, next_cursor)"""
+        limit = clamp_page_size(limit)
+        after = decode_cursor(cursor, 1)
+        results = self.tag_repo.get_page_after(after[0] if after else None, limit + 1)
+        page, next_cursor = build_page(results, limit, key=lambda row: (row[0].id,))
+        return [
+            TagResponse(
+                id=tag.id,
+                name=tag.name,
+                slug=tag.slug,
+                description=tag.description,
+                topic_count=count
+            )
+            for tag, count in page
+        ], next_cursor
+
     def get_tag_by_id(self, tag_id: int) -> TagWithTopics:
         """Lấy tag theo ID kèm topic IDs"""
         tag = self.tag_repo.get_by_id(tag_id)
@@ -36,13 +61,14 @@ class TagService:
                 detail=f"Tag với ID {tag_id} không tồn tại"
             )
 
+        topic_ids = self.tag_repo.get_topic_ids(tag_id)
         return TagWithTopics(
             id=tag.id,
             name=tag.name,
             slug=tag.slug,
             description=tag.description,
-            topic_count=len(tag.topics) if tag.topics else 0,
-            topic_ids=[t.id for t in tag.topics] if tag.topics else []
+            topic_count=len(topic_ids),
+            topic_ids=topic_ids
         )
 
     def create_tag(self, tag_data: TagCreate) -> TagResponse:
@@ -56,6 +82,8 @@ class TagService:
             )
 
         tag = self.tag_repo.create(tag_data)
+        if self.changes:
+            self.changes.tag_saved(tag.id, tag.name, [])
         return TagResponse(
             id=tag.id,
             name=tag.name,
@@ -73,22 +101,29 @@ class TagService:
                 detail=f"Tag với ID {tag_id} không tồn tại"
             )
 
+        topic_ids = self.tag_repo.get_topic_ids(tag.id)
+        if self.changes:
+            self.changes.tag_saved(tag.id, tag.name, topic_ids)
         return TagResponse(
             id=tag.id,
             name=tag.name,
             slug=tag.slug,
             description=tag.description,
-            topic_count=len(tag.topics) if tag.topics else 0
+            topic_count=len(topic_ids)
         )
 
     def delete_tag(self, tag_id: int) -> bool:
         """Xóa tag"""
+        # Đọc trước khi xóa: liên kết topic_tags mất cùng tag
+        topic_ids = self.tag_repo.get_topic_ids(tag_id)
         success = self.tag_repo.delete(tag_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Tag với ID {tag_id} không tồn tại"
             )
+        if self.changes:
+            self.changes.tag_deleted(tag_id, topic_ids)
         return True
 
     def get_popular_tags(self, limit: int = 10) -> List[TagResponse]:
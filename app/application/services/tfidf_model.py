@@ -0,0 +1,298 @@
+"""
+TF-IDF model đã fit sẵn cho related topics.
+
+Model gồm ma trận TF-IDF (CSR) của toàn bộ topics và mapping topic_id -> row.
+Model được lưu ra disk dưới dạng các file .npy (data, indices, indptr, topic_ids)
+để có thể load bằng mmap khi khởi động, nên mỗi request related topics chỉ còn
+là một phép nhân sparse row · matrix thay vì fit lại vectorizer.
+
+Mỗi lần lưu ghi vào một thư mục con mới của TFIDF_MODEL_DIR, file CURRENT trỏ tới
+thư mục của model hiện tại và được thay bằng os.replace (atomic).
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from app.core.content_version import get_content_version, refresh_content_version
+from app.domain.models import Topic
+
+_ARRAY_FILES = ("data", "indices", "indptr", "topic_ids")
+_META_FILE = "meta.json"
+_CURRENT_FILE = "CURRENT"
+_MODEL_PREFIX = "model-"
+_TMP_PREFIX = "tmp-"
+# Model cũ / thư mục tạm bỏ dở chỉ bị xóa khi đã quá thời gian này, để không xóa
+# thư mục mà process khác đang ghi hoặc đang load
+_STALE_SECONDS = 600
+
+
+def corpus_fingerprint(topic_ids: Sequence[int], corpus: Sequence[str]) -> str:
+    """Hash của corpus (topic_id + text) để phát hiện model đã cũ"""
+    digest = hashlib.sha256()
+    for topic_id, text in zip(topic_ids, corpus):
+        digest.update(f"{topic_id}\x00{text}\x01".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class TfidfModel:
+    """
+    Ma trận TF-IDF đã fit cùng mapping topic_id -> row.
+    Các row đã được TfidfVectorizer chuẩn hóa L2 (norm="l2" mặc định).
+    """
+
+    def __init__(
+        self, matrix: sparse.csr_matrix, topic_ids: np.ndarray, fingerprint: str
+    ) -> None:
+        self.matrix = matrix
+        self.topic_ids = topic_ids
+        self.fingerprint = fingerprint
+        self.row_of: Dict[int, int] = {
+            int(topic_id): row for row, topic_id in enumerate(topic_ids)
+        }
+
+    def similarity_vector(self, topic_id: int) -> Optional[np.ndarray]:
+        """
+        Cosine similarity giữa topic_id và mọi row của model (theo thứ tự topic_ids).
+        Row đã chuẩn hóa L2 nên cosine chỉ là tích vô hướng matrix · row.
+
+        Returns:
+            numpy array shape (n_topics,), None nếu topic không có trong model
+        """
+        row = self.row_of.get(topic_id)
+        if row is None:
+            return None
+        return (self.matrix @ self.matrix[row].T).toarray().ravel()
+
+    def similarities(self, topic_id: int) -> Dict[int, float]:
+        """
+        Cosine similarity giữa topic_id và tất cả topics khác trong model.
+
+        Returns:
+            Dict mapping topic_id -> similarity_score (0-1), rỗng nếu topic không có trong model
+        """
+        scores = self.similarity_vector(topic_id)
+        if scores is None:
+            return {}
+
+        return {
+            int(other_id): float(score)
+            for other_id, score in zip(self.topic_ids, scores)
+            if other_id != topic_id
+        }
+
+    def save(self, directory: str) -> None:
+        """
+        Lưu model vào thư mục con mới của directory rồi trỏ CURRENT sang đó.
+
+        Mỗi lần lưu ghi vào thư mục tạm riêng (mkdtemp), nên nhiều process (worker khác,
+        build_tfidf_model.py) lưu cùng lúc không ghi đè nhau; CURRENT chỉ đổi sau khi
+        model đã ghi xong nên load luôn thấy một model hoàn chỉnh.
+        """
+        os.makedirs(directory, exist_ok=True)
+        tmp_directory = tempfile.mkdtemp(prefix=_TMP_PREFIX, dir=directory)
+        try:
+            arrays = {
+                "data": self.matrix.data,
+                "indices": self.matrix.indices,
+                "indptr": self.matrix.indptr,
+                "topic_ids": self.topic_ids,
+            }
+            for name, array in arrays.items():
+                np.save(os.path.join(tmp_directory, f"{name}.npy"), np.asarray(array))
+            with open(os.path.join(tmp_directory, _META_FILE), "w", encoding="utf-8") as f:
+                json.dump(
+                    {"shape": list(self.matrix.shape), "fingerprint": self.fingerprint}, f
+                )
+            model_name = _MODEL_PREFIX + os.path.basename(tmp_directory)[len(_TMP_PREFIX):]
+            os.rename(tmp_directory, os.path.join(directory, model_name))
+        except BaseException:
+            shutil.rmtree(tmp_directory, ignore_errors=True)
+            raise
+
+        fd, tmp_pointer = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=directory)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(model_name)
+        os.replace(tmp_pointer, os.path.join(directory, _CURRENT_FILE))
+        _remove_stale_models(directory, keep=model_name)
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["TfidfModel"]:
+        """Load model hiện tại (memory-mapped), trả về None nếu chưa có"""
+        pointer_path = os.path.join(directory, _CURRENT_FILE)
+        if not os.path.exists(pointer_path):
+            return None
+        with open(pointer_path, encoding="utf-8") as f:
+            directory = os.path.join(directory, f.read().strip())
+        meta_path = os.path.join(directory, _META_FILE)
+
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+            for name in _ARRAY_FILES
+        }
+        matrix = sparse.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=tuple(meta["shape"]),
+            copy=False,
+        )
+        return cls(matrix, arrays["topic_ids"], meta["fingerprint"])
+
+
+def _remove_stale_models(directory: str, keep: str) -> None:
+    """Xóa các model cũ và thư mục tạm bỏ dở đã quá _STALE_SECONDS"""
+    deadline = time.time() - _STALE_SECONDS
+    for entry in os.listdir(directory):
+        if entry == keep or not entry.startswith((_MODEL_PREFIX, _TMP_PREFIX)):
+            continue
+        path = os.path.join(directory, entry)
+        try:
+            if os.path.getmtime(path) > deadline:
+                continue
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
+        except OSError:
+            # Process khác đã xóa trước
+            continue
+
+
+class TfidfModelStore:
+    """
+    Giữ TF-IDF model hiện tại của process.
+
+    Model chỉ được kiểm tra lại khi content version thay đổi (danh sách topic IDs
+    trước, fingerprint sau), và chỉ fit lại khi corpus thực sự khác với corpus lúc build. Các lần ghi topic
+    đều schedule job refresh topic_similarity, nên việc fit lại thường chạy ở
+    background job; request đến trước job thì chờ cùng lock thay vì fit lần nữa.
+    Model mới được lưu ra disk trên worker thread riêng, không nằm trên request.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self._directory = directory
+        # Optional: hàm chạy fit(corpus) ở nơi khác (VD: process pool), mặc định gọi trực tiếp
+        self.fit_runner: Optional[
+            Callable[[Callable[[List[str]], sparse.spmatrix], List[str]], sparse.spmatrix]
+        ] = None
+        self._lock = threading.Lock()
+        self._model: Optional[TfidfModel] = None
+        self._version: Optional[int] = None
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            from app.core.settings import get_settings
+
+            self._directory = get_settings().TFIDF_MODEL_DIR
+        return self._directory
+
+    def load_from_disk(self) -> bool:
+        """Load model đã build sẵn khi khởi động app"""
+        try:
+            model = TfidfModel.load(self.directory)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: Failed to load TF-IDF model from {self.directory}: {str(e)}")
+            return False
+        if model is None:
+            return False
+        with self._lock:
+            self._model = model
+            self._version = None  # Sẽ đối chiếu fingerprint ở lần dùng đầu tiên
+        return True
+
+    def get(
+        self,
+        topics: List[Topic],
+        prepare_text: Callable[[Topic], str],
+        fit: Callable[[List[str]], sparse.spmatrix],
+    ) -> TfidfModel:
+        """
+        Trả về model khớp với danh sách topics hiện tại, fit lại nếu cần.
+
+        Args:
+            topics: Tất cả topics trong hệ thống
+            prepare_text: Hàm chuẩn bị text TF-IDF cho một topic
+            fit: Hàm fit vectorizer trên corpus, trả về ma trận TF-IDF
+        """
+        version = refresh_content_version()
+        model = self._model
+        if model is not None and self._version == version:
+            return model
+
+        with self._lock:
+            if self._model is not None and self._version == version:
+                return self._model
+
+            ordered = sorted(topics, key=lambda topic: topic.id)
+            topic_ids = [topic.id for topic in ordered]
+            corpus = [prepare_text(topic) for topic in ordered]
+            # So danh sách IDs trước (rẻ): topic được thêm/xóa thì fit lại luôn,
+            # chỉ hash toàn bộ corpus khi IDs giống hệt model hiện tại
+            fingerprint: Optional[str] = None
+            stale = self._model is None or not np.array_equal(self._model.topic_ids, topic_ids)
+            if not stale:
+                fingerprint = corpus_fingerprint(topic_ids, corpus)
+                stale = self._model.fingerprint != fingerprint
+
+            if stale:
+                self._model = self.build(topic_ids, corpus, fit, fingerprint)
+                self._save_in_background(self._model)
+
+            self._version = version
+            return self._model
+
+    def build(
+        self,
+        topic_ids: List[int],
+        corpus: List[str],
+        fit: Callable[[List[str]], sparse.spmatrix],
+        fingerprint: Optional[str] = None,
+    ) -> TfidfModel:
+        """Fit model mới từ corpus (chưa lưu ra disk, xem save)"""
+        matrix = self.fit_runner(fit, corpus) if self.fit_runner else fit(corpus)
+        return TfidfModel(
+            sparse.csr_matrix(matrix),
+            np.asarray(topic_ids, dtype=np.int64),
+            fingerprint or corpus_fingerprint(topic_ids, corpus),
+        )
+
+    def save(self, model: TfidfModel) -> bool:
+        """Lưu model ra TFIDF_MODEL_DIR, lỗi chỉ được log"""
+        try:
+            model.save(self.directory)
+        except OSError as e:
+            print(f"Warning: Failed to save TF-IDF model to {self.directory}: {str(e)}")
+            return False
+        return True
+
+    def _save_in_background(self, model: TfidfModel) -> None:
+        """Lưu model trên worker thread riêng (tuần tự, bỏ qua model đã bị thay)"""
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tfidf-model-save"
+            )
+
+        def save_if_current() -> None:
+            if model is self._model:
+                self.save(model)
+
+        try:
+            self._save_executor.submit(save_if_current)
+        except RuntimeError as e:
+            # Interpreter đang tắt: bỏ qua lần lưu, model vẫn dùng được trong memory
+            print(f"Warning: Skipped saving TF-IDF model: {str(e)}")
+
+
+# Instance dùng chung trong process
+tfidf_model_store = TfidfModelStore()
@@ -1,8 +1,41 @@
-from typing import List, Optional
+from collections import Counter
+from typing import List, Optional, Tuple
 
-from app.application.interfaces.topic_repository_interface import ITopicRepository
+from fastapi import HTTPException, status
+
+from app.application.interfaces.content_change_handler_interface import IContentChangeHandler
+from app.application.interfaces.topic_repository_interface import (
+    IAsyncTopicRepository,
+    ITopicRepository,
+)
+from app.application.interfaces.topic_similarity_repository_interface import (
+    ITopicSimilarityRepository,
+)
 from app.application.services.related_topic_service import RelatedTopicService
-from app.domain.schemas.topic_schema import TopicCreate, TopicResponse, TopicListItem
+from app.core.constants import RELATED_TOPICS_TOP_K
+from app.core.content_version import get_content_version
+from app.core.json_response import encode_model
+from app.core.pagination import build_page, clamp_page_size, decode_cursor
+from app.domain.schemas.topic_schema import (
+    TopicBulkCreate,
+    TopicBulkResponse,
+    TopicCreate,
+    TopicListItem,
+    TopicResponse,
+)
+
+
+def _validate_topics(topics, schema):
+    """Convert danh sách Topic sang schema, bỏ qua các topic lỗi validation"""
+    result = []
+    for topic in topics:
+        try:
+            result.append(schema.model_validate(topic))
+        except Exception as e:
+            # Skip topics that fail validation (e.g., corrupted data)
+            print(f"Warning: Failed to validate topic {topic.id}: {str(e)}")
+            continue
+    return result
 
 
 class TopicService:
@@ -11,14 +44,23 @@ class TopicService:
     Áp dụng Dependency Inversion: phụ thuộc vào ITopicRepository interface thay vì concrete class.
     """
 
-    def __init__(self, topic_repo: ITopicRepository):
+    def __init__(
+        self,
+        topic_repo: ITopicRepository,
+        similarity_repo: Optional[ITopicSimilarityRepository] = None,
+        changes: Optional[IContentChangeHandler] = None,
+    ):
         """
         Constructor nhận interface thay vì Session để tuân thủ DIP
 
         Args:
             topic_repo: Implementation của ITopicRepository
+            similarity_repo: Optional - đọc related topics đã tính sẵn (bảng topic_similarity)
+            changes: Optional - tác dụng phụ sau mỗi lần ghi (cache, snapshot, index, jobs)
         """
         self.topic_repo = topic_repo
+        self.similarity_repo = similarity_repo
+        self.changes = changes
         self.related_topic_service = RelatedTopicService()
 
     def create_new_topic(self, data: TopicCreate) -> TopicResponse:
@@ -31,8 +73,66 @@ class TopicService:
         - Log hoạt động
         """
         topic = self.topic_repo.create(data)
+        if self.changes:
+            self.changes.topic_saved(
+                topic.id,
+                topic.title,
+                category_ids=[topic.category_id],
+                changed_tag_ids=[tag.id for tag in topic.tags],
+                similarity_changed=True,
+            )
         return TopicResponse.model_validate(topic)
 
+    def bulk_create_topics(self, data: TopicBulkCreate) -> TopicBulkResponse:
+        """
+        Import nhiều topics trong một transaction
+
+        Business logic:
+        - Title không trùng trong batch và không trùng topic đã có
+        - Mọi category_slug và tag_slugs phải tồn tại (tra cứu theo lô)
+        """
+        items = data.topics
+        titles = [item.title for item in items]
+        duplicated = sorted(title for title, count in Counter(titles).items() if count > 1)
+        if duplicated:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Title bị lặp trong batch: {', '.join(duplicated)}"
+            )
+        existing = self.topic_repo.get_existing_titles(titles)
+        if existing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Topic với title đã tồn tại: {', '.join(sorted(existing))}"
+            )
+
+        category_slugs = {item.category_slug for item in items}
+        category_ids = self.topic_repo.get_category_ids_by_slug(category_slugs)
+        missing_categories = category_slugs - category_ids.keys()
+        if missing_categories:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Category slug không tồn tại: {', '.join(sorted(missing_categories))}"
+            )
+
+        tag_slugs = {slug for item in items for slug in item.tag_slugs}
+        tag_ids = self.topic_repo.get_tag_ids_by_slug(tag_slugs)
+        missing_tags = tag_slugs - tag_ids.keys()
+        if missing_tags:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Tag slug không tồn tại: {', '.join(sorted(missing_tags))}"
+            )
+
+        topic_ids = self.topic_repo.bulk_create(items, category_ids, tag_ids)
+        if self.changes:
+            self.changes.topics_imported(
+                topic_ids,
+                category_ids=[category_ids[slug] for slug in category_slugs],
+                tag_ids=[tag_ids[slug] for slug in tag_slugs],
+            )
+        return TopicBulkResponse(created=len(topic_ids), topic_ids=topic_ids)
+
     def get_topic_by_id(self, topic_id: int) -> Optional[TopicResponse]:
         """Lấy topic theo ID"""
         topic = self.topic_repo.get_by_id(topic_id)
@@ -43,38 +143,60 @@ class TopicService:
     def get_all_topics(self, skip: int = 0, limit: int = 100) -> List[TopicResponse]:
         """Lấy danh sách topics"""
         topics = self.topic_repo.get_all(skip, limit)
-        result = []
-        for topic in topics:
-            try:
-                result.append(TopicResponse.model_validate(topic))
-            except Exception as e:
-                # Skip topics that fail validation (e.g., corrupted data)
-                print(f"Warning: Failed to validate topic {topic.id}: {str(e)}")
-                continue
-        return result
+        return _validate_topics(topics, TopicResponse)
+
+    def get_topic_list(self, skip: int = 0, limit: int = 100) -> List[TopicListItem]:
+        """Lấy danh sách topics (lightweight - không load sections)"""
+        topics = self.topic_repo.get_list(skip, limit)
+        return _validate_topics(topics, TopicListItem)
     
     def get_topics_by_category(self, category_id: int, skip: int = 0, limit: int = 100) -> List[TopicListItem]:
         """Lấy danh sách topics theo category (lightweight - không load sections)"""
         topics = self.topic_repo.get_by_category(category_id, skip, limit)
-        result = []
-        for topic in topics:
-            try:
-                result.append(TopicListItem.model_validate(topic))
-            except Exception as e:
-                print(f"Warning: Failed to validate topic {topic.id}: {str(e)}")
-                continue
-        return result
+        return _validate_topics(topics, TopicListItem)
 
     def update_topic(self, topic_id: int, data: TopicCreate) -> Optional[TopicResponse]:
         """Cập nhật topic"""
+        existing = self.topic_repo.get_by_id(topic_id)
+        if not existing:
+            return None
+        # Giữ lại giá trị cũ để biết cache / related topics nào bị ảnh hưởng
+        old_fields = (existing.title, existing.short_definition, existing.category_id)
+        old_tag_ids = {tag.id for tag in existing.tags}
+
         topic = self.topic_repo.update(topic_id, data)
-        if topic:
-            return TopicResponse.model_validate(topic)
-        return None
+        if not topic:
+            return None
+        if self.changes:
+            self.changes.topic_saved(
+                topic.id,
+                topic.title,
+                category_ids=[old_fields[2], topic.category_id],
+                # Chỉ các tag được gắn thêm/gỡ ra mới đổi topic_count/topic_ids
+                changed_tag_ids=old_tag_ids ^ {tag.id for tag in topic.tags},
+                similarity_changed=old_fields != (
+                    topic.title, topic.short_definition, topic.category_id
+                ),
+            )
+        return TopicResponse.model_validate(topic)
 
     def delete_topic(self, topic_id: int) -> bool:
         """Xóa topic"""
-        return self.topic_repo.delete(topic_id)
+        topic = self.topic_repo.get_by_id(topic_id)
+        if not topic:
+            return False
+        category_id = topic.category_id
+        tag_ids = [tag.id for tag in topic.tags]
+        # Các topic từng có topic này trong top-K sẽ được tính lại ở background
+        referencing_ids = (
+            self.similarity_repo.get_referencing_topic_ids(topic_id) if self.similarity_repo else []
+        )
+
+        if not self.topic_repo.delete(topic_id):
+            return False
+        if self.changes:
+            self.changes.topic_deleted(topic_id, category_id, tag_ids, referencing_ids)
+        return True
 
     def find_related_topics(self, topic_id: int, top_n: int = 5) -> List[dict]:
         """
@@ -88,20 +210,54 @@ class TopicService:
             List[dict]: Danh sách topics liên quan kèm điểm số
                 Format: [{"topic": TopicResponse, "score": float}, ...]
         """
+        # Đọc từ bảng materialized topic_similarity nếu đã tính (kể cả kết quả rỗng)
+        if self.similarity_repo:
+            stored = self.similarity_repo.get_related(topic_id, top_n)
+            if stored is not None:
+                return self._to_related_response(stored)
+
         # Lấy topic nguồn
         source_topic = self.topic_repo.get_by_id(topic_id)
         if not source_topic:
             return []
 
-        # Lấy tất cả topics (không load sections để tối ưu performance)
+        # Lấy tất cả topics dạng projection (chỉ các cột dùng để chấm điểm)
         all_topics = self.topic_repo.get_all_with_minimal_data()
 
         # Tìm related topics sử dụng thuật toán TF-IDF + Heuristic
-        related_results = self.related_topic_service.find_related_topics(
-            source_topic=source_topic, all_topics=all_topics, top_n=top_n
+        # (tính đủ top-K để lưu lại cho các request sau)
+        top_k = max(top_n, RELATED_TOPICS_TOP_K)
+        related_results = self.related_topic_service.score_related_topics(
+            source_topic=source_topic, all_topics=all_topics, top_n=top_k
+        )
+        if related_results is None:
+            # Không chấm được đầy đủ (VD: corpus đổi trong lúc tính): trả về kết quả
+            # tính tạm, không lưu
+            related_results = self.related_topic_service.find_related_topics(
+                source_topic=source_topic, all_topics=all_topics, top_n=top_k
+            )
+        elif self.similarity_repo:
+            # Chỉ lưu các dòng khi topic chưa có dữ liệu; dấu đã tính (kể cả kết quả
+            # rỗng) do background job ghi
+            try:
+                self.similarity_repo.add_rows_if_missing(
+                    topic_id, [(topic.id, score) for topic, score in related_results]
+                )
+            except Exception as e:
+                print(f"Warning: Failed to store related topics for {topic_id}: {str(e)}")
+
+        # Chỉ load đầy đủ (sections, tags) các topics được trả về
+        top_results = related_results[:top_n]
+        topics_by_id = {
+            topic.id: topic
+            for topic in self.topic_repo.get_by_ids([record.id for record, _ in top_results])
+        }
+        return self._to_related_response(
+            [(topics_by_id[record.id], score) for record, score in top_results if record.id in topics_by_id]
         )
 
-        # Convert sang format response
+    def _to_related_response(self, related_results) -> List[dict]:
+        """Convert danh sách (topic, score) sang format response"""
         response_data = []
         for topic, score in related_results:
             response_data.append(
@@ -112,3 +268,65 @@ class TopicService:
             )
 
         return response_data
+
+
+class AsyncTopicService:
+    """
+    Service async cho các thao tác đọc Topic, chạy trực tiếp trên event loop.
+    Phụ thuộc vào IAsyncTopicRepository interface.
+    """
+
+    def __init__(self, topic_repo: IAsyncTopicRepository):
+        self.topic_repo = topic_repo
+
+    async def get_topic_by_id(self, topic_id: int) -> Optional[TopicResponse]:
+        """Lấy topic theo ID"""
+        topic = await self.topic_repo.get_by_id(topic_id)
+        if topic:
+            return TopicResponse.model_validate(topic)
+        return None
+
+    async def get_topic_json(self, topic_id: int) -> Optional[bytes]:
+        """
+        JSON TopicResponse của topic từ bảng topic_snapshots (một lần đọc theo PK).
+        Topic chưa có snapshot (VD: tạo trước khi có bảng) được build từ database
+        rồi lưu lại, trừ khi có lần ghi xảy ra trong lúc build.
+        """
+        body = await self.topic_repo.get_snapshot(topic_id)
+        if body is not None:
+            return body
+        version = get_content_version()
+        topic = await self.get_topic_by_id(topic_id)
+        if topic is None:
+            return None
+        body = encode_model(TopicResponse, topic)
+        if version == get_content_version():
+            await self.topic_repo.save_snapshot(topic_id, body)
+        return body
+
+    async def get_all_topics(self, skip: int = 0, limit: int = 100) -> List[TopicResponse]:
+        """Lấy danh sách topics"""
+        topics = await self.topic_repo.get_all(skip, limit)
+        return _validate_topics(topics, TopicResponse)
+
+    async def get_topic_list(self, skip: int = 0, limit: int = 100) -> List[TopicListItem]:
+        """Lấy danh sách topics (lightweight - không load sections)"""
+        topics = await self.topic_repo.get_list(skip, limit)
+        return _validate_topics(topics, TopicListItem)
+
+    async def get_topics_by_category(self, category_id: int, skip: int = 0, limit: int = 100) -> List[TopicListItem]:
+        """Lấy danh sách topics theo category (lightweight - không load sections)"""
+        topics = await self.topic_repo.get_by_category(category_id, skip, limit)
+        return _validate_topics(topics, TopicListItem)
+
+    async def get_topics_page(
+        self, cursor: Optional[str], limit: int, category_id: Optional[int] = None
+    ) -> Tuple[List[TopicListItem], Optional[str]]:
+        """Lấy một trang topics theo cursor (có thể lọc theo category), trả về (topics, next_cursor)"""
+        limit = clamp_page_size(limit)
+        after = decode_cursor(cursor, 1)
+        topics = await self.topic_repo.get_page_after(
+            after[0] if after else None, limit + 1, category_id
+        )
+        page, next_cursor = build_page(topics, limit, key=lambda topic: (topic.id,))
+        return _validate_topics(page, TopicListItem), next_cursor
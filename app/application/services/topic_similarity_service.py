@@ -0,0 +1,130 @@
+"""
+Service tính lại bảng materialized topic_similarity (top-K related topics của mỗi topic)
+"""
+from typing import Iterable, List, Set
+
+from app.application.interfaces.topic_repository_interface import ITopicRepository
+from app.application.interfaces.topic_similarity_repository_interface import (
+    ITopicSimilarityRepository,
+)
+from app.application.services.related_topic_service import RelatedTopicService
+from app.core.constants import RELATED_TOPICS_TOP_K
+from app.domain.projections import TopicRecord
+
+
+class TopicSimilarityService:
+    """
+    Refresh bảng topic_similarity theo kiểu incremental.
+
+    Khi một topic thay đổi, chỉ các dòng sau được tính lại:
+    - Dòng của chính topic đó
+    - Các topic đang có topic đó trong top-K
+    - Các topic mà topic đó (với nội dung mới) lọt vào top-K
+
+    Các dòng còn lại giữ score cũ; refresh_all() tính lại toàn bộ bảng.
+    """
+
+    def __init__(
+        self,
+        topic_repo: ITopicRepository,
+        similarity_repo: ITopicSimilarityRepository,
+        top_k: int = RELATED_TOPICS_TOP_K,
+    ):
+        self.topic_repo = topic_repo
+        self.similarity_repo = similarity_repo
+        self.top_k = top_k
+        self.related_topic_service = RelatedTopicService()
+
+    def refresh_all(self, only_if_empty: bool = False) -> int:
+        """
+        Tính lại top-K cho toàn bộ topics.
+
+        Args:
+            only_if_empty: Chỉ chạy khi bảng chưa có dữ liệu (backfill lúc khởi động)
+
+        Returns:
+            Số topics đã được tính lại
+        """
+        if only_if_empty and not self.similarity_repo.is_empty():
+            return 0
+
+        all_topics = self.topic_repo.get_all_with_minimal_data()
+        return self._refresh_rows(all_topics, all_topics)
+
+    def refresh_for_change(self, changed_topic_id: int) -> int:
+        """
+        Tính lại các dòng bị ảnh hưởng khi topic được tạo mới hoặc
+        thay đổi title, short_definition hoặc category.
+
+        Returns:
+            Số topics đã được tính lại
+        """
+        return self.refresh_for_changes([changed_topic_id])
+
+    def refresh_for_changes(self, changed_topic_ids: Iterable[int]) -> int:
+        """
+        Như refresh_for_change cho nhiều topics (VD: bulk import) trong một lượt:
+        corpus, TF-IDF model và cutoff scores chỉ đọc một lần, mỗi topic bị ảnh hưởng
+        chỉ được tính lại một lần.
+
+        Returns:
+            Số topics đã được tính lại
+        """
+        changed_ids = set(changed_topic_ids)
+        all_topics = self.topic_repo.get_all_with_minimal_data()
+        changed_topics = [topic for topic in all_topics if topic.id in changed_ids]
+        if not changed_topics:
+            return 0
+
+        # Cutoff đọc trước khi tính lại: topics mới chưa có dòng nên luôn bị ảnh hưởng
+        cutoffs = self.similarity_repo.get_cutoff_scores()
+        affected: Set[int] = set()
+        for changed_topic in changed_topics:
+            affected.add(changed_topic.id)
+            affected.update(self.similarity_repo.get_referencing_topic_ids(changed_topic.id))
+
+            # Các topic mà changed_topic có score cao hơn dòng thấp nhất đang lưu
+            candidate_scores = self.related_topic_service.score_as_candidate(
+                changed_topic, all_topics
+            )
+            for topic_id, score in candidate_scores.items():
+                row_count, min_score = cutoffs.get(topic_id, (0, 0.0))
+                if row_count < self.top_k or score >= min_score:
+                    affected.add(topic_id)
+
+        return self._refresh_rows(
+            [topic for topic in all_topics if topic.id in affected], all_topics
+        )
+
+    def refresh_topics(self, topic_ids: Iterable[int]) -> int:
+        """
+        Tính lại các dòng của những topics chỉ định (VD: sau khi một topic bị xóa)
+
+        Returns:
+            Số topics đã được tính lại
+        """
+        wanted = set(topic_ids)
+        if not wanted:
+            return 0
+
+        all_topics = self.topic_repo.get_all_with_minimal_data()
+        return self._refresh_rows(
+            [topic for topic in all_topics if topic.id in wanted], all_topics
+        )
+
+    def _refresh_rows(self, topics: List[TopicRecord], all_topics: List[TopicRecord]) -> int:
+        refreshed = 0
+        for topic in topics:
+            related = self.related_topic_service.score_related_topics(
+                source_topic=topic, all_topics=all_topics, top_n=self.top_k
+            )
+            # Không chấm được, hoặc kết quả rỗng dù corpus có topic khác: giữ chưa đánh dấu
+            # để lần đọc/refresh sau tính lại thay vì lưu [] vĩnh viễn
+            if related is None or (not related and len(all_topics) > 1):
+                print(f"Warning: Skipped topic similarity refresh for topic {topic.id}")
+                continue
+            self.similarity_repo.replace_rows(
+                topic.id, [(related_topic.id, score) for related_topic, score in related]
+            )
+            refreshed += 1
+        return refreshed
@@ -3,6 +3,7 @@ from .exceptions import (
     ResourceNotFoundException,
     DuplicateResourceException,
     ValidationException,
+    InvalidCursorException,
 )
 from .constants import (
     MIN_TITLE_LENGTH,
@@ -13,6 +14,8 @@ from .constants import (
     DEFAULT_SKIP,
     DEFAULT_LIMIT,
     MAX_LIMIT,
+    MAX_CURSOR_LIMIT,
+    RELATED_TOPICS_TOP_K,
 )
 
 __all__ = [
@@ -21,6 +24,7 @@ __all__ = [
     "ResourceNotFoundException",
     "DuplicateResourceException",
     "ValidationException",
+    "InvalidCursorException",
     "MIN_TITLE_LENGTH",
     "MAX_TITLE_LENGTH",
     "MAX_DEFINITION_LENGTH",
@@ -29,4 +33,6 @@ __all__ = [
     "DEFAULT_SKIP",
     "DEFAULT_LIMIT",
     "MAX_LIMIT",
+    "MAX_CURSOR_LIMIT",
+    "RELATED_TOPICS_TOP_K",
 ]
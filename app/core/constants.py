@@ -28,3 +28,14 @@ SUPPORTED_LANGUAGES = [
 DEFAULT_SKIP = 0
 DEFAULT_LIMIT = 100
 MAX_LIMIT = 1000
+# Kích thước trang tối đa khi phân trang bằng cursor
+MAX_CURSOR_LIMIT = 200
+
+# Related topics: số related topics lưu sẵn cho mỗi topic (bằng top_n tối đa của API)
+RELATED_TOPICS_TOP_K = 20
+
+# Search: số query đã chuẩn hóa (bỏ dấu) được giữ trong LRU
+SEARCH_QUERY_CACHE_SIZE = 1024
+
+# Bulk import: số topics tối đa trong một request POST /topics/bulk
+BULK_IMPORT_MAX_TOPICS = 5000
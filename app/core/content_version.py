@@ -0,0 +1,103 @@
+"""
+Phiên bản nội dung (content version) để các cấu trúc dữ liệu in-memory (search index,
+search cache, suggestion index, TF-IDF model) biết cần build lại.
+
+Version là bộ đếm trong process, tăng khi:
+- process này ghi topic/section/category/tag: ContentChangeHandler
+  (app/infrastructure/hooks) gọi bump_content_version() sau commit
+- content stamp trong database đổi, VD: instance khác (Cloud Run, Lambda) vừa ghi:
+  refresh_content_version() đọc lại stamp, tối đa một lần mỗi check_seconds
+
+Reader đọc stamp được cấu hình lúc khởi động (app/main.py); chưa cấu hình thì version
+chỉ theo các lần ghi trong process.
+"""
+import threading
+import time
+from typing import Callable, Hashable, Optional
+
+_lock = threading.Lock()
+_version = 0
+# Chỉ tăng khi stamp đổi mà không phải do process này ghi
+_external_version = 0
+_stamp: Optional[Hashable] = None
+_stamp_reader: Optional[Callable[[], Hashable]] = None
+_check_seconds = 1.0
+_checked_at: Optional[float] = None
+_read_failed = False
+
+
+def configure_content_stamp(reader: Optional[Callable[[], Hashable]], check_seconds: float) -> None:
+    """
+    Args:
+        reader: Hàm đọc content stamp từ database (None để tắt)
+        check_seconds: Khoảng thời gian tối thiểu giữa hai lần đọc stamp (0 = mỗi lần refresh)
+    """
+    global _stamp_reader, _check_seconds, _checked_at
+    with _lock:
+        _stamp_reader = reader
+        _check_seconds = check_seconds
+        _checked_at = None
+
+
+def get_content_version() -> int:
+    """Phiên bản nội dung hiện tại (không đọc database)"""
+    return _version
+
+
+def get_external_content_version() -> int:
+    """
+    Phiên bản chỉ tăng khi nội dung đổi ngoài process này. Dùng cho các index tự
+    cập nhật theo từng lần ghi trong process (VD: suggestion index)
+    """
+    return _external_version
+
+
+def content_version_check_due() -> bool:
+    """Đã đến lúc đọc lại content stamp từ database chưa"""
+    return _stamp_reader is not None and (
+        _checked_at is None or time.monotonic() - _checked_at >= _check_seconds
+    )
+
+
+def refresh_content_version() -> int:
+    """
+    Đọc lại content stamp nếu đã đến hạn, tăng version nếu stamp đổi.
+    Query database blocking: gọi trong worker thread, không gọi trên event loop.
+    """
+    global _version, _external_version, _stamp, _checked_at, _read_failed
+    reader = _stamp_reader
+    if reader is None or not content_version_check_due():
+        return _version
+    # Đánh dấu trước khi đọc để các thread khác không đọc cùng lúc
+    _checked_at = time.monotonic()
+    try:
+        stamp = reader()
+    except Exception as e:
+        if not _read_failed:
+            print(f"Warning: Failed to read content stamp: {str(e)}")
+        _read_failed = True
+        return _version
+    _read_failed = False
+    with _lock:
+        if stamp != _stamp:
+            _stamp = stamp
+            _version += 1
+            _external_version += 1
+        return _version
+
+
+def bump_content_version(stamp: Optional[Hashable] = None) -> int:
+    """
+    Ghi nhận một lần ghi nội dung của process này, trả về version mới.
+
+    Args:
+        stamp: Content stamp đọc ngay sau lần ghi (None nếu không đọc được hoặc có
+            lần ghi khác xen vào; khi đó lần refresh sau tự phát hiện thay đổi)
+    """
+    global _version, _stamp, _checked_at
+    with _lock:
+        _version += 1
+        if stamp is not None:
+            _stamp = stamp
+            _checked_at = time.monotonic()
+        return _version
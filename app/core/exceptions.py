@@ -27,3 +27,11 @@ class ValidationException(HTTPException):
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=detail
         )
+
+class InvalidCursorException(HTTPException):
+    """Raised when a pagination cursor cannot be decoded"""
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cursor '{cursor}' không hợp lệ"
+        )
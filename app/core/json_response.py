@@ -0,0 +1,91 @@
+"""
+Serialize response JSON trong một lượt.
+
+Khi endpoint trả về Pydantic model kèm `response_model`, FastAPI dump model ra dict,
+validate lại dict theo response_model, chuyển sang dữ liệu jsonable rồi mới
+json.dumps. Services đã dựng sẵn TopicResponse, SearchResponse, ... nên các
+endpoint dùng model_response() để encode thẳng ra bytes bằng pydantic-core
+(model_dump_json), FastAPI nhận Response và bỏ qua bước serialize của nó.
+
+FastJSONResponse là default_response_class của app cho các endpoint còn trả về
+dict/list: encode bằng orjson (khai báo trong requirements.txt để bytes, và vì vậy
+ETag, giống nhau giữa các môi trường), pydantic_core.to_json chỉ dùng cho dữ liệu
+orjson không encode được.
+"""
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def _is_instance_of(response_model: Any, value: Any) -> bool:
+    """value đã đúng kiểu response_model (model hoặc List[model]) nên không cần validate lại"""
+    if isinstance(response_model, type):
+        return type(value) is response_model
+    args = getattr(response_model, "__args__", None)
+    if getattr(response_model, "__origin__", None) is list and args and isinstance(args[0], type):
+        return isinstance(value, list) and all(type(item) is args[0] for item in value)
+    return False
+
+
+def encode_model(response_model: Any, value: Any) -> bytes:
+    """
+    Encode value theo response_model thành JSON bytes.
+
+    Value đã là instance đúng kiểu được dump trực tiếp; còn lại (ORM object,
+    dict, model khác kiểu như TopicResponse -> TopicListItem) được validate
+    một lần như FastAPI rồi dump.
+    """
+    adapter = _adapter(response_model)
+    if not _is_instance_of(response_model, value):
+        value = adapter.validate_python(value, from_attributes=True)
+    return adapter.dump_json(value)
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(response_model: Any) -> str:
+    """
+    Hash của JSON schema (mode serialization, gồm cả các model lồng nhau) của
+    response_model. Đổi khi shape của JSON output đổi, dùng để nhận ra JSON đã
+    lưu sẵn từ phiên bản code trước.
+    """
+    schema = _adapter(response_model).json_schema(mode="serialization")
+    return hashlib.sha256(to_json(schema)).hexdigest()[:32]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encode bằng orjson / pydantic-core thay cho json.dumps"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            # VD: key không phải str -> để pydantic-core xử lý
+            return to_json(content)
+
+
+def model_response(
+    response_model: Any,
+    value: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Response JSON của value theo response_model, serialize đúng một lần"""
+    return Response(
+        content=encode_model(response_model, value),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
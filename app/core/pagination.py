@@ -0,0 +1,64 @@
+"""
+Keyset (cursor) pagination dùng chung cho các endpoint danh sách.
+
+Cursor là token opaque (base64url của sort key của bản ghi cuối trang trước).
+Trang tiếp theo được lấy bằng điều kiện `sort_key > cursor` trên index thay vì
+OFFSET, nên chi phí không tăng theo độ sâu của trang.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from app.core.constants import MAX_CURSOR_LIMIT
+from app.core.exceptions import InvalidCursorException
+
+
+def encode_cursor(key: Sequence[int]) -> str:
+    """Encode sort key thành cursor opaque"""
+    raw = json.dumps(list(key), separators=(",", ":")).encode("ascii")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[Tuple[int, ...]]:
+    """
+    Decode cursor thành sort key gồm `size` số nguyên.
+
+    Returns:
+        None nếu cursor rỗng (trang đầu tiên)
+
+    Raises:
+        InvalidCursorException: Nếu cursor không hợp lệ
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise InvalidCursorException(cursor)
+    if (
+        not isinstance(key, list)
+        or len(key) != size
+        or not all(type(value) is int for value in key)
+    ):
+        raise InvalidCursorException(cursor)
+    return tuple(key)
+
+
+def clamp_page_size(limit: int) -> int:
+    """Giới hạn kích thước trang cursor trong [1, MAX_CURSOR_LIMIT]"""
+    return max(1, min(limit, MAX_CURSOR_LIMIT))
+
+
+def build_page(
+    rows: Sequence[Any], limit: int, key: Callable[[Any], Sequence[int]]
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Cắt rows (đã query limit + 1 bản ghi) thành một trang và cursor tiếp theo.
+    Bản ghi thừa chỉ dùng để biết còn trang sau hay không.
+    """
+    if len(rows) <= limit:
+        return list(rows), None
+    items = list(rows[:limit])
+    return items, encode_cursor(key(items[-1]))
@@ -18,6 +18,8 @@ class Settings:
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    # Optional: URL riêng cho async engine, mặc định suy ra từ DATABASE_URL
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
     
     # API
     API_V1_PREFIX: str = "/api/v1"
@@ -33,6 +35,33 @@ class Settings:
     # Pagination
     DEFAULT_PAGE_SIZE: int = 100
     MAX_PAGE_SIZE: int = 1000
+
+    # Related topics: thư mục chứa TF-IDF model đã build sẵn
+    TFIDF_MODEL_DIR: str = os.getenv("TFIDF_MODEL_DIR", ".cache/tfidf_model")
+
+    # Related topics: executor riêng để không block event loop
+    RELATED_TOPICS_MAX_CONCURRENCY: int = int(os.getenv("RELATED_TOPICS_MAX_CONCURRENCY", "4"))
+    RELATED_TOPICS_MAX_QUEUE: int = int(os.getenv("RELATED_TOPICS_MAX_QUEUE", "32"))
+    # Số process fit TF-IDF (0 = fit ngay trên worker thread)
+    TFIDF_PROCESS_WORKERS: int = int(os.getenv("TFIDF_PROCESS_WORKERS", "1"))
+
+    # Response cache cho các endpoint đọc: memory (LRU + TTL), redis hoặc none
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # Search: memory (inverted index in-process) hoặc postgres (tsvector + unaccent + pg_trgm)
+    SEARCH_BACKEND: str = os.getenv("SEARCH_BACKEND", "memory")
+    # Cache kết quả search (LRU + TTL, xóa khi nội dung thay đổi); 0 để tắt
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512"))
+    SEARCH_CACHE_TTL_SECONDS: int = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "60"))
+    # Khoảng thời gian tối thiểu giữa hai lần đọc content stamp từ database, để phát hiện
+    # lần ghi của instance khác (search index, search cache, suggestion index, TF-IDF model)
+    CONTENT_VERSION_CHECK_SECONDS: float = float(os.getenv("CONTENT_VERSION_CHECK_SECONDS", "1"))
+
+    # Eager load sections/tags của Topic: selectin, subquery hoặc joined
+    TOPIC_LOADING_STRATEGY: str = os.getenv("TOPIC_LOADING_STRATEGY", "selectin")
     
     def __init__(self):
         # Require DATABASE_URL in production
@@ -0,0 +1,32 @@
+"""
+Text helpers dùng chung cho search và các cấu trúc index in-memory.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Optional
+
+from app.core.constants import SEARCH_QUERY_CACHE_SIZE
+
+
+def remove_vietnamese_tones(text: str) -> str:
+    """Loại bỏ dấu tiếng Việt và chuyển về chữ thường để so khớp linh hoạt hơn"""
+    if not text:
+        return ""
+    # Normalize và loại bỏ dấu
+    text = unicodedata.normalize('NFD', text)
+    text = re.sub(r'[\u0300-\u036f]', '', text)
+    # Xử lý đ/Đ
+    text = text.replace('đ', 'd').replace('Đ', 'D')
+    return text.lower()
+
+
+def stored_or_normalized(stored: Optional[str], raw: Optional[str]) -> str:
+    """Giá trị cột *_norm lưu sẵn; tự bỏ dấu raw nếu bản ghi chưa được backfill"""
+    return stored if stored is not None else remove_vietnamese_tones(raw or "")
+
+
+@lru_cache(maxsize=SEARCH_QUERY_CACHE_SIZE)
+def normalize_query(query: str) -> str:
+    """remove_vietnamese_tones cho query search, memoize bằng LRU có giới hạn"""
+    return remove_vietnamese_tones(query)
@@ -3,15 +3,22 @@ Domain Models Module - SQLAlchemy ORM Entities
 """
 
 from .category import Category
+from .content_revision import ContentRevision
 from .topic import Topic, related_topics_association
 from .section import Section
 from .tag import Tag, topic_tags
+from .topic_similarity import TopicSimilarity, TopicSimilarityComputed
+from .topic_snapshot import TopicSnapshot
 
 __all__ = [
     "Category",
+    "ContentRevision",
     "Topic",
     "Section",
     "Tag",
+    "TopicSimilarity",
+    "TopicSimilarityComputed",
+    "TopicSnapshot",
     "related_topics_association",
     "topic_tags",
 ]
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship, validates
+from app.core.text_utils import remove_vietnamese_tones
 from app.infrastructure.database import Base
 
 class Category(Base):
@@ -12,5 +13,14 @@ class Category(Base):
     name = Column(String, unique=True, index=True, nullable=False)
     slug = Column(String, unique=True, index=True, nullable=False)
 
+    # Bản bỏ dấu + chữ thường cho search, ghi tự động khi set name/slug
+    name_norm = deferred(Column(Text, nullable=True))
+    slug_norm = deferred(Column(Text, nullable=True))
+
     # Quan hệ 1-N: Một Category có nhiều Topics
     topics = relationship("Topic", back_populates="category")
+
+    @validates("name", "slug")
+    def _normalize_search_text(self, key, value):
+        setattr(self, f"{key}_norm", remove_vietnamese_tones(value or ""))
+        return value
@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, Column, Integer
+
+from app.infrastructure.database import Base
+
+
+class ContentRevision(Base):
+    """
+    Một dòng duy nhất (id = 1) đếm số lần ghi topic/section/category/tag đã commit.
+    Mọi instance của API đọc giá trị này để biết dữ liệu in-memory (search index,
+    search cache, suggestion index, TF-IDF model) đã cũ do instance khác ghi.
+    """
+
+    __tablename__ = "content_revision"
+
+    id = Column(Integer, primary_key=True)
+    revision = Column(BigInteger, nullable=False, default=0)
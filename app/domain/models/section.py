@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship, validates
+from app.core.text_utils import remove_vietnamese_tones
 from app.infrastructure.database import Base
 
 class Section(Base):
@@ -17,5 +18,14 @@ class Section(Base):
     code_snippet = Column(Text, nullable=True)  # Đoạn code minh họa
     language = Column(String, nullable=True)  # Ngôn ngữ code (Python, C#, Java...)
 
+    # Bản bỏ dấu + chữ thường cho search, ghi tự động khi set heading/content
+    heading_norm = deferred(Column(Text, nullable=True))
+    content_norm = deferred(Column(Text, nullable=True))
+
     # Quan hệ N-1: Nhiều Sections thuộc về 1 Topic
     topic = relationship("Topic", back_populates="sections")
+
+    @validates("heading", "content")
+    def _normalize_search_text(self, key, value):
+        setattr(self, f"{key}_norm", remove_vietnamese_tones(value or ""))
+        return value
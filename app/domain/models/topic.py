@@ -1,8 +1,9 @@
 from datetime import datetime
 
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship, validates
 
+from app.core.text_utils import remove_vietnamese_tones
 from app.infrastructure.database import Base
 
 # Bảng phụ N-N cho quan hệ self-referencing giữa các Topic (related topics)
@@ -29,6 +30,11 @@ class Topic(Base):
     short_definition = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Bản bỏ dấu + chữ thường cho search, ghi tự động khi set title/short_definition
+    # (deferred: chỉ load khi query chọn cột này)
+    title_norm = deferred(Column(Text, nullable=True))
+    short_definition_norm = deferred(Column(Text, nullable=True))
+
     # Khóa ngoại tham chiếu đến Category
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
 
@@ -55,3 +61,8 @@ class Topic(Base):
         secondary=topic_tags,
         back_populates="topics"
     )
+
+    @validates("title", "short_definition")
+    def _normalize_search_text(self, key, value):
+        setattr(self, f"{key}_norm", remove_vietnamese_tones(value or ""))
+        return value
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+
+from app.infrastructure.database import Base
+
+
+class TopicSimilarity(Base):
+    """
+    Bảng materialized chứa top-K related topics (TF-IDF + Heuristic) của mỗi topic.
+    Được refresh bởi background job khi topic thay đổi title, definition hoặc category.
+    """
+
+    __tablename__ = "topic_similarity"
+
+    # PK (topic_id, rank) -> đọc top N related topics bằng một index range scan
+    topic_id = Column(
+        Integer, ForeignKey("topics.id", ondelete="CASCADE"), primary_key=True
+    )
+    rank = Column(Integer, primary_key=True)  # 0 = liên quan nhất
+    related_topic_id = Column(
+        Integer, ForeignKey("topics.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    score = Column(Float, nullable=False)  # Combined score: TF-IDF (70%) + Heuristic
+
+
+class TopicSimilarityComputed(Base):
+    """
+    Đánh dấu top-K của topic đã được tính, để phân biệt topic không có related
+    topics nào (không có dòng topic_similarity) với topic chưa được tính.
+    """
+
+    __tablename__ = "topic_similarity_computed"
+
+    topic_id = Column(
+        Integer, ForeignKey("topics.id", ondelete="CASCADE"), primary_key=True
+    )
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
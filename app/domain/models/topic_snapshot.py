@@ -0,0 +1,22 @@
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary, String
+
+from app.infrastructure.database import Base
+
+
+class TopicSnapshot(Base):
+    """
+    JSON đã serialize sẵn của TopicResponse (topic + sections + tags) cho mỗi topic.
+    Được build lại khi ghi topic, section hoặc tag, nên GET /topics/{id} chỉ là
+    một lần đọc theo PK thay vì JOIN sections x tags rồi validate lại.
+
+    schema_hash là schema_fingerprint(TopicResponse) lúc ghi: snapshot của phiên bản
+    code có response schema khác được coi như chưa có và được build lại khi đọc.
+    """
+
+    __tablename__ = "topic_snapshots"
+
+    topic_id = Column(
+        Integer, ForeignKey("topics.id", ondelete="CASCADE"), primary_key=True
+    )
+    body = Column(LargeBinary, nullable=False)  # JSON bytes của TopicResponse
+    schema_hash = Column(String(32), nullable=False)
@@ -0,0 +1,54 @@
+"""
+Domain Projections - bản ghi chỉ đọc gồm đúng các cột cần cho chấm điểm.
+
+Repositories trả về các NamedTuple này (thay vì ORM entities) cho những đường
+đọc số lượng lớn như search và related topics: không có identity map, không có
+instance state, không load các cột Text không dùng tới (VD: code_snippet).
+"""
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class TopicRecord(NamedTuple):
+    """Các trường của topic dùng cho TF-IDF + heuristic scoring"""
+
+    id: int
+    title: str
+    short_definition: Optional[str]
+    category_id: int
+
+
+class TopicSearchRecord(NamedTuple):
+    """Topic kèm tên category cho kết quả search"""
+
+    id: int
+    title: str
+    short_definition: Optional[str]
+    category_id: int
+    category_name: Optional[str]
+    created_at: Optional[datetime]
+    # Cột đã bỏ dấu lưu sẵn (None nếu bản ghi cũ chưa được backfill)
+    title_norm: Optional[str]
+    short_definition_norm: Optional[str]
+
+
+class SectionSearchRecord(NamedTuple):
+    """Section kèm title của topic cho kết quả search"""
+
+    id: int
+    heading: Optional[str]
+    content: Optional[str]
+    topic_id: int
+    topic_title: Optional[str]
+    heading_norm: Optional[str]
+    content_norm: Optional[str]
+
+
+class CategorySearchRecord(NamedTuple):
+    """Các trường của category dùng cho search"""
+
+    id: int
+    name: str
+    slug: Optional[str]
+    name_norm: Optional[str]
+    slug_norm: Optional[str]
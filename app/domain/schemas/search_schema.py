@@ -52,3 +52,16 @@ class SearchResponse(BaseModel):
     topics: list[TopicSearchResult] = []
     sections: list[SectionSearchResult] = []
     categories: list[CategorySearchResult] = []
+
+
+class SuggestionItem(BaseModel):
+    """Một gợi ý autocomplete"""
+    type: Literal["topic", "category", "tag"]
+    id: int
+    label: str
+
+
+class SuggestResponse(BaseModel):
+    """Danh sách gợi ý theo prefix"""
+    query: str
+    suggestions: list[SuggestionItem] = []
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
-from app.domain.schemas.section_schema import SectionCreate, SectionResponse
+from app.core.constants import BULK_IMPORT_MAX_TOPICS
+from app.domain.schemas.section_schema import SectionBase, SectionCreate, SectionResponse
 
 # --- Topic Schemas ---
 class TopicBase(BaseModel):
@@ -31,6 +32,22 @@ class TopicResponse(TopicBase):
     class Config:
         from_attributes = True
 
+# --- Bulk import ---
+class TopicBulkItem(BaseModel):
+    """Một topic trong POST /topics/bulk: category và tags theo slug, sections lồng kèm"""
+    title: str
+    short_definition: str
+    category_slug: str
+    tag_slugs: List[str] = []
+    sections: List[SectionBase] = []
+
+class TopicBulkCreate(BaseModel):
+    topics: List[TopicBulkItem] = Field(..., min_length=1, max_length=BULK_IMPORT_MAX_TOPICS)
+
+class TopicBulkResponse(BaseModel):
+    created: int
+    topic_ids: List[int]  # Cùng thứ tự với topics trong request
+
 # Import để avoid circular dependency
 from app.domain.schemas.tag_schema import TagResponse
 TopicResponse.model_rebuild()
\ No newline at end of file
@@ -0,0 +1,11 @@
+from .memory_cache import InMemoryCacheBackend
+from .redis_cache import RedisCacheBackend
+from .response_cache import ResponseCache, response_cache, topic_cache_tags
+
+__all__ = [
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "ResponseCache",
+    "response_cache",
+    "topic_cache_tags",
+]
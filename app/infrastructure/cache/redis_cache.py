@@ -0,0 +1,83 @@
+"""
+Backend cache dùng Redis (optional, cần package `redis`).
+
+Mỗi dependency key được lưu thành một Redis SET chứa các cache keys phụ thuộc
+vào nó, nên nhiều instance của app dùng chung cache và cùng thấy invalidation.
+Client được inject qua constructor để có thể chạy với fake Redis (fakeredis).
+"""
+from typing import Any, Iterable, Optional
+
+from app.application.interfaces.cache_backend_interface import ICacheBackend
+
+
+class RedisCacheBackend(ICacheBackend):
+    """
+    Backend Redis cho response cache.
+
+    Lỗi kết nối Redis không làm hỏng request: đọc lỗi được coi là cache miss,
+    ghi/invalidate lỗi chỉ in warning.
+    """
+
+    def __init__(self, client: Any, prefix: str = "oop-hub:cache:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "oop-hub:cache:") -> "RedisCacheBackend":
+        """Tạo backend từ REDIS_URL (raise ImportError nếu chưa cài package redis)"""
+        import redis
+
+        return cls(redis.Redis.from_url(url), prefix)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}key:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get(self._key(key))
+        except Exception as e:
+            print(f"Warning: Redis cache get failed: {str(e)}")
+            return None
+
+    def set(self, key: str, value: bytes, tags: Iterable[str], ttl: int) -> None:
+        redis_key = self._key(key)
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(redis_key, value, ex=ttl)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, redis_key)
+                # Tag set sống lâu hơn entry một chút để invalidation không bị sót
+                pipe.expire(tag_key, ttl * 2)
+            pipe.execute()
+        except Exception as e:
+            print(f"Warning: Redis cache set failed: {str(e)}")
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return 0
+        try:
+            redis_keys = set()
+            for tag_key in tag_keys:
+                redis_keys.update(self.client.smembers(tag_key))
+            pipe = self.client.pipeline()
+            if redis_keys:
+                pipe.delete(*redis_keys)
+            pipe.delete(*tag_keys)
+            results = pipe.execute()
+            return results[0] if redis_keys else 0
+        except Exception as e:
+            print(f"Warning: Redis cache invalidation failed: {str(e)}")
+            return 0
+
+    def clear(self) -> None:
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            print(f"Warning: Redis cache clear failed: {str(e)}")
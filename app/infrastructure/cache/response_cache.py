@@ -0,0 +1,203 @@
+"""
+Response cache cho các endpoint đọc.
+
+Cache lưu body JSON đã encode sẵn, nên khi hit endpoint trả về luôn bytes mà
+không query database hay chạy lại Pydantic validation/serialization.
+
+Mỗi entry kèm strong ETag (hash nội dung body). Request có If-None-Match khớp
+nhận 304 Not Modified, không có body. Không gửi Last-Modified: thời điểm build
+entry không phải thời điểm nội dung đổi, và độ phân giải 1 giây của
+If-Modified-Since không phân biệt được hai lần ghi trong cùng một giây.
+
+Dependency keys dùng để invalidate:
+- "topic:{id}": topic, sections và liên kết tags của topic
+- "category:{id}", "tag:{id}": một category / tag
+- "category:{id}:topics": danh sách topics thuộc category
+- "topics", "sections", "categories", "tags": các endpoint danh sách
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+from fastapi import Request, Response, status
+
+from app.application.interfaces.cache_backend_interface import ICacheBackend
+from app.core.json_response import encode_model
+
+
+_MAX_PENDING_MISSES = 10000
+
+
+class CachedBody(NamedTuple):
+    """Body JSON đã encode cùng ETag cho conditional request"""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def build(cls, body: bytes) -> "CachedBody":
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        return cls(body, etag)
+
+    def encode(self) -> bytes:
+        return f"{self.etag}\n".encode("ascii") + self.body
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "CachedBody":
+        etag, body = raw.split(b"\n", 1)
+        return cls(body, etag.decode("ascii"))
+
+    def is_not_modified(self, request: Optional[Request]) -> bool:
+        """
+        Kiểm tra If-None-Match. If-Modified-Since bị bỏ qua vì response không
+        có Last-Modified (RFC 9110: khi đó trả về 200 đầy đủ)
+        """
+        if request is None:
+            return False
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is None:
+            return False
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return "*" in candidates or self.etag in candidates
+
+    def to_response(self, request: Optional[Request]) -> Response:
+        headers = {
+            "ETag": self.etag,
+            # Trình duyệt luôn revalidate (rẻ nhờ 304) thay vì tự đoán độ tươi
+            "Cache-Control": "no-cache",
+        }
+        if self.is_not_modified(request):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+def topic_cache_tags(topic: Any) -> List[str]:
+    """Dependency keys của một topic trong response (topic + các tag nhúng kèm)"""
+    return [f"topic:{topic.id}"] + [f"tag:{tag.id}" for tag in (topic.tags or [])]
+
+
+class ResponseCache:
+    """
+    Facade của response cache, backend chọn theo settings (CACHE_BACKEND):
+    - "memory" (mặc định): InMemoryCacheBackend (LRU + TTL)
+    - "redis": RedisCacheBackend (REDIS_URL), fallback về memory nếu không dùng được
+    - "none": tắt cache
+    """
+
+    def __init__(self, backend: Optional[ICacheBackend] = None, ttl: Optional[int] = None) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self._configured = backend is not None
+        # Số lần invalidate, dùng để không lưu response được đọc trước một lần ghi
+        self._generation = 0
+        # key -> generation lúc miss; endpoint threadpool đọc/ghi đồng thời nên luôn giữ _lock
+        self._miss_generation: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, backend: Optional[ICacheBackend], ttl: Optional[int] = None) -> None:
+        """Thay backend (VD: dùng fake Redis khi test), None để tắt cache"""
+        self._backend = backend
+        if ttl is not None:
+            self._ttl = ttl
+        self._configured = True
+
+    @property
+    def backend(self) -> Optional[ICacheBackend]:
+        if not self._configured:
+            self._backend = self._create_backend()
+            self._configured = True
+        return self._backend
+
+    @property
+    def ttl(self) -> int:
+        if self._ttl is None:
+            from app.core.settings import get_settings
+
+            self._ttl = get_settings().CACHE_TTL_SECONDS
+        return self._ttl
+
+    def _create_backend(self) -> Optional[ICacheBackend]:
+        from app.core.settings import get_settings
+        from app.infrastructure.cache.memory_cache import InMemoryCacheBackend
+
+        settings = get_settings()
+        backend_name = settings.CACHE_BACKEND.lower()
+        if backend_name == "none":
+            return None
+        if backend_name == "redis":
+            try:
+                from app.infrastructure.cache.redis_cache import RedisCacheBackend
+
+                return RedisCacheBackend.from_url(settings.REDIS_URL)
+            except Exception as e:
+                print(f"Warning: Redis cache unavailable, using in-memory cache: {str(e)}")
+        return InMemoryCacheBackend(settings.CACHE_MAX_ENTRIES)
+
+    def get(self, key: str, request: Optional[Request] = None) -> Optional[Response]:
+        """
+        Response đã cache cho key (304 nếu request có validators khớp), None nếu miss
+        """
+        backend = self.backend
+        if backend is None:
+            return None
+        raw = backend.get(key)
+        if raw is not None:
+            return CachedBody.decode(raw).to_response(request)
+        with self._lock:
+            # Nhiều request cùng miss một key: giữ generation cũ nhất, để body đọc
+            # trước một lần invalidate không được lưu nhờ generation của request sau
+            self._miss_generation.setdefault(key, self._generation)
+            if len(self._miss_generation) > _MAX_PENDING_MISSES:
+                # VD: nhiều request 404 không bao giờ store; key bị bỏ sẽ không được lưu
+                self._miss_generation.popitem(last=False)
+        return None
+
+    def store(
+        self,
+        key: str,
+        response_model: Any,
+        value: Any,
+        tags: Iterable[str],
+        request: Optional[Request] = None,
+    ) -> Response:
+        """Encode value theo response_model, lưu vào cache và trả về Response"""
+        # Chỉ validate khi value chưa đúng kiểu response_model (VD: TopicResponse -> TopicListItem)
+        return self.store_body(key, encode_model(response_model, value), tags, request)
+
+    def store_body(
+        self,
+        key: str,
+        body: bytes,
+        tags: Iterable[str],
+        request: Optional[Request] = None,
+    ) -> Response:
+        """Lưu body JSON đã encode sẵn (VD: topic snapshot) vào cache và trả về Response"""
+        backend = self.backend
+        cached = CachedBody.build(body)
+        if backend is not None:
+            # Chỉ lưu khi không có invalidate nào kể từ lúc miss; không còn generation của
+            # lần miss (đã bị bỏ hoặc request khác đã lưu) thì không lưu
+            with self._lock:
+                generation = self._miss_generation.pop(key, None)
+            if generation == self._generation:
+                tags = list(tags)
+                backend.set(key, cached.encode(), tags, self.ttl)
+                # Invalidate chạy xen giữa lúc kiểm tra và lúc set: xóa lại entry vừa lưu
+                if generation != self._generation:
+                    backend.invalidate_tags(tags)
+        return cached.to_response(request)
+
+    def invalidate(self, *tags: str) -> None:
+        """Xóa các entry phụ thuộc vào bất kỳ dependency key nào trong tags"""
+        backend = self.backend
+        if backend is not None and tags:
+            with self._lock:
+                self._generation += 1
+            backend.invalidate_tags(tags)
+
+
+# Instance dùng chung trong process
+response_cache = ResponseCache()
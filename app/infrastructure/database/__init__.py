@@ -1,3 +1,19 @@
-from .connection import engine, Base, SessionLocal, get_db
+from .connection import (
+    engine,
+    Base,
+    SessionLocal,
+    get_db,
+    async_engine,
+    AsyncSessionLocal,
+    get_async_db,
+)
 
-__all__ = ["engine", "Base", "SessionLocal", "get_db"]
+__all__ = [
+    "engine",
+    "Base",
+    "SessionLocal",
+    "get_db",
+    "async_engine",
+    "AsyncSessionLocal",
+    "get_async_db",
+]
@@ -1,4 +1,7 @@
+from urllib.parse import parse_qsl, urlencode
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -22,6 +25,52 @@ engine = create_engine(
 # Tạo SessionLocal
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def to_async_database_url(url: str) -> str:
+    """
+    Chuyển DATABASE_URL (driver sync) sang URL cho driver async:
+    - postgresql:// (psycopg2) -> postgresql+asyncpg://
+    - sqlite:// -> sqlite+aiosqlite:// (local development)
+
+    asyncpg không nhận các tham số libpq như sslmode/channel_binding,
+    nên sslmode được đổi thành ssl và các tham số không hỗ trợ bị bỏ đi.
+    """
+    scheme, _, rest = url.partition("://")
+    driver = scheme.split("+", 1)[0]
+    if driver == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    if driver not in ("postgresql", "postgres"):
+        return url
+
+    location, _, query_string = rest.partition("?")
+    query = []
+    for key, value in parse_qsl(query_string, keep_blank_values=True):
+        if key == "sslmode":
+            query.append(("ssl", value))
+        elif key not in ("channel_binding", "options"):
+            query.append((key, value))
+    async_url = f"postgresql+asyncpg://{location}"
+    return f"{async_url}?{urlencode(query)}" if query else async_url
+
+
+# Async engine cho các endpoint đọc chạy trực tiếp trên event loop
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_database_url(DATABASE_URL)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=5,
+    max_overflow=10
+)
+
+# Tạo AsyncSessionLocal (expire_on_commit=False để dùng object sau commit mà không lazy load)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base class để các Model kế thừa
 Base = declarative_base()
 
@@ -32,3 +81,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# Dependency để lấy AsyncSession (dùng trong các endpoint async def)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
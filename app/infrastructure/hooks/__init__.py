@@ -0,0 +1,3 @@
+from .content_change_handler import ContentChangeHandler, read_content_stamp
+
+__all__ = ["ContentChangeHandler", "read_content_stamp"]
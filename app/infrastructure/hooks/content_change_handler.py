@@ -0,0 +1,146 @@
+"""
+Các tác dụng phụ sau commit của mọi lần ghi nội dung, tập trung ở một chỗ.
+
+Thứ tự trong mỗi handler:
+1. Tăng content revision trong database (các instance khác phát hiện qua content stamp)
+   và bump_content_version(): search index / search cache / TF-IDF model của process này
+   biết cần kiểm tra lại
+2. Ghi lại topic snapshots, trước khi invalidate response cache để cache không giữ bản cũ
+3. Cập nhật suggestion index
+4. Invalidate response cache theo dependency keys (xem response_cache.py)
+5. Schedule job tính lại topic_similarity
+"""
+from typing import Iterable, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.content_change_handler_interface import IContentChangeHandler
+from app.application.services.suggestion_index import suggestion_index
+from app.core.content_version import bump_content_version
+from app.infrastructure.cache import response_cache
+from app.infrastructure.database import SessionLocal
+from app.infrastructure.jobs import (
+    schedule_similarity_refresh,
+    schedule_similarity_refresh_for_changes,
+    schedule_similarity_rows_refresh,
+)
+from app.infrastructure.repositories.content_revision_repository import ContentRevisionRepository
+from app.infrastructure.repositories.topic_snapshot_repository import TopicSnapshotRepository
+
+
+def _topic_cache_tags(
+    topic_ids: Iterable[int], category_ids: Iterable[int], changed_tag_ids: Iterable[int]
+) -> List[str]:
+    """Cache phụ thuộc vào topics, danh sách topics/sections và các tag có liên kết thay đổi"""
+    tags = [f"topic:{topic_id}" for topic_id in topic_ids] + ["topics", "sections"]
+    tags += [f"category:{category_id}:topics" for category_id in set(category_ids)]
+    changed_tag_ids = set(changed_tag_ids)
+    if changed_tag_ids:
+        tags.append("tags")
+        tags += [f"tag:{tag_id}" for tag_id in changed_tag_ids]
+    return tags
+
+
+def read_content_stamp() -> Tuple[int, ...]:
+    """Content stamp hiện tại trong database (reader của app.core.content_version)"""
+    with SessionLocal() as db:
+        return ContentRevisionRepository(db).get_stamp()
+
+
+class ContentChangeHandler(IContentChangeHandler):
+    """Implementation của IContentChangeHandler trên DB session của request"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _bump_content_version(self) -> None:
+        stamp = None
+        try:
+            revisions = ContentRevisionRepository(self.db)
+            revision = revisions.bump()
+            stamp = revisions.get_stamp()
+            if stamp[0] != revision:
+                # Instance khác ghi xen vào: để lần refresh sau phát hiện
+                stamp = None
+        except Exception as e:
+            self.db.rollback()
+            print(f"Warning: Failed to bump content revision: {str(e)}")
+        bump_content_version(stamp)
+
+    def topic_saved(
+        self,
+        topic_id: int,
+        title: str,
+        category_ids: Iterable[int],
+        changed_tag_ids: Iterable[int],
+        similarity_changed: bool,
+    ) -> None:
+        self._bump_content_version()
+        TopicSnapshotRepository(self.db).refresh([topic_id])
+        suggestion_index.upsert("topic", topic_id, title)
+        response_cache.invalidate(*_topic_cache_tags([topic_id], category_ids, changed_tag_ids))
+        if similarity_changed:
+            schedule_similarity_refresh(topic_id)
+
+    def topic_deleted(
+        self,
+        topic_id: int,
+        category_id: int,
+        tag_ids: Iterable[int],
+        referencing_topic_ids: Iterable[int],
+    ) -> None:
+        # Snapshot đã được xóa cùng transaction với topic
+        self._bump_content_version()
+        suggestion_index.remove("topic", topic_id)
+        response_cache.invalidate(*_topic_cache_tags([topic_id], [category_id], tag_ids))
+        referencing_topic_ids = set(referencing_topic_ids) - {topic_id}
+        if referencing_topic_ids:
+            schedule_similarity_rows_refresh(referencing_topic_ids)
+
+    def topics_imported(
+        self, topic_ids: List[int], category_ids: Iterable[int], tag_ids: Iterable[int]
+    ) -> None:
+        # Snapshot của topic mới được build ở lần đọc đầu tiên (AsyncTopicService.get_topic_json)
+        self._bump_content_version()
+        suggestion_index.invalidate()
+        response_cache.invalidate(*_topic_cache_tags([], category_ids, tag_ids))
+        # Chỉ tính lại topics mới và các topics mà chúng có thể lọt vào top-K
+        schedule_similarity_refresh_for_changes(topic_ids)
+
+    def sections_changed(self, topic_ids: Iterable[int]) -> None:
+        topic_ids = set(topic_ids)
+        self._bump_content_version()
+        TopicSnapshotRepository(self.db).refresh(topic_ids)
+        response_cache.invalidate(*_topic_cache_tags(topic_ids, [], []))
+
+    def category_saved(self, category_id: int, name: str) -> None:
+        self._bump_content_version()
+        suggestion_index.upsert("category", category_id, name)
+        response_cache.invalidate(f"category:{category_id}", "categories")
+
+    def category_deleted(self, category_id: int) -> None:
+        self._bump_content_version()
+        suggestion_index.remove("category", category_id)
+        response_cache.invalidate(
+            f"category:{category_id}", f"category:{category_id}:topics", "categories"
+        )
+
+    def tag_saved(self, tag_id: int, name: str, topic_ids: Iterable[int]) -> None:
+        # Tag được nhúng trong snapshot của các topics gắn tag và trong suggestion index
+        topic_ids = list(topic_ids)
+        self._bump_content_version()
+        TopicSnapshotRepository(self.db).refresh(topic_ids)
+        suggestion_index.upsert("tag", tag_id, name)
+        response_cache.invalidate(
+            f"tag:{tag_id}", "tags", *(f"topic:{topic_id}" for topic_id in topic_ids)
+        )
+
+    def tag_deleted(self, tag_id: int, topic_ids: Iterable[int]) -> None:
+        # Gỡ liên kết topic_tags làm đổi kết quả search lọc theo tag
+        topic_ids = list(topic_ids)
+        self._bump_content_version()
+        TopicSnapshotRepository(self.db).refresh(topic_ids)
+        suggestion_index.remove("tag", tag_id)
+        response_cache.invalidate(
+            f"tag:{tag_id}", "tags", *(f"topic:{topic_id}" for topic_id in topic_ids)
+        )
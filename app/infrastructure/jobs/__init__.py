@@ -0,0 +1,25 @@
+from .bounded_executor import (
+    BoundedExecutor,
+    ExecutorSaturatedError,
+    related_topics_executor,
+)
+from .normalized_columns import backfill_normalized_columns
+from .topic_similarity_jobs import (
+    schedule_full_similarity_refresh,
+    schedule_similarity_refresh,
+    schedule_similarity_refresh_for_changes,
+    schedule_similarity_rows_refresh,
+    shutdown_similarity_jobs,
+)
+
+__all__ = [
+    "BoundedExecutor",
+    "ExecutorSaturatedError",
+    "backfill_normalized_columns",
+    "related_topics_executor",
+    "schedule_full_similarity_refresh",
+    "schedule_similarity_refresh",
+    "schedule_similarity_refresh_for_changes",
+    "schedule_similarity_rows_refresh",
+    "shutdown_similarity_jobs",
+]
@@ -0,0 +1,203 @@
+"""
+Executor có giới hạn cho các tác vụ nặng được gọi từ endpoint async.
+
+- Phần I/O database + tính điểm chạy trên thread pool với số worker cố định
+  (concurrency limit) và hàng đợi có giới hạn: khi hàng đợi đầy, request bị từ
+  chối ngay (ExecutorSaturatedError) thay vì xếp hàng vô hạn.
+- Phần CPU-bound (fit TF-IDF) chạy trên process pool để không giữ GIL của
+  process đang phục vụ event loop. Nếu môi trường không hỗ trợ multiprocessing
+  (VD: AWS Lambda) hoặc process pool bị tắt, tác vụ chạy ngay trên thread gọi.
+
+Các pool được tạo lazily và có thể tạo lại sau shutdown() (Mangum chạy lifespan
+cho mỗi lần invoke).
+"""
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(Exception):
+    """Hàng đợi của executor đã đầy"""
+
+
+class BoundedExecutor:
+    """
+    Thread pool có giới hạn concurrency + độ dài hàng đợi, kèm process pool
+    cho phần CPU-bound và các chỉ số (queue depth, active, rejected...).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        process_workers: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._process_workers = process_workers
+
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_unavailable = False
+
+        self._queued = 0
+        self._active = 0
+        self._max_queued_seen = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._process_active = 0
+        self._process_completed = 0
+
+    def _load_limits(self) -> None:
+        if None in (self._max_workers, self._max_queue, self._process_workers):
+            from app.core.settings import get_settings
+
+            settings = get_settings()
+            if self._max_workers is None:
+                self._max_workers = settings.RELATED_TOPICS_MAX_CONCURRENCY
+            if self._max_queue is None:
+                self._max_queue = settings.RELATED_TOPICS_MAX_QUEUE
+            if self._process_workers is None:
+                self._process_workers = settings.TFIDF_PROCESS_WORKERS
+
+    @property
+    def max_workers(self) -> int:
+        self._load_limits()
+        return max(1, self._max_workers)
+
+    @property
+    def max_queue(self) -> int:
+        self._load_limits()
+        return max(0, self._max_queue)
+
+    @property
+    def process_workers(self) -> int:
+        self._load_limits()
+        return max(0, self._process_workers)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Chạy fn(*args) trên thread pool và chờ kết quả mà không block event loop.
+
+        Raises:
+            ExecutorSaturatedError: Nếu số tác vụ đang chờ đã chạm max_queue
+        """
+        with self._lock:
+            # Tác vụ đang chạy + đang chờ không vượt quá max_workers + max_queue
+            if self._queued + self._active >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturatedError(
+                    f"{self.name} executor is saturated ({self._queued} queued)"
+                )
+            self._queued += 1
+            self._max_queued_seen = max(self._max_queued_seen, self._queued)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+            future = self._pool.submit(self._call, fn, args)
+
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _call(self, fn: Callable[..., T], args: tuple) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            if future.cancelled():
+                # Bị hủy khi còn trong hàng đợi (VD: client ngắt kết nối)
+                self._queued -= 1
+            elif future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def run_in_process(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Chạy fn(*args) trên process pool và chờ kết quả (gọi từ worker thread).
+        fn và args phải pickle được. Fallback chạy trực tiếp nếu không có process pool.
+        """
+        pool = self._get_process_pool()
+        if pool is None:
+            return fn(*args)
+
+        with self._lock:
+            self._process_active += 1
+        try:
+            return pool.submit(fn, *args).result()
+        except BrokenProcessPool as e:
+            print(f"Warning: {self.name} process pool broken, running in thread: {str(e)}")
+            with self._lock:
+                if self._process_pool is pool:
+                    self._process_pool = None
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._process_active -= 1
+                self._process_completed += 1
+
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._process_pool is not None:
+                return self._process_pool
+            if self._process_pool_unavailable or self.process_workers == 0:
+                return None
+            try:
+                # spawn: không fork process đang có nhiều thread + connection pool
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except (OSError, NotImplementedError) as e:
+                print(f"Warning: {self.name} process pool unavailable, running in thread: {str(e)}")
+                self._process_pool_unavailable = True
+                return None
+            return self._process_pool
+
+    def metrics(self) -> Dict[str, Any]:
+        """Các chỉ số hiện tại của executor"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queued_seen,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "process_workers": 0 if self._process_pool_unavailable else self.process_workers,
+                "process_active": self._process_active,
+                "process_completed": self._process_completed,
+            }
+
+    def shutdown(self) -> None:
+        """Dừng các pool (bỏ các tác vụ chưa chạy), pool sẽ được tạo lại khi cần"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            process_pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        if process_pool is not None:
+            process_pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Executor dùng chung cho endpoint related topics
+related_topics_executor = BoundedExecutor("related-topics")
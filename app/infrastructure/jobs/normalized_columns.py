@@ -0,0 +1,79 @@
+"""
+Thêm và backfill các cột *_norm (text đã bỏ dấu, chữ thường) cho search.
+
+Bản ghi mới được ghi *_norm tự động qua @validates của model; job này chỉ dành
+cho database tạo trước khi có các cột đó (create_all không thêm cột vào bảng cũ).
+Development chạy job lúc khởi động app; production chạy một lần bằng
+`python backfill_normalized_columns.py` trước khi deploy.
+"""
+from typing import Tuple, Type
+
+from sqlalchemy import bindparam, inspect, or_, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from app.core.text_utils import remove_vietnamese_tones
+from app.domain.models import Category, Section, Topic
+
+# (model, ((cột gốc, cột *_norm), ...))
+NORMALIZED_FIELDS: Tuple[Tuple[Type, Tuple[Tuple[str, str], ...]], ...] = (
+    (Topic, (("title", "title_norm"), ("short_definition", "short_definition_norm"))),
+    (Section, (("heading", "heading_norm"), ("content", "content_norm"))),
+    (Category, (("name", "name_norm"), ("slug", "slug_norm"))),
+)
+
+
+def backfill_normalized_columns(bind: Engine, batch_size: int = 500) -> int:
+    """
+    Thêm các cột *_norm còn thiếu và điền giá trị cho các dòng đang NULL (idempotent)
+
+    Returns:
+        Số dòng đã được backfill
+    """
+    inspector = inspect(bind)
+    updated = 0
+    for model, fields in NORMALIZED_FIELDS:
+        table = model.__table__
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for _, norm_name in fields:
+            if norm_name not in existing:
+                _add_column(bind, table.name, norm_name)
+
+        raw_columns = [table.c[raw_name] for raw_name, _ in fields]
+        missing = or_(*(table.c[norm_name].is_(None) for _, norm_name in fields))
+        statement = update(table).where(table.c.id == bindparam("row_id")).values(
+            {norm_name: bindparam(f"new_{norm_name}") for _, norm_name in fields}
+        )
+        while True:
+            with bind.begin() as conn:
+                rows = conn.execute(
+                    select(table.c.id, *raw_columns).where(missing).limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                conn.execute(statement, [
+                    {
+                        "row_id": row[0],
+                        **{
+                            f"new_{norm_name}": remove_vietnamese_tones(value or "")
+                            for (_, norm_name), value in zip(fields, row[1:])
+                        },
+                    }
+                    for row in rows
+                ])
+            updated += len(rows)
+    return updated
+
+
+def _add_column(bind: Engine, table_name: str, column_name: str) -> None:
+    """ALTER TABLE ADD COLUMN, bỏ qua lỗi nếu process khác vừa thêm cột đó"""
+    try:
+        with bind.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} TEXT"))
+    except DBAPIError:
+        columns = {column["name"] for column in inspect(bind).get_columns(table_name)}
+        if column_name not in columns:
+            raise
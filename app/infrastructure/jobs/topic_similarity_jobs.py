@@ -0,0 +1,79 @@
+"""
+Background jobs refresh bảng topic_similarity.
+
+Jobs chạy tuần tự trên một worker thread riêng với DB session riêng, nên request
+ghi topic không phải chờ tính lại TF-IDF + Heuristic.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+if TYPE_CHECKING:
+    from app.application.services.topic_similarity_service import TopicSimilarityService
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _submit(job: Callable[["TopicSimilarityService"], int]) -> Future:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="topic-similarity"
+            )
+        return _executor.submit(_run, job)
+
+
+def _run(job: Callable[["TopicSimilarityService"], int]) -> int:
+    # Import trong hàm để tránh vòng import với TopicRepository
+    from app.application.services.topic_similarity_service import TopicSimilarityService
+    from app.infrastructure.database import SessionLocal
+    from app.infrastructure.repositories.topic_repository import TopicRepository
+    from app.infrastructure.repositories.topic_similarity_repository import (
+        TopicSimilarityRepository,
+    )
+
+    db = SessionLocal()
+    try:
+        service = TopicSimilarityService(
+            TopicRepository(db), TopicSimilarityRepository(db)
+        )
+        return job(service)
+    except Exception as e:
+        db.rollback()
+        print(f"Warning: Topic similarity refresh failed: {str(e)}")
+        return 0
+    finally:
+        db.close()
+
+
+def schedule_similarity_refresh(changed_topic_id: int) -> Future:
+    """Refresh các dòng bị ảnh hưởng khi topic được tạo/cập nhật"""
+    return _submit(lambda service: service.refresh_for_change(changed_topic_id))
+
+
+def schedule_similarity_refresh_for_changes(changed_topic_ids: Iterable[int]) -> Future:
+    """Refresh các dòng bị ảnh hưởng bởi nhiều topics mới/đã sửa trong một job (VD: bulk import)"""
+    changed_topic_ids = list(changed_topic_ids)
+    return _submit(lambda service: service.refresh_for_changes(changed_topic_ids))
+
+
+def schedule_similarity_rows_refresh(topic_ids: Iterable[int]) -> Future:
+    """Refresh dòng của các topics chỉ định (VD: sau khi xóa một topic)"""
+    topic_ids = list(topic_ids)
+    return _submit(lambda service: service.refresh_topics(topic_ids))
+
+
+def schedule_full_similarity_refresh(only_if_empty: bool = False) -> Future:
+    """Tính lại toàn bộ bảng (only_if_empty=True dùng để backfill lúc khởi động)"""
+    return _submit(lambda service: service.refresh_all(only_if_empty=only_if_empty))
+
+
+def shutdown_similarity_jobs() -> None:
+    """Dừng worker khi app shutdown (bỏ các job chưa chạy)"""
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
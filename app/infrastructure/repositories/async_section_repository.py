@@ -0,0 +1,49 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.models import Section
+from app.application.interfaces.section_repository_interface import IAsyncSectionRepository
+
+class AsyncSectionRepository(IAsyncSectionRepository):
+    """
+    Implementation async của IAsyncSectionRepository sử dụng SQLAlchemy AsyncSession.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, section_id: int) -> Optional[Section]:
+        """Lấy Section theo ID"""
+        result = await self.db.execute(select(Section).filter(Section.id == section_id))
+        return result.scalars().first()
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Section]:
+        """Lấy danh sách tất cả Sections với phân trang"""
+        result = await self.db.execute(
+            select(Section)
+            .order_by(Section.topic_id, Section.order_index)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_page_after(
+        self, after: Optional[Tuple[int, int, int]], limit: int
+    ) -> List[Section]:
+        """Keyset pagination theo (topic_id, order_index, id)"""
+        query = select(Section)
+        if after is not None:
+            query = query.filter(tuple_(Section.topic_id, Section.order_index, Section.id) > after)
+        result = await self.db.execute(
+            query.order_by(Section.topic_id, Section.order_index, Section.id).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_topic_id(self, topic_id: int) -> List[Section]:
+        """Lấy tất cả Sections thuộc về một Topic, sắp xếp theo order_index"""
+        result = await self.db.execute(
+            select(Section)
+            .filter(Section.topic_id == topic_id)
+            .order_by(Section.order_index)
+        )
+        return list(result.scalars().all())
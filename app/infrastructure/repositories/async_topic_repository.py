@@ -0,0 +1,104 @@
+from typing import List, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.json_response import schema_fingerprint
+from app.domain.models import Topic, TopicSnapshot
+from app.domain.schemas.topic_schema import TopicResponse
+from app.application.interfaces.topic_repository_interface import IAsyncTopicRepository
+from app.infrastructure.repositories.loading_strategy import collection_loader
+
+class AsyncTopicRepository(IAsyncTopicRepository):
+    """
+    Implementation async của IAsyncTopicRepository sử dụng SQLAlchemy AsyncSession.
+    Mọi quan hệ mà response schema cần đều được eager load, vì AsyncSession
+    không cho phép lazy load khi đọc attribute. Cách eager load theo loading_strategy.
+    """
+
+    def __init__(self, db: AsyncSession, loading_strategy: Optional[str] = None):
+        self.db = db
+        self._load = collection_loader(loading_strategy)
+
+    async def get_by_id(self, topic_id: int) -> Optional[Topic]:
+        """Lấy topic theo ID với eager loading sections và tags"""
+        result = await self.db.execute(
+            select(Topic)
+            .options(self._load(Topic.sections), self._load(Topic.tags))
+            .filter(Topic.id == topic_id)
+        )
+        return result.unique().scalars().first()
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Topic]:
+        """Lấy danh sách topics với phân trang, eager loading sections và tags"""
+        result = await self.db.execute(
+            select(Topic)
+            .options(self._load(Topic.sections), self._load(Topic.tags))
+            .order_by(Topic.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.unique().scalars().all())
+
+    async def get_list(self, skip: int = 0, limit: int = 100) -> List[Topic]:
+        """Lấy trang topics cho danh sách: cột của topic + tags, không load sections"""
+        result = await self.db.execute(
+            select(Topic)
+            .options(self._load(Topic.tags))
+            .order_by(Topic.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.unique().scalars().all())
+
+    async def get_page_after(
+        self, after_id: Optional[int], limit: int, category_id: Optional[int] = None
+    ) -> List[Topic]:
+        """Keyset pagination theo id (kèm tags, không load sections)"""
+        query = select(Topic).options(self._load(Topic.tags))
+        if category_id:
+            query = query.filter(Topic.category_id == category_id)
+        if after_id is not None:
+            query = query.filter(Topic.id > after_id)
+        result = await self.db.execute(query.order_by(Topic.id).limit(limit))
+        return list(result.unique().scalars().all())
+
+    async def get_by_category(self, category_id: int, skip: int = 0, limit: int = 100) -> List[Topic]:
+        """Lấy danh sách topics theo category (load tags cho filtering, không load sections)"""
+        result = await self.db.execute(
+            select(Topic)
+            .options(self._load(Topic.tags))
+            .filter(Topic.category_id == category_id)
+            .order_by(Topic.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.unique().scalars().all())
+
+    async def get_snapshot(self, topic_id: int) -> Optional[bytes]:
+        """
+        Lấy JSON TopicResponse đã serialize sẵn bằng một lần đọc theo PK.
+        Snapshot ghi theo response schema khác (phiên bản code trước) coi như không có.
+        """
+        return await self.db.scalar(
+            select(TopicSnapshot.body).filter(
+                TopicSnapshot.topic_id == topic_id,
+                TopicSnapshot.schema_hash == schema_fingerprint(TopicResponse),
+            )
+        )
+
+    async def save_snapshot(self, topic_id: int, body: bytes) -> None:
+        """
+        Lưu snapshot thay cho snapshot theo schema cũ (nếu có);
+        nếu một lần ghi đã tạo snapshot mới hơn thì giữ bản đó
+        """
+        schema_hash = schema_fingerprint(TopicResponse)
+        await self.db.execute(
+            delete(TopicSnapshot).where(
+                TopicSnapshot.topic_id == topic_id, TopicSnapshot.schema_hash != schema_hash
+            )
+        )
+        self.db.add(TopicSnapshot(topic_id=topic_id, body=body, schema_hash=schema_hash))
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from sqlalchemy.orm import Session
 from app.domain.models import Category
+from app.domain.projections import CategorySearchRecord
 from app.domain.schemas.category_schema import CategoryCreate, CategoryUpdate
 from app.application.interfaces.category_repository_interface import ICategoryRepository
 
@@ -32,10 +33,26 @@ class CategoryRepository(ICategoryRepository):
         """Lấy category theo slug"""
         return self.db.query(Category).filter(Category.slug == slug).first()
     
+    def get_search_records(self, category_ids: Optional[Iterable[int]] = None) -> List[CategorySearchRecord]:
+        """Lấy CategorySearchRecord theo thứ tự id (category_ids = None nghĩa là tất cả)"""
+        query = self.db.query(
+            Category.id, Category.name, Category.slug, Category.name_norm, Category.slug_norm
+        )
+        if category_ids is not None:
+            query = query.filter(Category.id.in_(category_ids))
+        return [CategorySearchRecord(*row) for row in query.order_by(Category.id)]
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Category]:
         """Lấy danh sách categories với phân trang"""
         return self.db.query(Category).offset(skip).limit(limit).all()
     
+    def get_page_after(self, after_id: Optional[int], limit: int) -> List[Category]:
+        """Keyset pagination theo id"""
+        query = self.db.query(Category)
+        if after_id is not None:
+            query = query.filter(Category.id > after_id)
+        return query.order_by(Category.id).limit(limit).all()
+    
     def update(self, category_id: int, category_data: CategoryUpdate) -> Optional[Category]:
         """Cập nhật category"""
         category = self.get_by_id(category_id)
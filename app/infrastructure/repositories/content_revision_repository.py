@@ -0,0 +1,56 @@
+from typing import Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.content_revision_repository_interface import (
+    IContentRevisionRepository,
+)
+from app.domain.models import Category, ContentRevision, Section, Tag, Topic
+
+_ROW_ID = 1
+
+
+class ContentRevisionRepository(IContentRevisionRepository):
+    """
+    Implementation của IContentRevisionRepository sử dụng SQLAlchemy ORM.
+    Bảng content_revision chỉ có một dòng (id = 1), được tạo ở lần bump đầu tiên.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def bump(self) -> int:
+        """UPDATE ... SET revision = revision + 1 (nguyên tử giữa các instance)"""
+        statement = update(ContentRevision)\
+            .where(ContentRevision.id == _ROW_ID)\
+            .values(revision=ContentRevision.revision + 1)
+        try:
+            if self.db.execute(statement).rowcount == 0:
+                # Chưa có dòng: instance khác có thể insert cùng lúc, khi đó update lại
+                try:
+                    with self.db.begin_nested():
+                        self.db.add(ContentRevision(id=_ROW_ID, revision=1))
+                except IntegrityError:
+                    self.db.execute(statement)
+            revision = self.db.scalar(
+                select(ContentRevision.revision).where(ContentRevision.id == _ROW_ID)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return revision
+
+    def get_stamp(self) -> Tuple[int, ...]:
+        columns = [
+            select(ContentRevision.revision)
+            .where(ContentRevision.id == _ROW_ID)
+            .scalar_subquery()
+        ]
+        for model in (Topic, Section, Category, Tag):
+            columns.append(select(func.count()).select_from(model).scalar_subquery())
+            columns.append(select(func.max(model.id)).scalar_subquery())
+        row = self.db.execute(select(*columns)).one()
+        return tuple(value or 0 for value in row)
@@ -0,0 +1,34 @@
+"""
+Chiến lược eager load các collection của Topic (sections, tags).
+
+- "selectin" (mặc định): mỗi collection thêm một SELECT ... WHERE topic_id IN (...),
+  số dòng trả về đúng bằng số sections / tags
+- "subquery": như selectin nhưng lặp lại query gốc dưới dạng subquery thay vì danh sách IDs
+- "joined": LEFT OUTER JOIN trong cùng query; load cả sections và tags cùng lúc tạo
+  tích Descartes (10 sections x 8 tags = 80 dòng) mà SQLAlchemy phải khử trùng lặp
+
+Chọn qua settings TOPIC_LOADING_STRATEGY hoặc tham số loading_strategy của repository.
+"""
+from typing import Callable, Optional
+
+from sqlalchemy.orm import joinedload, selectinload, subqueryload
+
+LOADING_STRATEGIES = {
+    "joined": joinedload,
+    "selectin": selectinload,
+    "subquery": subqueryload,
+}
+
+
+def collection_loader(strategy: Optional[str] = None) -> Callable:
+    """Loader option (joinedload/selectinload/subqueryload) theo tên, mặc định theo settings"""
+    if strategy is None:
+        from app.core.settings import get_settings
+
+        strategy = get_settings().TOPIC_LOADING_STRATEGY
+    try:
+        return LOADING_STRATEGIES[strategy.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown loading strategy '{strategy}', expected one of {', '.join(LOADING_STRATEGIES)}"
+        )
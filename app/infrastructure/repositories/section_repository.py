@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from sqlalchemy.orm import Session
-from app.domain.models import Section
+from app.domain.models import Section, Topic
+from app.domain.projections import SectionSearchRecord
 from app.domain.schemas.section_schema import SectionCreate
 from app.application.interfaces.section_repository_interface import ISectionRepository
 
@@ -30,6 +31,24 @@ class SectionRepository(ISectionRepository):
         """Lấy Section theo ID"""
         return self.db.query(Section).filter(Section.id == section_id).first()
     
+    def get_search_records(self, section_ids: Optional[Iterable[int]] = None) -> List[SectionSearchRecord]:
+        """
+        Lấy SectionSearchRecord theo thứ tự id: chỉ các cột cần cho search,
+        kèm title của topic qua JOIN (một query, không tạo ORM objects)
+        """
+        query = self.db.query(
+            Section.id,
+            Section.heading,
+            Section.content,
+            Section.topic_id,
+            Topic.title,
+            Section.heading_norm,
+            Section.content_norm,
+        ).outerjoin(Topic, Section.topic_id == Topic.id)
+        if section_ids is not None:
+            query = query.filter(Section.id.in_(section_ids))
+        return [SectionSearchRecord(*row) for row in query.order_by(Section.id)]
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Section]:
         """Lấy danh sách tất cả Sections với phân trang"""
         return self.db.query(Section)\
@@ -1,7 +1,8 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
 from app.application.interfaces.tag_repository_interface import ITagRepository
-from app.domain.models.tag import Tag
+from app.domain.models.tag import Tag, topic_tags
 from app.domain.schemas.tag_schema import TagCreate, TagUpdate
 
 
@@ -18,6 +19,37 @@ class TagRepository(ITagRepository):
         """Lấy tất cả tags"""
         return self.db.query(Tag).offset(skip).limit(limit).all()
 
+    def get_all_with_counts(self, skip: int = 0, limit: int = 100) -> List[tuple[Tag, int]]:
+        """Lấy tags kèm số topics trong một query GROUP BY"""
+        return self._with_topic_counts().order_by(Tag.id).offset(skip).limit(limit).all()
+
+    def get_page_after(self, after_id: Optional[int], limit: int) -> List[tuple[Tag, int]]:
+        """Keyset pagination theo id, kèm số topics"""
+        query = self._with_topic_counts()
+        if after_id is not None:
+            query = query.filter(Tag.id > after_id)
+        return query.order_by(Tag.id).limit(limit).all()
+
+    def count_topics(self, tag_id: int) -> int:
+        """Đếm số topics gắn tag (không load collection topics)"""
+        return self.db.query(func.count(topic_tags.c.topic_id))\
+            .filter(topic_tags.c.tag_id == tag_id)\
+            .scalar()
+
+    def get_topic_ids(self, tag_id: int) -> List[int]:
+        """Lấy IDs của các topics gắn tag, chỉ đọc bảng topic_tags"""
+        rows = self.db.query(topic_tags.c.topic_id)\
+            .filter(topic_tags.c.tag_id == tag_id)\
+            .order_by(topic_tags.c.topic_id)\
+            .all()
+        return [topic_id for (topic_id,) in rows]
+
+    def _with_topic_counts(self) -> Query:
+        # LEFT JOIN để tag chưa gắn topic nào vẫn có mặt với count = 0
+        return self.db.query(Tag, func.count(topic_tags.c.topic_id))\
+            .outerjoin(topic_tags, Tag.id == topic_tags.c.tag_id)\
+            .group_by(Tag.id)
+
     def get_by_id(self, tag_id: int) -> Optional[Tag]:
         """Lấy tag theo ID"""
         return self.db.query(Tag).filter(Tag.id == tag_id).first()
@@ -1,17 +1,27 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from app.domain.models import Topic, Section, Tag
-from app.domain.schemas.topic_schema import TopicCreate
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+from app.domain.models import Category, Topic, Section, Tag, topic_tags
+from app.domain.projections import TopicRecord, TopicSearchRecord
+from app.domain.schemas.topic_schema import TopicBulkItem, TopicCreate
 from app.application.interfaces.topic_repository_interface import ITopicRepository
+from app.core.text_utils import remove_vietnamese_tones
+from app.infrastructure.repositories.loading_strategy import collection_loader
+from app.infrastructure.repositories.topic_similarity_repository import (
+    TopicSimilarityRepository,
+)
+from app.infrastructure.repositories.topic_snapshot_repository import TopicSnapshotRepository
 
 class TopicRepository(ITopicRepository):
     """
     Implementation của ITopicRepository sử dụng SQLAlchemy ORM.
     Xử lý tất cả các thao tác database liên quan đến Topic.
+    Cách eager load sections/tags theo loading_strategy (xem loading_strategy.py).
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, loading_strategy: Optional[str] = None):
         self.db = db
+        self._load = collection_loader(loading_strategy)
 
     def create(self, topic_data: TopicCreate) -> Topic:
         """Tạo topic mới kèm theo các sections và tags"""
@@ -44,14 +54,24 @@ class TopicRepository(ITopicRepository):
     def get_by_id(self, topic_id: int) -> Optional[Topic]:
         """Lấy topic theo ID với eager loading sections và tags"""
         return self.db.query(Topic)\
-            .options(joinedload(Topic.sections), joinedload(Topic.tags))\
+            .options(self._load(Topic.sections), self._load(Topic.tags))\
             .filter(Topic.id == topic_id)\
             .first()
     
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Topic]:
         """Lấy danh sách topics với phân trang và eager loading sections"""
         return self.db.query(Topic)\
-            .options(joinedload(Topic.sections))\
+            .options(self._load(Topic.sections))\
+            .order_by(Topic.id)\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
+
+    def get_list(self, skip: int = 0, limit: int = 100) -> List[Topic]:
+        """Lấy trang topics cho danh sách: cột của topic + tags, không load sections"""
+        return self.db.query(Topic)\
+            .options(self._load(Topic.tags))\
+            .order_by(Topic.id)\
             .offset(skip)\
             .limit(limit)\
             .all()
@@ -59,8 +79,9 @@ class TopicRepository(ITopicRepository):
     def get_by_category(self, category_id: int, skip: int = 0, limit: int = 100) -> List[Topic]:
         """Lấy danh sách topics theo category (load tags cho filtering, không load sections)"""
         return self.db.query(Topic)\
-            .options(joinedload(Topic.tags))\
+            .options(self._load(Topic.tags))\
             .filter(Topic.category_id == category_id)\
+            .order_by(Topic.id)\
             .offset(skip)\
             .limit(limit)\
             .all()
@@ -105,9 +126,138 @@ class TopicRepository(ITopicRepository):
         if not topic:
             return False
         
+        # Xóa các dòng topic_similarity và snapshot của topic trong cùng transaction
+        TopicSimilarityRepository(self.db).delete_for_topic(topic_id)
+        TopicSnapshotRepository(self.db).delete_for_topic(topic_id)
+
         self.db.delete(topic)
         self.db.commit()
         return True    
-    def get_all_with_minimal_data(self) -> List[Topic]:
-        """Lấy tất cả topics không load sections (dùng cho việc tính toán related topics)"""
-        return self.db.query(Topic).all()
+    def get_all_with_minimal_data(self) -> List[TopicRecord]:
+        """Lấy tất cả topics dưới dạng TopicRecord (dùng cho việc tính toán related topics)"""
+        rows = self.db.query(
+            Topic.id, Topic.title, Topic.short_definition, Topic.category_id
+        ).all()
+        return [TopicRecord(*row) for row in rows]
+
+    def get_by_ids(self, topic_ids: List[int]) -> List[Topic]:
+        """Lấy các topics theo IDs (giữ thứ tự của topic_ids) với sections và tags"""
+        if not topic_ids:
+            return []
+        topics = self.db.query(Topic)\
+            .options(self._load(Topic.sections), self._load(Topic.tags))\
+            .filter(Topic.id.in_(topic_ids))\
+            .all()
+        by_id = {topic.id: topic for topic in topics}
+        return [by_id[topic_id] for topic_id in topic_ids if topic_id in by_id]
+
+    def get_search_records(
+        self, topic_ids: Optional[Iterable[int]] = None, tag_ids: Optional[List[int]] = None
+    ) -> List[TopicSearchRecord]:
+        """
+        Lấy TopicSearchRecord (kèm tên category) theo thứ tự id.
+        topic_ids = None nghĩa là không giới hạn; tag_ids lọc topics có ít nhất một tag.
+        """
+        query = self.db.query(
+            Topic.id,
+            Topic.title,
+            Topic.short_definition,
+            Topic.category_id,
+            Category.name,
+            Topic.created_at,
+            Topic.title_norm,
+            Topic.short_definition_norm,
+        ).outerjoin(Category, Topic.category_id == Category.id)
+        if tag_ids:
+            # Subquery thay vì JOIN để mỗi topic chỉ xuất hiện một lần
+            query = query.filter(
+                Topic.id.in_(select(topic_tags.c.topic_id).where(topic_tags.c.tag_id.in_(tag_ids)))
+            )
+        if topic_ids is not None:
+            query = query.filter(Topic.id.in_(topic_ids))
+        return [TopicSearchRecord(*row) for row in query.order_by(Topic.id)]
+
+    def count_by_category(self, category_ids: Iterable[int]) -> Dict[int, int]:
+        """Số topics của từng category (category_id -> count) trong một query GROUP BY"""
+        category_ids = list(category_ids)
+        if not category_ids:
+            return {}
+        rows = self.db.query(Topic.category_id, func.count(Topic.id))\
+            .filter(Topic.category_id.in_(category_ids))\
+            .group_by(Topic.category_id)\
+            .all()
+        return dict(rows)
+
+    def get_category_ids_by_slug(self, slugs: Iterable[str]) -> Dict[str, int]:
+        """slug -> category_id cho các slug tồn tại (một query IN)"""
+        slugs = set(slugs)
+        if not slugs:
+            return {}
+        return dict(self.db.query(Category.slug, Category.id).filter(Category.slug.in_(slugs)).all())
+
+    def get_tag_ids_by_slug(self, slugs: Iterable[str]) -> Dict[str, int]:
+        """slug -> tag_id cho các slug tồn tại (một query IN)"""
+        slugs = set(slugs)
+        if not slugs:
+            return {}
+        return dict(self.db.query(Tag.slug, Tag.id).filter(Tag.slug.in_(slugs)).all())
+
+    def get_existing_titles(self, titles: Iterable[str]) -> Set[str]:
+        """Các title trong danh sách đã có topic sử dụng"""
+        titles = set(titles)
+        if not titles:
+            return set()
+        return set(self.db.scalars(select(Topic.title).where(Topic.title.in_(titles))))
+
+    def bulk_create(
+        self, items: List[TopicBulkItem], category_ids: Dict[str, int], tag_ids: Dict[str, int]
+    ) -> List[int]:
+        """
+        Tạo nhiều topics kèm sections và tags trong một transaction bằng INSERT nhiều dòng
+        (executemany), không tạo ORM object cho từng bản ghi.
+        Bulk insert không đi qua @validates nên các cột *_norm được tính ở đây.
+        """
+        if not items:
+            return []
+        try:
+            # RETURNING theo thứ tự tham số để map id về đúng item
+            topic_ids = list(self.db.scalars(
+                insert(Topic).returning(Topic.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "title": item.title,
+                        "short_definition": item.short_definition,
+                        "category_id": category_ids[item.category_slug],
+                        "title_norm": remove_vietnamese_tones(item.title),
+                        "short_definition_norm": remove_vietnamese_tones(item.short_definition),
+                    }
+                    for item in items
+                ],
+            ))
+
+            link_rows = [
+                {"topic_id": topic_id, "tag_id": tag_ids[slug]}
+                for topic_id, item in zip(topic_ids, items)
+                for slug in dict.fromkeys(item.tag_slugs)
+            ]
+            if link_rows:
+                self.db.execute(topic_tags.insert(), link_rows)
+
+            section_rows = [
+                {
+                    **section.model_dump(),
+                    "topic_id": topic_id,
+                    "heading_norm": remove_vietnamese_tones(section.heading),
+                    "content_norm": remove_vietnamese_tones(section.content),
+                }
+                for topic_id, item in zip(topic_ids, items)
+                for section in item.sections
+            ]
+            if section_rows:
+                self.db.execute(insert(Section), section_rows)
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return topic_ids
@@ -0,0 +1,134 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from app.application.interfaces.topic_similarity_repository_interface import (
+    ITopicSimilarityRepository,
+)
+from app.domain.models import Topic, TopicSimilarity, TopicSimilarityComputed
+
+
+class TopicSimilarityRepository(ITopicSimilarityRepository):
+    """
+    Implementation của ITopicSimilarityRepository sử dụng SQLAlchemy ORM.
+    Đọc/ghi bảng materialized topic_similarity.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_related(self, topic_id: int, limit: int) -> Optional[List[Tuple[Topic, float]]]:
+        """
+        Lấy top N related topics bằng một query theo PK (topic_id, rank).
+        Không có dòng nào thì đọc thêm dấu đã tính để trả về [] hoặc None (chưa tính).
+        """
+        rows = (
+            self.db.query(Topic, TopicSimilarity.score)
+            .join(TopicSimilarity, TopicSimilarity.related_topic_id == Topic.id)
+            .options(selectinload(Topic.sections), selectinload(Topic.tags))
+            .filter(TopicSimilarity.topic_id == topic_id)
+            .order_by(TopicSimilarity.rank)
+            .limit(limit)
+            .all()
+        )
+        if not rows and self.db.get(TopicSimilarityComputed, topic_id) is None:
+            return None
+        return [(topic, score) for topic, score in rows]
+
+    def get_cutoff_scores(self) -> Dict[int, Tuple[int, float]]:
+        """Lấy (số dòng, score thấp nhất) của mỗi topic bằng một query GROUP BY"""
+        rows = (
+            self.db.query(
+                TopicSimilarity.topic_id,
+                func.count(TopicSimilarity.rank),
+                func.min(TopicSimilarity.score),
+            )
+            .group_by(TopicSimilarity.topic_id)
+            .all()
+        )
+        return {topic_id: (count, min_score) for topic_id, count, min_score in rows}
+
+    def get_referencing_topic_ids(self, related_topic_id: int) -> List[int]:
+        """Lấy IDs các topics có related_topic_id trong top-K"""
+        rows = (
+            self.db.query(TopicSimilarity.topic_id)
+            .filter(TopicSimilarity.related_topic_id == related_topic_id)
+            .all()
+        )
+        return [topic_id for (topic_id,) in rows]
+
+    def replace_rows(self, topic_id: int, rows: List[Tuple[int, float]]) -> None:
+        """Thay toàn bộ top-K của một topic (kèm dấu đã tính) trong một transaction"""
+        try:
+            self.db.query(TopicSimilarity).filter(
+                TopicSimilarity.topic_id == topic_id
+            ).delete(synchronize_session=False)
+            self.db.query(TopicSimilarityComputed).filter(
+                TopicSimilarityComputed.topic_id == topic_id
+            ).delete(synchronize_session=False)
+            self.db.add(TopicSimilarityComputed(topic_id=topic_id))
+            self.db.add_all(
+                TopicSimilarity(
+                    topic_id=topic_id, rank=rank, related_topic_id=related_id, score=score
+                )
+                for rank, (related_id, score) in enumerate(rows)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def add_rows_if_missing(self, topic_id: int, rows: List[Tuple[int, float]]) -> bool:
+        """Insert các dòng nếu topic chưa có dữ liệu; ghi đồng thời thì PK (topic_id, rank) chặn lại"""
+        if not rows:
+            return False
+        try:
+            has_rows = self.db.query(TopicSimilarity.topic_id)\
+                .filter(TopicSimilarity.topic_id == topic_id)\
+                .first() is not None
+            if has_rows or self.db.get(TopicSimilarityComputed, topic_id) is not None:
+                self.db.rollback()
+                return False
+            self.db.add_all(
+                TopicSimilarity(
+                    topic_id=topic_id, rank=rank, related_topic_id=related_id, score=score
+                )
+                for rank, (related_id, score) in enumerate(rows)
+            )
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return False
+        except Exception:
+            self.db.rollback()
+            raise
+        return True
+
+    def delete_for_topic(self, topic_id: int) -> None:
+        """Xóa các dòng liên quan đến topic (caller chịu trách nhiệm commit)"""
+        # Topics từng tham chiếu tới topic này mất dòng nên coi như chưa tính
+        # (background job tính lại), thay vì trả về danh sách thiếu là "đã tính"
+        referencing = select(TopicSimilarity.topic_id).where(
+            TopicSimilarity.related_topic_id == topic_id
+        )
+        self.db.query(TopicSimilarityComputed).filter(
+            or_(
+                TopicSimilarityComputed.topic_id == topic_id,
+                TopicSimilarityComputed.topic_id.in_(referencing),
+            )
+        ).delete(synchronize_session=False)
+        self.db.query(TopicSimilarity).filter(
+            or_(
+                TopicSimilarity.topic_id == topic_id,
+                TopicSimilarity.related_topic_id == topic_id,
+            )
+        ).delete(synchronize_session=False)
+
+    def is_empty(self) -> bool:
+        """
+        Kiểm tra đã có topic nào được tính chưa (theo dấu đã tính, nên database có
+        dòng topic_similarity nhưng chưa có bảng dấu sẽ được backfill một lần)
+        """
+        return self.db.query(TopicSimilarityComputed.topic_id).first() is None
@@ -0,0 +1,65 @@
+from typing import Iterable
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.application.interfaces.topic_snapshot_repository_interface import (
+    ITopicSnapshotRepository,
+)
+from app.core.json_response import encode_model, schema_fingerprint
+from app.domain.models import Topic, TopicSnapshot
+from app.domain.schemas.topic_schema import TopicResponse
+
+
+class TopicSnapshotRepository(ITopicSnapshotRepository):
+    """
+    Implementation của ITopicSnapshotRepository sử dụng SQLAlchemy ORM.
+    Ghi bảng topic_snapshots sau các lần ghi topic, section và tag.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh(self, topic_ids: Iterable[int]) -> None:
+        """
+        Build lại snapshot của các topics trong một transaction (selectinload: không có
+        JOIN sections x tags). Lỗi chỉ được log và snapshot cũ bị xóa nếu có thể, để
+        GET /topics/{id} tự build lại từ database thay vì trả về dữ liệu cũ.
+        """
+        topic_ids = sorted(set(topic_ids))
+        if not topic_ids:
+            return
+        schema_hash = schema_fingerprint(TopicResponse)
+        try:
+            topics = self.db.query(Topic)\
+                .options(selectinload(Topic.sections), selectinload(Topic.tags))\
+                .filter(Topic.id.in_(topic_ids))\
+                .populate_existing()\
+                .all()
+            self.db.query(TopicSnapshot)\
+                .filter(TopicSnapshot.topic_id.in_(topic_ids))\
+                .delete(synchronize_session=False)
+            self.db.add_all(
+                TopicSnapshot(
+                    topic_id=topic.id,
+                    body=encode_model(TopicResponse, TopicResponse.model_validate(topic)),
+                    schema_hash=schema_hash,
+                )
+                for topic in topics
+            )
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(f"Warning: Failed to refresh topic snapshots {topic_ids}: {str(e)}")
+            try:
+                self.db.query(TopicSnapshot)\
+                    .filter(TopicSnapshot.topic_id.in_(topic_ids))\
+                    .delete(synchronize_session=False)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+
+    def delete_for_topic(self, topic_id: int) -> None:
+        """Xóa snapshot của topic (caller chịu trách nhiệm commit)"""
+        self.db.query(TopicSnapshot)\
+            .filter(TopicSnapshot.topic_id == topic_id)\
+            .delete(synchronize_session=False)
@@ -0,0 +1,14 @@
+from .postgres_search_index import (
+    PostgresSearchIndex,
+    install_search_schema,
+    search_schema_installed,
+)
+from .search_backend import build_search_index, setup_search_backend
+
+__all__ = [
+    "PostgresSearchIndex",
+    "build_search_index",
+    "install_search_schema",
+    "search_schema_installed",
+    "setup_search_backend",
+]
@@ -0,0 +1,212 @@
+"""
+Engine chọn candidate cho SearchService chạy trong PostgreSQL (SEARCH_BACKEND=postgres).
+
+Thay vì giữ inverted index trong process, việc so khớp được đẩy xuống database:
+- Cột generated `search_vector` (tsvector, config 'simple') trên topics và sections,
+  tính từ text đã bỏ dấu qua extension `unaccent`, có GIN index
+- GIN index `gin_trgm_ops` (extension `pg_trgm`) trên text đã bỏ dấu của từng cột,
+  dùng cho LIKE '%...%' và word similarity (thay cho fuzzy subsequence)
+
+SearchService vẫn chấm điểm các candidate bằng calculate_relevance_score, nên chi phí
+search tỉ lệ với số bản ghi khớp thay vì kích thước bảng.
+
+Schema được cài một lần bằng `python setup_search_schema.py` (development cài lúc
+khởi động); app chỉ kiểm tra schema đã có hay chưa.
+"""
+import re
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import Column, func, inspect, literal, literal_column, or_, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.search_index_interface import ISearchIndex
+from app.application.services.search_index import FULL_SCAN_RATIO
+from app.domain.models.section import Section
+from app.domain.models.topic import Topic
+
+# Hàm IMMUTABLE bỏ dấu + chữ thường (unaccent() là STABLE nên không dùng được trực tiếp
+# trong generated column / expression index), khớp với remove_vietnamese_tones
+NORMALIZE_FUNCTION = "search_normalize"
+
+# Giới hạn độ dài keyword khi sinh các chuỗi con cho tier "token nằm trong keyword"
+MAX_SUBSTRING_KEYWORD_LENGTH = 24
+# Chuỗi con ngắn hơn (VD: "a", "an") khớp gần như mọi bản ghi nên không thành term
+MIN_SUBSTRING_LENGTH = 3
+# Số term tối đa của tsquery (một keyword 24 ký tự sinh 253 chuỗi con); vượt quá thì
+# quét toàn bảng thay vì gửi một tsquery rất dài
+MAX_TSQUERY_TERMS = 256
+
+SCHEMA_STATEMENTS: Tuple[str, ...] = (
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"""
+    CREATE OR REPLACE FUNCTION {NORMALIZE_FUNCTION}(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT lower(public.unaccent('public.unaccent'::regdictionary, $1)) $$
+    """,
+    f"""
+    ALTER TABLE topics ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', {NORMALIZE_FUNCTION}(
+                coalesce(title, '') || ' ' || coalesce(short_definition, '')
+            ))
+        ) STORED
+    """,
+    f"""
+    ALTER TABLE sections ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', {NORMALIZE_FUNCTION}(
+                coalesce(heading, '') || ' ' || coalesce(content, '')
+            ))
+        ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_topics_search_vector ON topics USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_sections_search_vector ON sections USING gin (search_vector)",
+    f"CREATE INDEX IF NOT EXISTS ix_topics_title_trgm ON topics USING gin ({NORMALIZE_FUNCTION}(title) gin_trgm_ops)",
+    f"CREATE INDEX IF NOT EXISTS ix_topics_short_definition_trgm ON topics USING gin ({NORMALIZE_FUNCTION}(short_definition) gin_trgm_ops)",
+    f"CREATE INDEX IF NOT EXISTS ix_sections_heading_trgm ON sections USING gin ({NORMALIZE_FUNCTION}(heading) gin_trgm_ops)",
+    f"CREATE INDEX IF NOT EXISTS ix_sections_content_trgm ON sections USING gin ({NORMALIZE_FUNCTION}(content) gin_trgm_ops)",
+)
+
+
+class _SearchTarget(NamedTuple):
+    """Bảng và các cột text của một loại entity"""
+
+    id_column: Column
+    text_columns: Tuple[Column, ...]
+
+
+_TARGETS: Dict[str, _SearchTarget] = {
+    "topic": _SearchTarget(Topic.id, (Topic.title, Topic.short_definition)),
+    "section": _SearchTarget(Section.id, (Section.heading, Section.content)),
+}
+
+
+def install_search_schema(bind: Engine) -> None:
+    """
+    Tạo extensions, hàm bỏ dấu, cột search_vector và các GIN index (idempotent).
+    Cần quyền CREATE EXTENSION (Neon / Cloud SQL đều hỗ trợ unaccent và pg_trgm).
+    """
+    with bind.begin() as conn:
+        for statement in SCHEMA_STATEMENTS:
+            conn.execute(text(statement))
+
+
+def search_schema_installed(bind: Engine) -> bool:
+    """Hàm bỏ dấu và cột search_vector của topics/sections đã được cài chưa"""
+    inspector = inspect(bind)
+    for table_name in ("topics", "sections"):
+        if "search_vector" not in {column["name"] for column in inspector.get_columns(table_name)}:
+            return False
+    with bind.connect() as conn:
+        return bool(conn.execute(
+            text("SELECT to_regprocedure(:signature) IS NOT NULL"),
+            {"signature": f"{NORMALIZE_FUNCTION}(text)"},
+        ).scalar())
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def _lexeme(term: str) -> str:
+    # Parser 'simple' tách token theo ký tự không phải chữ/số
+    return re.sub(r"[\W_]+", "", term)
+
+
+class PostgresSearchIndex(ISearchIndex):
+    """
+    Lấy candidates bằng một query trên GIN indexes cho mỗi loại entity.
+
+    Một bản ghi là candidate khi:
+    - Text đã bỏ dấu chứa cả query hoặc một keyword (LIKE, tier 1.0-0.7 và 0.95/0.85/0.65)
+    - search_vector chứa một từ của query, một token bắt đầu bằng keyword, hoặc một
+      chuỗi con dài ít nhất MIN_SUBSTRING_LENGTH ký tự của keyword (tier 0.65
+      "token nằm trong keyword", 0.6/0.5)
+    - word_similarity(query, text) vượt ngưỡng pg_trgm (thay cho fuzzy subsequence 0.3)
+
+    Categories ít bản ghi nên luôn quét toàn bảng. Như SearchIndex, trả về None (quét
+    toàn bảng) khi số candidate vượt FULL_SCAN_RATIO số dòng ước lượng của bảng, hoặc
+    khi tsquery vượt MAX_TSQUERY_TERMS terms.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def ensure_fresh(self, db: Session) -> None:
+        """search_vector là cột generated nên luôn khớp dữ liệu, không cần build"""
+        return None
+
+    def candidates(
+        self,
+        entity_type: str,
+        query_normalized: str,
+        keywords: List[str],
+        query_words: List[str],
+    ) -> Optional[Set[int]]:
+        target = _TARGETS.get(entity_type)
+        if target is None or not query_normalized.strip():
+            return None
+        tsquery = self._build_tsquery(keywords, query_words)
+        if tsquery is None:
+            return None
+
+        # Lấy tối đa cutoff + 1 IDs: vượt cutoff thì quét toàn bảng rẻ hơn IN (...) rất dài
+        cutoff = int(self._estimated_rows(target) * FULL_SCAN_RATIO)
+        statement = self._candidate_statement(target, query_normalized, keywords, tsquery)
+        ids = set(self.db.execute(statement.limit(cutoff + 1)).scalars())
+        if len(ids) > cutoff:
+            return None
+        return ids
+
+    def _estimated_rows(self, target: _SearchTarget) -> float:
+        """Số dòng ước lượng từ thống kê của planner, COUNT(*) nếu bảng chưa được ANALYZE"""
+        table = target.id_column.table
+        estimate = self.db.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table.name},
+        ).scalar()
+        if estimate is None or estimate <= 0:
+            estimate = self.db.scalar(select(func.count()).select_from(table))
+        return estimate
+
+    def _candidate_statement(
+        self, target: _SearchTarget, query_normalized: str, keywords: List[str], tsquery: str
+    ):
+        patterns = sorted({query_normalized, *keywords})
+        conditions = []
+        for column in target.text_columns:
+            normalized_column = getattr(func, NORMALIZE_FUNCTION)(column)
+            conditions.extend(
+                normalized_column.like(f"%{_escape_like(pattern)}%", escape="/")
+                for pattern in patterns
+            )
+            conditions.append(literal(query_normalized).op("<%")(normalized_column))
+
+        if tsquery:
+            conditions.append(
+                literal_column("search_vector").op("@@")(func.to_tsquery("simple", tsquery))
+            )
+        return select(target.id_column).where(or_(*conditions))
+
+    def _build_tsquery(self, keywords: List[str], query_words: List[str]) -> Optional[str]:
+        """tsquery OR các terms, None nếu vượt MAX_TSQUERY_TERMS"""
+        terms: Set[str] = set()
+        for word in query_words:
+            terms.add(_lexeme(word))
+        for keyword in keywords:
+            lexeme = _lexeme(keyword)
+            if not lexeme:
+                continue
+            terms.add(f"{lexeme}:*")
+            if len(lexeme) <= MAX_SUBSTRING_KEYWORD_LENGTH:
+                terms.update(
+                    lexeme[start:end]
+                    for start in range(len(lexeme))
+                    for end in range(start + MIN_SUBSTRING_LENGTH, len(lexeme) + 1)
+                )
+        terms = {term for term in terms if term and term != ":*"}
+        if len(terms) > MAX_TSQUERY_TERMS:
+            return None
+        return " | ".join(sorted(terms))
@@ -0,0 +1,58 @@
+"""
+Chọn engine candidate cho SearchService theo settings (SEARCH_BACKEND):
+- "memory" (mặc định): inverted index in-memory (app.application.services.search_index),
+  dùng được với mọi database (SQLite khi dev/test)
+- "postgres": PostgresSearchIndex (tsvector + unaccent + pg_trgm), chỉ với PostgreSQL
+"""
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.search_index_interface import ISearchIndex
+from app.application.services.search_index import search_index
+from app.core.settings import get_settings
+from app.infrastructure.search.postgres_search_index import (
+    PostgresSearchIndex,
+    install_search_schema,
+    search_schema_installed,
+)
+
+# None = chưa setup (quyết định theo dialect ở lần search đầu tiên)
+_postgres_enabled: Optional[bool] = None
+
+
+def setup_search_backend(bind: Engine, install: bool = False) -> None:
+    """
+    Gọi lúc khởi động: với SEARCH_BACKEND=postgres thì kiểm tra schema FTS (cài luôn
+    nếu install=True), fallback về index in-memory nếu database không phải PostgreSQL,
+    chưa cài schema (python setup_search_schema.py) hoặc cài lỗi.
+    """
+    global _postgres_enabled
+    if get_settings().SEARCH_BACKEND.lower() != "postgres":
+        _postgres_enabled = False
+        return
+    if bind.dialect.name != "postgresql":
+        print(f"Warning: SEARCH_BACKEND=postgres needs PostgreSQL (got {bind.dialect.name}), using in-memory search index")
+        _postgres_enabled = False
+        return
+    try:
+        if install:
+            install_search_schema(bind)
+        _postgres_enabled = search_schema_installed(bind)
+        if not _postgres_enabled:
+            print("Warning: PostgreSQL full-text search schema missing (run python setup_search_schema.py), using in-memory search index")
+    except Exception as e:
+        print(f"Warning: PostgreSQL full-text search unavailable, using in-memory search index: {str(e)}")
+        _postgres_enabled = False
+
+
+def build_search_index(db: Session) -> ISearchIndex:
+    """Engine candidate cho một SearchService chạy trên db"""
+    enabled = _postgres_enabled
+    if enabled is None:
+        enabled = (
+            get_settings().SEARCH_BACKEND.lower() == "postgres"
+            and db.get_bind().dialect.name == "postgresql"
+        )
+    return PostgresSearchIndex(db) if enabled else search_index
@@ -1,10 +1,23 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.v1.endpoints import category_api, section_api, topic_api, search_api, tag_api, related_topic_association
-from app.infrastructure.database import Base, engine
+from app.api.v1.endpoints import category_api, section_api, topic_api, search_api, tag_api, related_topic_association, metrics_api
+from app.application.services.tfidf_model import tfidf_model_store
+from app.core.content_version import configure_content_stamp
+from app.core.json_response import FastJSONResponse
+from app.core.settings import get_settings
+from app.infrastructure.database import Base, async_engine, engine
+from app.infrastructure.hooks import read_content_stamp
+from app.infrastructure.jobs import (
+    backfill_normalized_columns,
+    related_topics_executor,
+    schedule_full_similarity_refresh,
+    shutdown_similarity_jobs,
+)
+from app.infrastructure.search import setup_search_backend
 
 # Chỉ tạo bảng tự động khi chạy local development
 # Production nên dùng Alembic migration hoặc tạo schema thủ công
@@ -15,7 +28,37 @@ if ENVIRONMENT == "development":
 else:
     print(f"[{ENVIRONMENT}] Skipping auto table creation")
 
-app = FastAPI(title="OOP Resource Hub API")
+# Dữ liệu in-memory (search index, caches) đối chiếu với content stamp trong database
+# để thấy cả các lần ghi của instance khác
+configure_content_stamp(read_content_stamp, get_settings().CONTENT_VERSION_CHECK_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Điền các cột *_norm cho dữ liệu tạo trước khi có shadow columns
+    # Production chạy một lần: python backfill_normalized_columns.py
+    if ENVIRONMENT == "development":
+        backfilled = backfill_normalized_columns(engine)
+        if backfilled:
+            print(f"Search: backfilled normalized columns for {backfilled} rows")
+    # SEARCH_BACKEND=postgres: kiểm tra tsvector/GIN indexes cho full-text search
+    # (chỉ development tự cài; production chạy một lần: python setup_search_schema.py)
+    setup_search_backend(engine, install=ENVIRONMENT == "development")
+    # Load TF-IDF model đã build sẵn để related topics không phải fit lại mỗi request
+    if tfidf_model_store.load_from_disk():
+        print(f"TF-IDF model loaded from {tfidf_model_store.directory}")
+    # Fit TF-IDF trên process pool để không giữ GIL của process phục vụ request
+    tfidf_model_store.fit_runner = related_topics_executor.run_in_process
+    # Backfill bảng topic_similarity ở background nếu chưa có dữ liệu
+    schedule_full_similarity_refresh(only_if_empty=True)
+    yield
+    shutdown_similarity_jobs()
+    related_topics_executor.shutdown()
+    await async_engine.dispose()
+
+
+# Endpoint trả về dict/list được encode bằng orjson / pydantic-core thay cho json.dumps
+app = FastAPI(title="OOP Resource Hub API", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 # CORS Configuration
 # Allow specific origins for credentials support
@@ -35,6 +78,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Cursor của trang tiếp theo (keyset pagination)
 )
 
 # Đăng ký Router
@@ -46,6 +90,7 @@ app.include_router(section_api.router, prefix="/api/v1/sections", tags=["Section
 app.include_router(search_api.router, prefix="/api/v1/search", tags=["Search"])
 app.include_router(tag_api.router, prefix="/api/v1/tags", tags=["Tags"])
 app.include_router(related_topic_association.router, prefix="/api/v1/related-topics", tags=["Related Topics"])
+app.include_router(metrics_api.router, prefix="/api/v1/metrics", tags=["Metrics"])
 
 
 @app.get("/")
@@ -0,0 +1,11 @@
+"""
+Thêm và backfill các cột *_norm cho search trên database đã có dữ liệu.
+Chạy một lần trước khi deploy (production không chạy job này lúc khởi động):
+python backfill_normalized_columns.py
+"""
+from app.infrastructure.database import engine
+from app.infrastructure.jobs import backfill_normalized_columns
+
+if __name__ == "__main__":
+    updated = backfill_normalized_columns(engine)
+    print(f"Normalized columns: backfilled {updated} rows")
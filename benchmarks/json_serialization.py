@@ -0,0 +1,119 @@
+"""
+Benchmark req/s của GET /topics/{id}: serialize qua response_model của FastAPI vs model_response.
+
+- legacy: endpoint trả về TopicResponse, FastAPI dump model ra dict, validate lại theo
+  response_model, chuyển sang jsonable rồi json.dumps (JSONResponse mặc định)
+- fast: endpoint trả về model_response(TopicResponse, topic), pydantic-core dump thẳng ra bytes
+
+Hai app chỉ khác cách serialize, cùng trả về một TopicResponse dựng sẵn (sections và
+tags lấy từ mock-db, nhân lên để đạt --sections) nên không đo database hay cache.
+Request đi qua ASGI in-process (httpx.ASGITransport), không qua network.
+
+Chạy từ thư mục gốc của repo:
+    python benchmarks/json_serialization.py --sections 40 --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "mock-db"))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.core.json_response import FastJSONResponse, model_response  # noqa: E402
+from app.domain.schemas.topic_schema import TopicResponse  # noqa: E402
+
+
+def build_topic(section_count: int) -> TopicResponse:
+    import OOP_Docs
+
+    sections = [
+        section
+        for topic in OOP_Docs.oop_data["topics"]
+        for section in topic["sections"]
+    ]
+    first = OOP_Docs.oop_data["topics"][0]
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return TopicResponse.model_validate({
+        "id": 1,
+        "title": first["title"],
+        "short_definition": first["short_definition"],
+        "category_id": 1,
+        "created_at": now,
+        "sections": [
+            {
+                "id": index + 1,
+                "topic_id": 1,
+                "heading": section["heading"],
+                "content": section["content"],
+                "order_index": index,
+                "code_snippet": section.get("code_snippet"),
+                "language": section.get("language"),
+                "created_at": now,
+            }
+            for index, section in enumerate(
+                sections[index % len(sections)] for index in range(section_count)
+            )
+        ],
+        "tags": [
+            {"id": index + 1, "name": tag["name"], "slug": tag["slug"], "description": tag.get("description")}
+            for index, tag in enumerate(OOP_Docs.oop_tags)
+        ],
+    })
+
+
+def build_apps(topic: TopicResponse):
+    legacy = FastAPI()
+    fast = FastAPI(default_response_class=FastJSONResponse)
+
+    @legacy.get("/topics/{topic_id}", response_model=TopicResponse)
+    async def legacy_get_topic(topic_id: int):
+        return topic
+
+    @fast.get("/topics/{topic_id}", response_model=TopicResponse)
+    async def fast_get_topic(topic_id: int):
+        return model_response(TopicResponse, topic)
+
+    return legacy, fast
+
+
+async def measure(app: FastAPI, requests: int) -> tuple:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        body = (await client.get("/topics/1")).content
+        for _ in range(min(100, requests)):
+            await client.get("/topics/1")
+        started = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/topics/1")
+        elapsed = time.perf_counter() - started
+    return requests / elapsed, body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sections", type=int, default=40, help="Số sections của topic")
+    parser.add_argument("--requests", type=int, default=2000, help="Số request cho mỗi app")
+    args = parser.parse_args()
+
+    topic = build_topic(args.sections)
+    legacy, fast = build_apps(topic)
+
+    legacy_rps, legacy_body = asyncio.run(measure(legacy, args.requests))
+    fast_rps, fast_body = asyncio.run(measure(fast, args.requests))
+
+    print(f"payload: {args.sections} sections, {len(fast_body) / 1024:.1f} KiB")
+    print(f"same JSON: {json.loads(legacy_body) == json.loads(fast_body)}")
+    print(f"legacy {legacy_rps:>9.0f} req/s")
+    print(f"fast   {fast_rps:>9.0f} req/s  ({fast_rps / legacy_rps:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark bộ nhớ: ORM entities vs projection records cho đường đọc của search
+và related topics.
+
+Tạo một database SQLite tạm với corpus lớn (mặc định 50k sections), rồi đo
+peak memory (tracemalloc) và thời gian của:
+- orm: db.query(Section).all() + section.topic.title, db.query(Topic).all()
+- projection: SectionRepository.get_search_records(), TopicRepository.get_all_with_minimal_data()
+
+Chạy từ thư mục gốc của repo:
+    python benchmarks/projection_memory.py --sections 50000 --topics 1000
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def seed(engine, n_topics: int, n_sections: int, content_size: int) -> None:
+    from app.domain.models import Category, Section, Topic
+
+    words = "class object inheritance polymorphism encapsulation đối tượng kế thừa đa hình".split()
+    content = (" ".join(words) + " ") * (content_size // 80 + 1)
+    snippet = "class Animal:\n    def speak(self):\n        return 'sound'\n" * 16
+
+    with engine.begin() as conn:
+        conn.execute(Category.__table__.insert(), [{"id": 1, "name": "OOP", "slug": "oop"}])
+        conn.execute(
+            Topic.__table__.insert(),
+            [
+                {
+                    "id": i,
+                    "title": f"Topic {i} {words[i % len(words)]}",
+                    "short_definition": f"Định nghĩa ngắn của topic {i}",
+                    "category_id": 1,
+                }
+                for i in range(1, n_topics + 1)
+            ],
+        )
+        batch = []
+        for i in range(1, n_sections + 1):
+            batch.append(
+                {
+                    "id": i,
+                    "topic_id": (i % n_topics) + 1,
+                    "heading": f"Section {i}",
+                    "content": content[: content_size],
+                    "order_index": i // n_topics,
+                    "code_snippet": snippet,
+                    "language": "python",
+                }
+            )
+            if len(batch) == 5000:
+                conn.execute(Section.__table__.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(Section.__table__.insert(), batch)
+
+
+def measure(label: str, fn) -> None:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = fn()
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<28} rows={rows:>7}  time={elapsed * 1000:>8.1f} ms  "
+        f"retained={current / 2**20:>7.1f} MiB  peak={peak / 2**20:>7.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sections", type=int, default=50_000)
+    parser.add_argument("--topics", type=int, default=1_000)
+    parser.add_argument("--content-size", type=int, default=1_500, help="Số ký tự content mỗi section")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="projection-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    from app.domain.models import Section, Topic
+    from app.infrastructure.database import Base, SessionLocal, engine
+    from app.infrastructure.repositories.section_repository import SectionRepository
+    from app.infrastructure.repositories.topic_repository import TopicRepository
+
+    Base.metadata.create_all(bind=engine)
+    seed(engine, args.topics, args.sections, args.content_size)
+    print(f"corpus: {args.topics} topics, {args.sections} sections, content {args.content_size} chars")
+
+    def orm_sections() -> int:
+        db = SessionLocal()
+        try:
+            sections = db.query(Section).order_by(Section.id).all()
+            titles = [section.topic.title if section.topic else "" for section in sections]
+            return len(titles)
+        finally:
+            db.close()
+
+    def projection_sections() -> int:
+        db = SessionLocal()
+        try:
+            return len(SectionRepository(db).get_search_records())
+        finally:
+            db.close()
+
+    def orm_topics() -> int:
+        db = SessionLocal()
+        try:
+            return len(db.query(Topic).all())
+        finally:
+            db.close()
+
+    def projection_topics() -> int:
+        db = SessionLocal()
+        try:
+            return len(TopicRepository(db).get_all_with_minimal_data())
+        finally:
+            db.close()
+
+    measure("sections / orm", orm_sections)
+    measure("sections / projection", projection_sections)
+    measure("topics / orm", orm_topics)
+    measure("topics / projection", projection_topics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Đếm số query và số dòng database trả về cho các method của TopicRepository theo
+từng loading strategy (selectin / subquery / joined), so với budget.
+
+Dữ liệu là SQLite tạm: --topics topics, mỗi topic --sections sections và --tags tags
+(mặc định 10 x 8 như một topic "rộng"). Số dòng của mỗi SELECT được đếm lại bằng
+SELECT COUNT(*) trên cùng câu lệnh và tham số, nên thấy được tích Descartes
+sections x tags của joinedload. Chỉ tính các query chạy trên thread chính (bỏ qua
+background jobs như refresh topic_similarity).
+
+Script trả về exit code 1 nếu strategy được kiểm tra (--strategy, mặc định selectin)
+vượt budget của một method.
+
+Chạy từ thư mục gốc của repo:
+    python benchmarks/query_budget.py
+    python benchmarks/query_budget.py --strategy joined --topics 50
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+from typing import Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix="query_budget_"), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("CACHE_BACKEND", "none")
+
+from sqlalchemy import event  # noqa: E402
+
+from app.domain.models import Category, Section, Tag, Topic  # noqa: E402
+from app.domain.schemas.topic_schema import TopicCreate  # noqa: E402
+from app.infrastructure.database import Base, SessionLocal, engine  # noqa: E402
+from app.infrastructure.repositories.loading_strategy import LOADING_STRATEGIES  # noqa: E402
+from app.infrastructure.repositories.topic_repository import TopicRepository  # noqa: E402
+
+PAGE = 20
+
+# method -> (số query tối đa, số dòng tối đa) với --sections 10 --tags 8
+BUDGETS: Dict[str, Tuple[int, int]] = {
+    "get_by_id": (3, 19),
+    "get_all": (2, 220),
+    "get_list": (2, 180),
+    "get_by_category": (2, 180),
+    "get_by_ids": (3, 380),
+    "update": (14, 50),
+    "delete": (12, 25),
+}
+
+
+class QueryCounter:
+    """Đếm query và số dòng trả về trên engine trong lúc đo"""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.rows = 0
+        self._thread = threading.get_ident()
+        self._raw = sqlite3.connect(DB_PATH)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(engine, "after_cursor_execute", self._after_execute)
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if threading.get_ident() != self._thread:
+            return
+        self.queries += 1
+        if statement.lstrip().upper().startswith("SELECT"):
+            # Đếm trên connection riêng để không đọc mất dòng của cursor SQLAlchemy
+            self.rows += self._raw.execute(
+                f"SELECT COUNT(*) FROM ({statement})", parameters or ()
+            ).fetchone()[0]
+
+
+def seed(topic_count: int, section_count: int, tag_count: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    categories = [Category(name=f"Category {i}", slug=f"category-{i}") for i in range(2)]
+    tags = [Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(tag_count)]
+    db.add_all(categories + tags)
+    db.flush()
+    for i in range(topic_count):
+        topic = Topic(
+            title=f"Topic {i}",
+            short_definition=f"Định nghĩa ngắn của topic {i}",
+            category_id=categories[i % 2].id,
+        )
+        topic.tags = tags
+        topic.sections = [
+            Section(heading=f"Section {j}", content=f"Nội dung {i}.{j}", order_index=j)
+            for j in range(section_count)
+        ]
+        db.add(topic)
+    db.commit()
+    db.close()
+
+
+def add_throwaway_topic(db, section_count: int) -> int:
+    topic = Topic(title=f"Throwaway {db.query(Topic).count()}", short_definition="x", category_id=1)
+    topic.tags = db.query(Tag).all()
+    topic.sections = [
+        Section(heading=f"S{j}", content="c", order_index=j) for j in range(section_count)
+    ]
+    db.add(topic)
+    db.commit()
+    return topic.id
+
+
+def update_payload(topic: Topic) -> TopicCreate:
+    return TopicCreate(
+        title=topic.title,
+        short_definition=topic.short_definition,
+        category_id=topic.category_id,
+        tag_ids=[tag.id for tag in topic.tags],
+        sections=[],
+    )
+
+
+def cases(section_count: int) -> List[Tuple[str, Callable]]:
+    """(method, hàm chuẩn bị) -> hàm chuẩn bị trả về callable chạy method trên repository"""
+
+    def get_by_id(db, repo):
+        return lambda: repo.get_by_id(1)
+
+    def get_all(db, repo):
+        return lambda: repo.get_all(0, PAGE)
+
+    def get_list(db, repo):
+        return lambda: repo.get_list(0, PAGE)
+
+    def get_by_category(db, repo):
+        return lambda: repo.get_by_category(1, 0, PAGE)
+
+    def get_by_ids(db, repo):
+        return lambda: repo.get_by_ids(list(range(1, PAGE + 1)))
+
+    def update(db, repo):
+        topic_id = add_throwaway_topic(db, section_count)
+        payload = update_payload(db.get(Topic, topic_id))
+        db.expire_all()
+        return lambda: repo.update(topic_id, payload)
+
+    def delete(db, repo):
+        topic_id = add_throwaway_topic(db, section_count)
+        db.expire_all()
+        return lambda: repo.delete(topic_id)
+
+    return [
+        ("get_by_id", get_by_id),
+        ("get_all", get_all),
+        ("get_list", get_list),
+        ("get_by_category", get_by_category),
+        ("get_by_ids", get_by_ids),
+        ("update", update),
+        ("delete", delete),
+    ]
+
+
+def measure(strategy: str, section_count: int) -> Dict[str, Tuple[int, int]]:
+    results = {}
+    for name, prepare in cases(section_count):
+        db = SessionLocal()
+        try:
+            run = prepare(db, TopicRepository(db, loading_strategy=strategy))
+            with QueryCounter() as counter:
+                run()
+            results[name] = (counter.queries, counter.rows)
+        finally:
+            db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--topics", type=int, default=40, help="Số topics")
+    parser.add_argument("--sections", type=int, default=10, help="Số sections mỗi topic")
+    parser.add_argument("--tags", type=int, default=8, help="Số tags mỗi topic")
+    parser.add_argument(
+        "--strategy", default="selectin", choices=sorted(LOADING_STRATEGIES),
+        help="Strategy được kiểm tra với budget",
+    )
+    args = parser.parse_args()
+
+    seed(args.topics, args.sections, args.tags)
+    measured = {name: measure(name, args.sections) for name in LOADING_STRATEGIES}
+
+    names = list(LOADING_STRATEGIES)
+    print(f"{args.topics} topics x {args.sections} sections x {args.tags} tags, page size {PAGE}")
+    print(f"{'method':<16}" + "".join(f"{name + ' q/rows':>18}" for name in names) + f"{'budget':>14}")
+    over_budget = []
+    for method, (max_queries, max_rows) in BUDGETS.items():
+        cells = "".join(
+            f"{measured[name][method][0]:>10}/{measured[name][method][1]:<7}" for name in names
+        )
+        print(f"{method:<16}{cells}{max_queries:>7}/{max_rows:<6}")
+        queries, rows = measured[args.strategy][method]
+        if queries > max_queries or rows > max_rows:
+            over_budget.append(f"{method}: {queries} queries / {rows} rows")
+
+    if over_budget:
+        print(f"\n{args.strategy} vượt budget:")
+        for line in over_budget:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\n{args.strategy}: mọi method trong budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Micro-benchmark chấm điểm search: calculate_relevance_score kiểu cũ vs CompiledQuery.score.
+
+- legacy: bản sao của calculate_relevance_score trước đây (chuẩn hóa lại text + query,
+  chạy lại extract_keywords và dựng lại tập stop words cho mỗi field)
+- compiled: CompiledQuery.compile(query) một lần, score(text_norm) trên text đã bỏ dấu sẵn
+
+Corpus lấy từ mock-db (title, short_definition, heading, content), nhân lên --repeat lần.
+Hai cách cho điểm giống hệt nhau được kiểm tra trong tests/test_search_query.py.
+
+Chạy từ thư mục gốc của repo:
+    python benchmarks/search_scoring.py --repeat 20
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "mock-db"))
+
+from app.application.services.search_query import CompiledQuery  # noqa: E402
+from app.core.text_utils import remove_vietnamese_tones  # noqa: E402
+
+QUERIES = [
+    "oop", "ke thua", "Kế thừa", "class object", "Làm sao để hiểu OOP", "là gì",
+    "a", "python", "đa hình", "vong lap", "x", "zzzq", "Lớp", "stack queue",
+    "bien kieu du lieu", "đối tượng", "interface abstract", "linked list",
+]
+
+
+def legacy_extract_keywords(query: str) -> list:
+    stop_words = {
+        'là', 'của', 'và', 'có', 'được', 'trong', 'để', 'một', 'các',
+        'này', 'cho', 'từ', 'với', 'những', 'thì', 'về', 'làm', 'sao',
+        'như', 'nào', 'thế', 'gì', 'ai', 'đâu', 'khi', 'bao', 'giờ',
+        'hiểu', 'học', 'tìm', 'biết', 'muốn', 'cần', 'the', 'a', 'an',
+        'to', 'of', 'in', 'on', 'at', 'for', 'is', 'are', 'was', 'were'
+    }
+    normalized = remove_vietnamese_tones(query)
+    keywords = [w for w in normalized.split() if w not in stop_words and len(w) >= 2]
+    if not keywords:
+        keywords = [normalized]
+    return keywords
+
+
+def legacy_score(text: str, query: str) -> float:
+    if not text or not query:
+        return 0.0
+    text_normalized = remove_vietnamese_tones(text)
+    query_normalized = remove_vietnamese_tones(query)
+    if text_normalized == query_normalized:
+        return 1.0
+    if text_normalized.startswith(query_normalized):
+        return 0.9
+    if query_normalized in text_normalized:
+        return 0.7
+    keywords = legacy_extract_keywords(query)
+    text_words = set(text_normalized.split())
+    for keyword in keywords:
+        if keyword in text_normalized:
+            text_words_list = text_normalized.split()
+            if keyword in text_words_list:
+                return 0.95
+            return 0.85
+        for word in text_words:
+            if keyword in word or word in keyword:
+                return 0.65
+    query_words = set(query_normalized.split())
+    if query_words.issubset(text_words):
+        return 0.6
+    matching_words = text_words.intersection(query_words)
+    if matching_words:
+        return 0.5 * (len(matching_words) / len(query_words))
+    query_index = 0
+    for char in text_normalized:
+        if query_index < len(query_normalized) and char == query_normalized[query_index]:
+            query_index += 1
+    if query_index == len(query_normalized):
+        return 0.3
+    return 0.0
+
+
+def load_corpus() -> list:
+    import Base_Docs
+    import DSA_Docs
+    import OOP_Docs
+
+    texts = []
+    for data in (Base_Docs.basics_data, DSA_Docs.dsa_data, OOP_Docs.oop_data):
+        texts.append(data["category"]["name"])
+        for topic in data["topics"]:
+            texts.extend([topic["title"], topic["short_definition"]])
+            for section in topic["sections"]:
+                texts.extend([section["heading"], section["content"]])
+    return texts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=20, help="Số lần nhân corpus")
+    args = parser.parse_args()
+
+    texts = load_corpus() * args.repeat
+    normalized_texts = [remove_vietnamese_tones(text) for text in texts]
+    print(f"corpus: {len(texts)} fields x {len(QUERIES)} queries")
+
+    started = time.perf_counter()
+    for query in QUERIES:
+        for text in texts:
+            legacy_score(text, query)
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for query in QUERIES:
+        score = CompiledQuery.compile(query).score
+        for text_norm in normalized_texts:
+            score(text_norm)
+    compiled_elapsed = time.perf_counter() - started
+
+    print(f"legacy   {legacy_elapsed * 1000:>9.1f} ms")
+    print(f"compiled {compiled_elapsed * 1000:>9.1f} ms  ({legacy_elapsed / compiled_elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark trang GET /topics không lọc category: đường cũ vs đường danh sách lightweight.
+
+- full: TopicRepository.get_all (load sections) -> TopicResponse -> TopicListItem
+  (response_model của endpoint bỏ sections đi)
+- list: TopicRepository.get_list (chỉ cột của topic + tags) -> TopicListItem
+
+Đo thời gian và peak memory (tracemalloc) của việc build body JSON cho --page topics
+trên một database SQLite tạm (mặc định 500 topics x 20 sections x 5 tags).
+
+Chạy từ thư mục gốc của repo:
+    python benchmarks/topic_list.py --topics 500 --sections 20 --page 500
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix="topic_list_"), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+from app.application.services.topic_service import _validate_topics  # noqa: E402
+from app.core.json_response import encode_model  # noqa: E402
+from app.domain.models import Category, Section, Tag, Topic, topic_tags  # noqa: E402
+from app.domain.schemas.topic_schema import TopicListItem, TopicResponse  # noqa: E402
+from app.infrastructure.database import Base, SessionLocal, engine  # noqa: E402
+from app.infrastructure.repositories.topic_repository import TopicRepository  # noqa: E402
+
+
+def seed(n_topics: int, n_sections: int, n_tags: int, content_size: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    content = ("class object inheritance polymorphism đối tượng kế thừa đa hình " * (content_size // 60 + 1))[:content_size]
+    with engine.begin() as conn:
+        conn.execute(Category.__table__.insert(), [{"id": 1, "name": "OOP", "slug": "oop"}])
+        conn.execute(
+            Tag.__table__.insert(),
+            [{"id": i, "name": f"Tag {i}", "slug": f"tag-{i}"} for i in range(1, n_tags + 1)],
+        )
+        conn.execute(
+            Topic.__table__.insert(),
+            [
+                {"id": i, "title": f"Topic {i}", "short_definition": f"Định nghĩa {i}", "category_id": 1}
+                for i in range(1, n_topics + 1)
+            ],
+        )
+        conn.execute(
+            topic_tags.insert(),
+            [
+                {"topic_id": i, "tag_id": j}
+                for i in range(1, n_topics + 1)
+                for j in range(1, n_tags + 1)
+            ],
+        )
+        conn.execute(
+            Section.__table__.insert(),
+            [
+                {
+                    "topic_id": i,
+                    "heading": f"Section {j}",
+                    "content": content,
+                    "order_index": j,
+                    "code_snippet": "class Animal:\n    pass\n" * 10,
+                    "language": "python",
+                }
+                for i in range(1, n_topics + 1)
+                for j in range(n_sections)
+            ],
+        )
+
+
+def full_path(page: int) -> bytes:
+    db = SessionLocal()
+    try:
+        topics: List[TopicResponse] = _validate_topics(TopicRepository(db).get_all(0, page), TopicResponse)
+        return encode_model(List[TopicListItem], topics)
+    finally:
+        db.close()
+
+
+def list_path(page: int) -> bytes:
+    db = SessionLocal()
+    try:
+        topics = _validate_topics(TopicRepository(db).get_list(0, page), TopicListItem)
+        return encode_model(List[TopicListItem], topics)
+    finally:
+        db.close()
+
+
+def measure(label: str, fn, page: int, repeat: int) -> bytes:
+    fn(page)  # warm-up
+    gc.collect()
+    tracemalloc.start()
+    body = fn(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(page)
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{label:<6} time={elapsed * 1000:>8.1f} ms  peak={peak / 2**20:>7.1f} MiB  body={len(body) / 1024:>7.1f} KiB")
+    return body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--topics", type=int, default=500, help="Số topics")
+    parser.add_argument("--sections", type=int, default=20, help="Số sections mỗi topic")
+    parser.add_argument("--tags", type=int, default=5, help="Số tags mỗi topic")
+    parser.add_argument("--content-size", type=int, default=2000, help="Độ dài content mỗi section")
+    parser.add_argument("--page", type=int, default=500, help="Số topics mỗi trang")
+    parser.add_argument("--repeat", type=int, default=5, help="Số lần đo thời gian")
+    args = parser.parse_args()
+
+    seed(args.topics, args.sections, args.tags, args.content_size)
+    print(f"{args.topics} topics x {args.sections} sections x {args.tags} tags, page {args.page}")
+    full_body = measure("full", full_path, args.page, args.repeat)
+    list_body = measure("list", list_path, args.page, args.repeat)
+    print(f"same body: {full_body == list_body}")
+
+
+if __name__ == "__main__":
+    main()
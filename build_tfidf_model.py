@@ -0,0 +1,20 @@
+"""
+Build TF-IDF model cho related topics và lưu ra TFIDF_MODEL_DIR.
+Chạy sau khi seed/import dữ liệu: python build_tfidf_model.py
+"""
+from app.application.services.related_topic_service import RelatedTopicService
+from app.application.services.tfidf_model import tfidf_model_store
+from app.infrastructure.database import SessionLocal
+from app.infrastructure.repositories.topic_repository import TopicRepository
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        topics = TopicRepository(db).get_all_with_minimal_data()
+        model = RelatedTopicService().build_tfidf_model(topics)
+        print(
+            f"TF-IDF model: {model.matrix.shape[0]} topics x {model.matrix.shape[1]} features "
+            f"-> {tfidf_model_store.directory}"
+        )
+    finally:
+        db.close()
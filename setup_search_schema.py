@@ -0,0 +1,13 @@
+"""
+Cài schema full-text search cho SEARCH_BACKEND=postgres (extensions unaccent/pg_trgm,
+cột search_vector, GIN indexes). Chạy một lần trước khi deploy:
+python setup_search_schema.py
+"""
+from app.infrastructure.database import engine
+from app.infrastructure.search import install_search_schema
+
+if __name__ == "__main__":
+    if engine.dialect.name != "postgresql":
+        raise SystemExit(f"Full-text search schema needs PostgreSQL (got {engine.dialect.name})")
+    install_search_schema(engine)
+    print("Full-text search schema installed")
@@ -0,0 +1,32 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Chạy được bằng `pytest` từ thư mục gốc của repo mà không cần cài package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Settings bắt buộc có DATABASE_URL khi import app; test cần database dùng fixture db_session
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='oop-hub-test-'), 'test.db')}"
+)
+
+
+@pytest.fixture
+def db_session(tmp_path):
+    """Session trên database SQLite riêng cho mỗi test, đã tạo đủ các bảng"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.domain import models  # noqa: F401  (đăng ký các bảng vào Base.metadata)
+    from app.infrastructure.database import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
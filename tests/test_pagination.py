@@ -0,0 +1,83 @@
+"""
+Keyset (cursor) pagination: encode/decode cursor, build_page và duyệt hết các trang
+tags qua TagService trên SQLite
+"""
+import pytest
+
+from app.application.services.tag_service import TagService
+from app.core.constants import MAX_CURSOR_LIMIT
+from app.core.exceptions import InvalidCursorException
+from app.core.pagination import build_page, clamp_page_size, decode_cursor, encode_cursor
+from app.domain.models import Tag
+from app.infrastructure.repositories.tag_repository import TagRepository
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor((42, 7))
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == (42, 7)
+
+
+def test_empty_cursor_is_first_page():
+    assert decode_cursor(None, 1) is None
+    assert decode_cursor("", 1) is None
+
+
+@pytest.mark.parametrize("cursor", [
+    "không-phải-base64",
+    encode_cursor((1, 2)),  # sai số phần tử
+    "eyJhIjoxfQ",  # {"a":1}
+    "WyIxIl0",  # ["1"]
+    "W3RydWVd",  # [true]
+])
+def test_invalid_cursor_raises(cursor):
+    with pytest.raises(InvalidCursorException) as error:
+        decode_cursor(cursor, 1)
+
+    assert error.value.status_code == 400
+
+
+def test_clamp_page_size():
+    assert clamp_page_size(0) == 1
+    assert clamp_page_size(25) == 25
+    assert clamp_page_size(MAX_CURSOR_LIMIT + 1) == MAX_CURSOR_LIMIT
+
+
+def test_build_page_uses_extra_row_only_as_marker():
+    assert build_page([1, 2], 2, key=lambda row: (row,)) == ([1, 2], None)
+
+    items, cursor = build_page([1, 2, 3], 2, key=lambda row: (row,))
+
+    assert items == [1, 2]
+    assert decode_cursor(cursor, 1) == (2,)
+
+
+@pytest.fixture
+def tag_service(db_session):
+    db_session.add_all([Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(7)])
+    db_session.commit()
+    return TagService(TagRepository(db_session))
+
+
+def test_pages_cover_every_tag_once(tag_service, db_session):
+    ids, cursor = [], None
+    while True:
+        page, cursor = tag_service.get_tags_page(cursor, 3)
+        assert len(page) <= 3
+        ids.extend(tag.id for tag in page)
+        if cursor is None:
+            break
+
+    assert ids == sorted(tag.id for tag in db_session.query(Tag))
+
+
+def test_next_page_is_stable_after_delete(tag_service, db_session):
+    first, cursor = tag_service.get_tags_page(None, 3)
+
+    # Xóa một tag đã đọc: trang sau vẫn bắt đầu ngay sau tag cuối của trang trước
+    db_session.query(Tag).filter(Tag.id == first[0].id).delete()
+    db_session.commit()
+    second, _ = tag_service.get_tags_page(cursor, 3)
+
+    assert [tag.id for tag in second] == [first[-1].id + 1, first[-1].id + 2, first[-1].id + 3]
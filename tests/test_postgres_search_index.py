@@ -0,0 +1,152 @@
+"""
+PostgresSearchIndex: tsquery, ngưỡng quét toàn bảng (session ghi lại các statement)
+và candidates trên PostgreSQL thật khi có TEST_POSTGRES_URL
+"""
+import os
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.services.search_query import CompiledQuery
+from app.infrastructure.search.postgres_search_index import (
+    MAX_TSQUERY_TERMS,
+    PostgresSearchIndex,
+)
+
+
+class _Result:
+    def __init__(self, value=None, rows=()):
+        self._value = value
+        self._rows = list(rows)
+
+    def scalar(self):
+        return self._value
+
+    def scalars(self):
+        return iter(self._rows)
+
+
+class _RecordingSession:
+    """Trả về reltuples / COUNT(*) / các IDs khớp đã định sẵn, ghi lại statement"""
+
+    def __init__(self, estimate, matching_ids, count=0):
+        self.estimate = estimate
+        self.matching_ids = list(matching_ids)
+        self.count = count
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(statement)
+        if params is not None:
+            return _Result(value=self.estimate)
+        return _Result(rows=self.matching_ids[: statement._limit])
+
+    def scalar(self, statement):
+        self.statements.append(statement)
+        return self.count
+
+
+def _candidates(db, entity_type, query):
+    compiled = CompiledQuery.compile(query)
+    return PostgresSearchIndex(db).candidates(
+        entity_type, compiled.normalized, list(compiled.keywords), compiled.words
+    )
+
+
+def test_tsquery_has_words_prefixes_and_substrings():
+    index = PostgresSearchIndex(None)
+
+    terms = set(index._build_tsquery(["class"], ["class"]).split(" | "))
+
+    assert {"class", "class:*", "cla", "las", "ass", "clas", "lass"} <= terms
+    assert not any(len(term) < 3 for term in terms)
+
+
+def test_tsquery_over_term_limit_is_none():
+    index = PostgresSearchIndex(None)
+    longest = "abcdefghijklmnopqrstuvwx"
+
+    # Một keyword 24 ký tự vẫn nằm trong giới hạn, hai keyword dài thì không
+    assert len(index._build_tsquery([longest], []).split(" | ")) <= MAX_TSQUERY_TERMS
+    assert index._build_tsquery([longest, "zyxwvutsrqponmlkjihgfedc"], []) is None
+
+
+def test_too_many_terms_skips_the_query():
+    db = _RecordingSession(estimate=1000, matching_ids=[1])
+
+    assert _candidates(db, "topic", "abcdefghijklmnopqrstuvwx zyxwvutsrqponmlkjihgfedc") is None
+    assert db.statements == []
+
+
+def test_candidates_below_cutoff_are_returned():
+    db = _RecordingSession(estimate=100, matching_ids=[3, 1, 2])
+
+    assert _candidates(db, "topic", "ke thua") == {1, 2, 3}
+    # Chỉ lấy tối đa cutoff + 1 IDs
+    assert db.statements[-1]._limit == 51
+
+
+def test_candidates_above_cutoff_fall_back_to_full_scan():
+    db = _RecordingSession(estimate=10, matching_ids=range(1, 11))
+
+    assert _candidates(db, "section", "a b") is None
+    assert db.statements[-1]._limit == 6
+
+
+def test_table_without_statistics_uses_count():
+    db = _RecordingSession(estimate=-1, matching_ids=[7], count=40)
+
+    assert _candidates(db, "topic", "oop") == {7}
+    assert db.statements[-1]._limit == 21
+
+
+def test_candidate_statement_compiles_for_postgresql():
+    db = _RecordingSession(estimate=100, matching_ids=[])
+    _candidates(db, "topic", "Kế thừa")
+
+    sql = str(db.statements[-1].compile(dialect=postgresql.dialect()))
+
+    assert "search_normalize(topics.title) LIKE" in sql
+    assert "search_vector @@ to_tsquery" in sql
+    assert "<%" in sql
+    assert "LIMIT" in sql
+
+
+@pytest.fixture
+def postgres_session():
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL chưa được đặt")
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.infrastructure.database import Base
+    from app.infrastructure.search.postgres_search_index import install_search_schema
+
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    install_search_schema(engine)
+    session = Session(engine)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def test_candidates_on_postgresql(postgres_session):
+    from app.domain.models import Category, Topic
+
+    category = Category(name="OOP", slug="oop")
+    postgres_session.add(category)
+    postgres_session.flush()
+    titles = ["Tính Kế thừa", "Đa hình", "Đóng gói"] + [f"Chủ đề {i}" for i in range(20)]
+    topics = [Topic(title=title, short_definition="", category_id=category.id) for title in titles]
+    postgres_session.add_all(topics)
+    postgres_session.commit()
+
+    assert _candidates(postgres_session, "topic", "ke thua") == {topics[0].id}
+    # "chu de" khớp phần lớn bảng: quét toàn bảng
+    assert _candidates(postgres_session, "topic", "chu de") is None
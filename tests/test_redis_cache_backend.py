@@ -0,0 +1,63 @@
+"""Response cache trên RedisCacheBackend, chạy với fake Redis (fakeredis)"""
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.infrastructure.cache import RedisCacheBackend, ResponseCache  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def backend(server):
+    return RedisCacheBackend(fakeredis.FakeRedis(server=server))
+
+
+def test_invalidate_tags_removes_only_dependent_entries(backend):
+    backend.set("topic_detail:1", b"one", ["topic:1", "tag:7"], ttl=60)
+    backend.set("topic_detail:2", b"two", ["topic:2"], ttl=60)
+    backend.set("tags:all", b"tags", ["tags", "tag:7"], ttl=60)
+
+    assert backend.invalidate_tags(["tag:7"]) == 2
+
+    assert backend.get("topic_detail:1") is None
+    assert backend.get("tags:all") is None
+    assert backend.get("topic_detail:2") == b"two"
+    assert not backend.client.exists(backend._tag_key("tag:7"))
+
+
+def test_invalidation_is_shared_between_app_instances(server):
+    writer = RedisCacheBackend(fakeredis.FakeRedis(server=server))
+    reader = RedisCacheBackend(fakeredis.FakeRedis(server=server))
+
+    writer.set("categories:all", b"[]", ["categories"], ttl=60)
+    assert reader.get("categories:all") == b"[]"
+
+    reader.invalidate_tags(["categories"])
+    assert writer.get("categories:all") is None
+
+
+def test_response_cache_hit_then_miss_after_invalidate(backend):
+    cache = ResponseCache(backend, ttl=60)
+
+    assert cache.get("topic_detail:1") is None
+    cache.store_body("topic_detail:1", b'{"id":1}', ["topic:1"])
+    hit = cache.get("topic_detail:1")
+    assert hit is not None and hit.body == b'{"id":1}'
+
+    cache.invalidate("topic:1")
+    assert cache.get("topic_detail:1") is None
+
+
+def test_response_cache_skips_body_read_before_invalidate(backend):
+    cache = ResponseCache(backend, ttl=60)
+
+    assert cache.get("topic_detail:1") is None
+    # Một lần ghi xảy ra trong lúc endpoint đang đọc database
+    cache.invalidate("topic:1")
+    cache.store_body("topic_detail:1", b'{"title":"old"}', ["topic:1"])
+
+    assert cache.get("topic_detail:1") is None
@@ -0,0 +1,89 @@
+"""
+HeuristicFeatures (vectorized) cho cùng điểm và cùng thứ tự với cách tính từng cặp
+bằng _calculate_heuristic_score / _find_related_topics_loop
+"""
+import random
+
+import numpy as np
+import pytest
+
+from app.application.services import related_topic_service as related_topic_module
+from app.application.services.related_topic_service import HeuristicFeatures, RelatedTopicService
+from app.application.services.tfidf_model import TfidfModelStore
+from app.domain.projections import TopicRecord
+
+TITLE_WORDS = [
+    "lớp", "đối", "tượng", "kế", "thừa", "đa", "hình", "class", "object",
+    "stack", "queue", "the", "và", "của", "python",
+]
+DEFINITION_WORDS = ["cấu", "trúc", "dữ", "liệu", "hàm", "biến", "kiểu", "vòng", "lặp"]
+
+
+def _corpus(seed: int = 7, size: int = 40):
+    """
+    Topics ngẫu nhiên có: từ khóa title dùng chung (kể cả stop words), 3 categories,
+    definition None / rỗng / cùng độ dài, và các bản sao giống hệt (điểm bằng nhau)
+    """
+    rng = random.Random(seed)
+    topics = []
+    while len(topics) < size:
+        title = " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(1, 4)))
+        definition = rng.choice([
+            None,
+            "",
+            " ".join(rng.choice(DEFINITION_WORDS) for _ in range(rng.randint(1, 6))),
+        ])
+        category_id = rng.randint(1, 3)
+        for _ in range(rng.choice([1, 1, 2, 3])):
+            topics.append(TopicRecord(len(topics) + 1, title, definition, category_id))
+    return topics
+
+
+@pytest.fixture
+def topics():
+    return _corpus()
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    # Model TF-IDF riêng cho test, lưu vào thư mục tạm
+    monkeypatch.setattr(related_topic_module, "tfidf_model_store", TfidfModelStore(str(tmp_path)))
+    return RelatedTopicService()
+
+
+def test_scores_for_source_match_pairwise_loop(topics, service):
+    features = HeuristicFeatures(topics)
+
+    for source_index, source in enumerate(topics):
+        expected = [service._calculate_heuristic_score(source, candidate) for candidate in topics]
+        np.testing.assert_allclose(
+            features.scores_for_source(source_index), expected, rtol=0, atol=1e-12
+        )
+
+
+def test_scores_as_candidate_match_pairwise_loop(topics, service):
+    features = HeuristicFeatures(topics)
+
+    for candidate_index, candidate in enumerate(topics):
+        expected = [service._calculate_heuristic_score(source, candidate) for source in topics]
+        np.testing.assert_allclose(
+            features.scores_as_candidate(candidate_index), expected, rtol=0, atol=1e-12
+        )
+
+
+def test_related_topics_order_matches_loop(topics, service):
+    ties = 0
+    for source in topics:
+        vectorized = service.find_related_topics(source, topics, top_n=len(topics))
+        looped = service._find_related_topics_loop(source, topics, len(topics))
+
+        # Cùng thứ tự, kể cả giữa các topics bằng điểm (giữ thứ tự của all_topics)
+        assert [topic.id for topic, _ in vectorized] == [topic.id for topic, _ in looped]
+        np.testing.assert_allclose(
+            [score for _, score in vectorized], [score for _, score in looped], rtol=0, atol=1e-12
+        )
+        scores = [score for _, score in vectorized]
+        ties += sum(a == b for a, b in zip(scores, scores[1:]))
+
+    # Corpus phải thực sự có các cặp bằng điểm thì phép so thứ tự mới có ý nghĩa
+    assert ties > 0
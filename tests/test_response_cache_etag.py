@@ -0,0 +1,94 @@
+"""
+ETag của response cache: 200 kèm ETag, 304 không body khi If-None-Match khớp
+(kể cả weak ETag, danh sách và "*"), 200 đầy đủ khi không khớp
+"""
+import pytest
+from starlette.requests import Request
+
+from app.infrastructure.cache.memory_cache import InMemoryCacheBackend
+from app.infrastructure.cache.response_cache import CachedBody, ResponseCache
+
+BODY = b'{"id":1,"title":"K\\u1ebf th\\u1eeba"}'
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode("latin-1")))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(InMemoryCacheBackend(16), ttl=60)
+
+
+def test_etag_is_strong_and_depends_on_body():
+    etag = CachedBody.build(BODY).etag
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert CachedBody.build(BODY).etag == etag
+    assert CachedBody.build(BODY + b" ").etag != etag
+
+
+def test_encode_decode_round_trip():
+    cached = CachedBody.build(BODY)
+
+    assert CachedBody.decode(cached.encode()) == cached
+
+
+def test_store_returns_body_with_etag(cache):
+    assert cache.get("topic:1") is None
+    response = cache.store_body("topic:1", BODY, ["topic:1"], _request())
+
+    assert response.status_code == 200
+    assert response.body == BODY
+    assert response.headers["etag"] == CachedBody.build(BODY).etag
+    assert response.headers["cache-control"] == "no-cache"
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"khac", {etag}',
+    "*",
+])
+def test_matching_if_none_match_is_304(cache, if_none_match):
+    etag = CachedBody.build(BODY).etag
+    cache.get("topic:1")
+    cache.store_body("topic:1", BODY, ["topic:1"])
+
+    response = cache.get("topic:1", _request(if_none_match.format(etag=etag)))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+def test_stale_etag_gets_full_body(cache):
+    cache.get("topic:1")
+    cache.store_body("topic:1", BODY, ["topic:1"])
+
+    response = cache.get("topic:1", _request('"etag-cu"'))
+
+    assert response.status_code == 200
+    assert response.body == BODY
+
+
+def test_miss_path_also_answers_304(cache):
+    # Entry vừa bị invalidate: endpoint build lại body giống hệt, client vẫn nhận 304
+    etag = CachedBody.build(BODY).etag
+    cache.get("topic:1")
+
+    response = cache.store_body("topic:1", BODY, ["topic:1"], _request(etag))
+
+    assert response.status_code == 304
+
+
+def test_invalidate_drops_entry(cache):
+    cache.get("topic:1")
+    cache.store_body("topic:1", BODY, ["topic:1"])
+
+    cache.invalidate("topic:1")
+
+    assert cache.get("topic:1", _request(CachedBody.build(BODY).etag)) is None
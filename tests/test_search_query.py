@@ -0,0 +1,116 @@
+"""
+CompiledQuery.score cho điểm giống hệt calculate_relevance_score kiểu cũ (bản sao
+legacy_score bên dưới) trên corpus mock-db và các text biên
+"""
+import os
+import sys
+
+import pytest
+
+from app.application.services.search_query import CompiledQuery
+from app.core.text_utils import remove_vietnamese_tones
+
+MOCK_DB = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mock-db")
+
+QUERIES = [
+    "oop", "ke thua", "Kế thừa", "class object", "Làm sao để hiểu OOP", "là gì",
+    "a", "python", "đa hình", "vong lap", "x", "zzzq", "Lớp", "stack queue",
+    "bien kieu du lieu", "đối tượng", "interface abstract", "linked list",
+]
+
+# Các nhánh khó của legacy_score: khớp tuyệt đối, prefix, subsequence, chỉ có stop words
+EDGE_TEXTS = [
+    "", "OOP", "oop là gì", "Kế thừa", "Tính kế thừa trong OOP", "kethua", "x",
+    "the a an", "Lớp (Class) và Đối tượng", "ĐA HÌNH", "stack", "queue stack",
+]
+
+
+def legacy_extract_keywords(query: str) -> list:
+    stop_words = {
+        'là', 'của', 'và', 'có', 'được', 'trong', 'để', 'một', 'các',
+        'này', 'cho', 'từ', 'với', 'những', 'thì', 'về', 'làm', 'sao',
+        'như', 'nào', 'thế', 'gì', 'ai', 'đâu', 'khi', 'bao', 'giờ',
+        'hiểu', 'học', 'tìm', 'biết', 'muốn', 'cần', 'the', 'a', 'an',
+        'to', 'of', 'in', 'on', 'at', 'for', 'is', 'are', 'was', 'were'
+    }
+    normalized = remove_vietnamese_tones(query)
+    keywords = [w for w in normalized.split() if w not in stop_words and len(w) >= 2]
+    if not keywords:
+        keywords = [normalized]
+    return keywords
+
+
+def legacy_score(text: str, query: str) -> float:
+    if not text or not query:
+        return 0.0
+    text_normalized = remove_vietnamese_tones(text)
+    query_normalized = remove_vietnamese_tones(query)
+    if text_normalized == query_normalized:
+        return 1.0
+    if text_normalized.startswith(query_normalized):
+        return 0.9
+    if query_normalized in text_normalized:
+        return 0.7
+    keywords = legacy_extract_keywords(query)
+    text_words = set(text_normalized.split())
+    for keyword in keywords:
+        if keyword in text_normalized:
+            text_words_list = text_normalized.split()
+            if keyword in text_words_list:
+                return 0.95
+            return 0.85
+        for word in text_words:
+            if keyword in word or word in keyword:
+                return 0.65
+    query_words = set(query_normalized.split())
+    if query_words.issubset(text_words):
+        return 0.6
+    matching_words = text_words.intersection(query_words)
+    if matching_words:
+        return 0.5 * (len(matching_words) / len(query_words))
+    query_index = 0
+    for char in text_normalized:
+        if query_index < len(query_normalized) and char == query_normalized[query_index]:
+            query_index += 1
+    if query_index == len(query_normalized):
+        return 0.3
+    return 0.0
+
+
+@pytest.fixture(scope="module")
+def texts(request):
+    """Category name, title, short_definition, heading và content trong mock-db"""
+    sys.path.insert(0, MOCK_DB)
+    request.addfinalizer(lambda: sys.path.remove(MOCK_DB))
+    import Base_Docs
+    import DSA_Docs
+    import OOP_Docs
+
+    texts = list(EDGE_TEXTS)
+    for data in (Base_Docs.basics_data, DSA_Docs.dsa_data, OOP_Docs.oop_data):
+        texts.append(data["category"]["name"])
+        for topic in data["topics"]:
+            texts.extend([topic["title"], topic["short_definition"]])
+            for section in topic["sections"]:
+                texts.extend([section["heading"], section["content"]])
+    return texts
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_compiled_score_matches_legacy(texts, query):
+    compiled = CompiledQuery.compile(query)
+
+    mismatches = [
+        text for text in texts
+        if compiled.score(remove_vietnamese_tones(text)) != legacy_score(text, query)
+    ]
+
+    assert mismatches == []
+
+
+def test_corpus_covers_score_branches(texts):
+    # Phép so sánh chỉ có ý nghĩa khi corpus chạm tới các mức điểm của legacy_score
+    # (0.6 không đạt được: mọi từ của query có trong text đã cho 0.65 hoặc 0.95 trước đó)
+    scores = {legacy_score(text, query) for text in texts for query in QUERIES}
+
+    assert {0.0, 0.3, 0.65, 0.7, 0.85, 0.9, 0.95, 1.0} <= scores
@@ -0,0 +1,128 @@
+"""
+SuggestionIndex: gợi ý theo prefix của label và của từng từ, thứ tự theo loại, limit,
+upsert/remove sau khi build và build lại khi instance khác ghi nội dung
+"""
+import pytest
+
+from app.application.services.suggestion_index import Suggestion, SuggestionIndex
+from app.core import content_version
+from app.domain.models import Category, Tag, Topic
+
+
+@pytest.fixture
+def db(db_session):
+    category = Category(name="Lớp", slug="lop")
+    db_session.add_all([category, Tag(name="Lớp", slug="lop"), Tag(name="Kế thừa bội", slug="ke-thua-boi")])
+    db_session.flush()
+    db_session.add_all([
+        Topic(title=title, short_definition="...", category_id=category.id)
+        for title in ["Lớp", "Kế thừa", "Tính kế thừa", "Đa hình", "Lớp trừu tượng"]
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.fixture
+def index(db):
+    index = SuggestionIndex()
+    index.ensure_loaded(db)
+    return index
+
+
+def _labels(suggestions):
+    return [(suggestion.kind, suggestion.label) for suggestion in suggestions]
+
+
+def test_label_prefix_before_inner_word(index):
+    # "Kế thừa" khớp từ đầu label, "Tính kế thừa" khớp từ thứ hai
+    assert _labels(index.suggest("KE THUA")) == [
+        ("topic", "Kế thừa"),
+        ("tag", "Kế thừa bội"),
+        ("topic", "Tính kế thừa"),
+    ]
+
+
+def test_inner_word_match(index):
+    assert _labels(index.suggest("thua")) == [
+        ("topic", "Kế thừa"),
+        ("topic", "Tính kế thừa"),
+        ("tag", "Kế thừa bội"),
+    ]
+
+
+def test_same_key_ordered_by_kind_then_limit(index):
+    assert _labels(index.suggest("lop")) == [
+        ("topic", "Lớp"),
+        ("category", "Lớp"),
+        ("tag", "Lớp"),
+        ("topic", "Lớp trừu tượng"),
+    ]
+    assert _labels(index.suggest("lop", limit=2)) == [("topic", "Lớp"), ("category", "Lớp")]
+
+
+def test_blank_or_unknown_prefix(index):
+    assert index.suggest("   ") == []
+    assert index.suggest("zzz") == []
+
+
+def test_upsert_and_remove_without_rebuild(index, db):
+    topic = db.query(Topic).filter(Topic.title == "Đa hình").one()
+
+    index.upsert("topic", topic.id, "Đa hình Polymorphism")
+    assert index.suggest("poly") == [Suggestion("topic", topic.id, "Đa hình Polymorphism")]
+    assert _labels(index.suggest("da hinh")) == [("topic", "Đa hình Polymorphism")]
+
+    index.remove("topic", topic.id)
+    assert index.suggest("poly") == []
+    assert index.suggest("da hinh") == []
+    assert index.is_loaded
+
+
+def test_upsert_before_build_is_ignored(db):
+    index = SuggestionIndex()
+    index.upsert("topic", 999, "Không có trong database")
+
+    index.ensure_loaded(db)
+
+    assert index.suggest("khong co") == []
+    assert _labels(index.suggest("da")) == [("topic", "Đa hình")]
+
+
+def test_invalidate_rebuilds_from_database(index, db):
+    db.add(Tag(name="Đóng gói", slug="dong-goi"))
+    db.commit()
+    assert index.suggest("dong") == []
+
+    index.invalidate()
+    index.ensure_loaded(db)
+
+    assert _labels(index.suggest("dong")) == [("tag", "Đóng gói")]
+
+
+@pytest.fixture
+def content_stamp():
+    """Content stamp giả, đọc lại mỗi lần refresh"""
+    stamp = [0]
+    content_version.configure_content_stamp(lambda: stamp[0], 0)
+    content_version.refresh_content_version()
+    yield stamp
+    content_version.configure_content_stamp(None, 1)
+
+
+def test_write_from_other_instance_triggers_rebuild(content_stamp, db):
+    index = SuggestionIndex()
+    index.ensure_loaded(db)
+    own_write = content_version.bump_content_version()
+
+    # Lần ghi của chính process không làm index phải build lại
+    assert own_write == content_version.get_content_version()
+    assert index.is_loaded
+
+    db.add(Tag(name="Đóng gói", slug="dong-goi"))
+    db.commit()
+    content_stamp[0] += 1
+    content_version.refresh_content_version()
+
+    assert not index.is_loaded
+    index.ensure_loaded(db)
+    assert _labels(index.suggest("dong")) == [("tag", "Đóng gói")]
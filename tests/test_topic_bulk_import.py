@@ -0,0 +1,94 @@
+"""
+Bulk import topics (TopicService.bulk_create_topics trên SQLite): validate cả batch
+trước khi ghi, batch lỗi không tạo topic nào
+"""
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.application.services.topic_service import TopicService
+from app.domain.models import Category, Section, Tag, Topic
+from app.domain.schemas.topic_schema import TopicBulkCreate
+from app.infrastructure.repositories.topic_repository import TopicRepository
+
+
+class _RecordingChanges:
+    """Chỉ ghi lại lần gọi topics_imported"""
+
+    def __init__(self):
+        self.imported = []
+
+    def topics_imported(self, topic_ids, category_ids, tag_ids):
+        self.imported.append((list(topic_ids), set(category_ids), set(tag_ids)))
+
+
+def _item(title, category_slug="oop", tag_slugs=(), sections=0):
+    return {
+        "title": title,
+        "short_definition": f"Định nghĩa {title}",
+        "category_slug": category_slug,
+        "tag_slugs": list(tag_slugs),
+        "sections": [
+            {"heading": f"Phần {i}", "content": "Nội dung", "order_index": i}
+            for i in range(sections)
+        ],
+    }
+
+
+@pytest.fixture
+def changes():
+    return _RecordingChanges()
+
+
+@pytest.fixture
+def service(db_session, changes):
+    category = Category(name="OOP", slug="oop")
+    db_session.add_all([category, Tag(name="Cơ bản", slug="co-ban"), Tag(name="Nâng cao", slug="nang-cao")])
+    db_session.flush()
+    db_session.add(Topic(title="Đa hình", short_definition="...", category_id=category.id))
+    db_session.commit()
+    return TopicService(TopicRepository(db_session), changes=changes)
+
+
+def _import(service, *items):
+    return service.bulk_create_topics(TopicBulkCreate(topics=list(items)))
+
+
+def test_import_creates_topics_in_request_order(service, db_session, changes):
+    result = _import(
+        service,
+        _item("Kế thừa", tag_slugs=["co-ban", "co-ban"], sections=2),
+        _item("Đóng gói", tag_slugs=["nang-cao"]),
+    )
+
+    assert result.created == 2
+    titles = [db_session.get(Topic, topic_id).title for topic_id in result.topic_ids]
+    assert titles == ["Kế thừa", "Đóng gói"]
+    assert db_session.query(Section).filter(Section.topic_id == result.topic_ids[0]).count() == 2
+    # Tag lặp trong một item chỉ tạo một liên kết
+    assert [tag.slug for tag in db_session.get(Topic, result.topic_ids[0]).tags] == ["co-ban"]
+    assert db_session.get(Topic, result.topic_ids[1]).title_norm == "dong goi"
+    assert len(changes.imported) == 1 and changes.imported[0][0] == result.topic_ids
+
+
+@pytest.mark.parametrize("items, detail", [
+    ([_item("Kế thừa"), _item("Kế thừa")], "Title bị lặp trong batch: Kế thừa"),
+    ([_item("Kế thừa"), _item("Đa hình")], "Topic với title đã tồn tại: Đa hình"),
+    ([_item("Kế thừa", category_slug="khong-co")], "Category slug không tồn tại: khong-co"),
+    ([_item("Kế thừa", tag_slugs=["co-ban", "khong-co"])], "Tag slug không tồn tại: khong-co"),
+])
+def test_invalid_batch_is_rejected_without_writes(service, db_session, changes, items, detail):
+    before = db_session.query(Topic).count()
+
+    with pytest.raises(HTTPException) as error:
+        _import(service, *items)
+
+    assert error.value.status_code == 400
+    assert error.value.detail == detail
+    assert db_session.query(Topic).count() == before
+    assert changes.imported == []
+
+
+def test_empty_batch_is_rejected_by_schema():
+    with pytest.raises(ValidationError):
+        TopicBulkCreate(topics=[])